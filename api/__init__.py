@@ -6,10 +6,11 @@ from api.timeTable import timeTable_register, timeTable_list
 from api.tokens import token_management
 from api.userInfo import manage_userinfo
 from api.search import keyword_autocomplete
-from api.admin import redis_manage
+from api.admin import redis_manage, loop_lag, cache_warmup, outbound_http, metrics, profiling, memory_debug, active_users
 from api.promotion import meta_ua_analysis
 from api.activity import user_barrierfree_activity
 from api.message import send_message, check_message
+from api.bootstrap import app_bootstrap
 
 
 # 라우터 리스트 정의
@@ -29,8 +30,16 @@ routers = [
     manage_userinfo.router,
     keyword_autocomplete.router,
     redis_manage.router,
+    loop_lag.router,
+    cache_warmup.router,
+    outbound_http.router,
+    metrics.router,
+    profiling.router,
+    memory_debug.router,
+    active_users.router,
     meta_ua_analysis.router,
     user_barrierfree_activity.router,
     send_message.router,
-    check_message.router
+    check_message.router,
+    app_bootstrap.router
 ]
\ No newline at end of file
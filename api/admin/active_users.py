@@ -0,0 +1,39 @@
+from datetime import date
+from typing import Optional
+import redis
+from fastapi import APIRouter, Depends, HTTPException
+from api.admin.admin_login import require_admin
+from data.university_info import UNIVERSITY_INFO
+from setting.active_users import count_active_users, today, ACTIVE_USER_ALL, ACTIVE_USER_SAMPLE_RATE
+from setting.redis_client import redis_breaker
+
+router = APIRouter()
+
+@router.get("/admin/active-users", tags=["Admin"], dependencies=[Depends(require_admin)])
+def get_active_users(day: Optional[date] = None, university: Optional[str] = None):
+    """
+    day(기본: 오늘) 기준 DAU/WAU/MAU 추정치를 반환합니다. (HyperLogLog, 오차 약 0.8%)
+    university 를 지정하면 해당 대학만, 생략하면 전체 합산과 대학별 값을 모두 반환합니다.
+    """
+    if university is not None and university not in UNIVERSITY_INFO:
+        raise HTTPException(status_code=404, detail="해당 대학을 찾을 수 없습니다.")
+    if not redis_breaker.allow_request():
+        raise HTTPException(status_code=503, detail="Redis 를 사용할 수 없습니다.")
+
+    day = day or today()
+    scopes = [university] if university else [ACTIVE_USER_ALL] + list(UNIVERSITY_INFO)
+    try:
+        counts = count_active_users(day, scopes)
+    except redis.RedisError as e:
+        redis_breaker.record_failure()
+        raise HTTPException(status_code=503, detail=f"Redis 조회에 실패했습니다: {str(e)}")
+    redis_breaker.record_success()
+
+    result = {"day": day.isoformat(), "sample_rate": ACTIVE_USER_SAMPLE_RATE}
+    if university:
+        result["university"] = university
+        result.update(counts[university])
+    else:
+        result["total"] = counts.pop(ACTIVE_USER_ALL)
+        result["universities"] = counts
+    return result
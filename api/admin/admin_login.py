@@ -1,24 +1,28 @@
 import datetime
+import logging
 import jwt
+from fastapi import HTTPException, Request
 from sqlalchemy.orm import Session
 from api.login.login_token_manage import JWT_ALGORITHM, JWT_SECRET_KEY, create_or_update_token
-from models import SessionLocal
+from models import SessionLocal, User
+
+logger = logging.getLogger(__name__)
 
 db: Session = SessionLocal()
 
 # 30일(초 단위)
 TOKEN_EXPIRE_SECONDS = 30 * 24 * 60 * 60  # 30일 = 30 * 24시간 * 60분 * 60초
 
-def AdminTokenManager():
-    ADMIN_UUID = "123456"
+ADMIN_UUID = "123456"
 
+def AdminTokenManager():
     # 실제 함수 호출
     access_token = create_admin_access_token(uuid=ADMIN_UUID)
     refresh_token = create_admin_refresh_token()
 
     # 토큰 출력
-    print("Admin Access Token:", access_token)
-    print("Admin Refresh Token:", refresh_token)
+    logger.info("Admin Access Token: %s", access_token)
+    logger.info("Admin Refresh Token: %s", refresh_token)
 
     # DB에 저장
     create_or_update_token(db, user_uuid=ADMIN_UUID, provider_type='KAKAO', refresh_token=refresh_token)
@@ -39,3 +43,25 @@ def create_admin_refresh_token():
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
+
+
+def is_admin_uuid(user_uuid: str) -> bool:
+    """관리자 토큰이거나 users.role 이 admin 인 사용자인지 확인"""
+    if not user_uuid:
+        return False
+    if user_uuid == ADMIN_UUID:
+        return True
+    session: Session = SessionLocal()
+    try:
+        role = session.query(User.role).filter(User.uuid == user_uuid).scalar()
+        return role == 'admin'
+    finally:
+        session.close()
+
+
+def require_admin(request: Request):
+    """관리자 전용 엔드포인트에서 사용하는 의존성"""
+    user_uuid = getattr(request.state, "user_uuid", None)
+    if not is_admin_uuid(user_uuid):
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다.")
+    return user_uuid
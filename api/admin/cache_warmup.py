@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import os
+from datetime import datetime
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+from data.university_info import UNIVERSITY_INFO
+from models import SessionLocal
+from api.placeRegister.placeList import refresh_place_feed
+from api.objectDetection.objectList import refresh_object_feed
+from api.search.keyword_autocomplete import refresh_place_index
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+CACHE_WARMUP_ENABLED = os.getenv("CACHE_WARMUP_ENABLED", "true").lower() == "true"
+CACHE_WARMUP_CONCURRENCY = int(os.getenv("CACHE_WARMUP_CONCURRENCY", 4))  # 동시에 워밍업할 대학 수
+
+# 워밍업 진행 상태 (ready 가 True 가 되면 모든 대학 데이터가 캐시에 올라간 상태)
+warmup_state = {
+    "ready": False,
+    "started_at": None,
+    "finished_at": None,
+    "warmed": 0,
+    "failed": [],
+}
+
+router = APIRouter()
+
+
+def warm_university(university: str):
+    """한 대학의 장소 피드, 객체 피드, 장소 검색 인덱스를 캐시에 올립니다."""
+    db: Session = SessionLocal()
+    try:
+        refresh_place_feed(db, university)
+        refresh_object_feed(db, university)
+        refresh_place_index(db, university)
+    finally:
+        db.close()
+
+
+async def warm_up_cache():
+    """UNIVERSITY_INFO 의 모든 대학에 대해 제한된 동시성으로 캐시를 채웁니다."""
+    warmup_state.update(ready=False, started_at=datetime.utcnow(), finished_at=None, warmed=0, failed=[])
+    semaphore = asyncio.Semaphore(CACHE_WARMUP_CONCURRENCY)
+
+    async def warm(university: str):
+        async with semaphore:
+            try:
+                # DB/Redis 호출이 동기식이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+                await asyncio.to_thread(warm_university, university)
+                warmup_state["warmed"] += 1
+            except Exception as e:
+                warmup_state["failed"].append(university)
+                logger.warning("Cache warm-up failed for %s: %s", university, e)
+
+    await asyncio.gather(*(warm(university) for university in UNIVERSITY_INFO))
+
+    warmup_state["finished_at"] = datetime.utcnow()
+    warmup_state["ready"] = True
+    logger.info("Cache warm-up finished: %d warmed, %d failed",
+                warmup_state["warmed"], len(warmup_state["failed"]))
+
+
+@router.get("/health/ready", tags=["Health"])
+async def readiness():
+    """캐시 워밍업이 끝났으면 200, 진행 중이면 503을 반환합니다."""
+    status_code = 200 if warmup_state["ready"] else 503
+    return JSONResponse(status_code=status_code, content={
+        "ready": warmup_state["ready"],
+        "warmed": warmup_state["warmed"],
+        "total": len(UNIVERSITY_INFO),
+        "failed": warmup_state["failed"],
+    })
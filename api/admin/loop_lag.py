@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Depends
+from api.admin.admin_login import require_admin
+from setting.loop_monitor import loop_monitor
+
+router = APIRouter()
+
+@router.get("/admin/loop-lag", tags=["Admin"], dependencies=[Depends(require_admin)])
+async def get_loop_lag():
+    """이 워커의 이벤트 루프 지연 백분위와 최근 블로킹 이벤트(스택, 라우트)를 반환합니다."""
+    return loop_monitor.snapshot()
@@ -0,0 +1,81 @@
+import tempfile
+import tracemalloc
+from typing import Literal, Optional
+
+import httpx
+from botocore.client import BaseClient
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile
+from openai import AsyncOpenAI
+from sqlalchemy.orm import Session
+from models import Base
+from api.admin.admin_login import require_admin
+from setting import memory_debug
+
+router = APIRouter()
+
+GroupBy = Literal["lineno", "filename", "traceback"]
+
+
+def _tracked_classes() -> list:
+    """개수를 추적할 클래스: 모든 모델 클래스 + 누수가 의심되는 요청 단위 객체"""
+    model_classes = sorted((mapper.class_ for mapper in Base.registry.mappers), key=lambda cls: cls.__name__)
+    return model_classes + [Session, UploadFile, tempfile.SpooledTemporaryFile, BaseClient, AsyncOpenAI, httpx.AsyncClient]
+
+
+def _require_tracing():
+    if not tracemalloc.is_tracing():
+        raise HTTPException(status_code=409, detail="tracemalloc 이 실행 중이 아닙니다.")
+
+
+@router.post("/admin/memory/tracemalloc/start", tags=["Admin"], dependencies=[Depends(require_admin)])
+async def start_tracemalloc(frames: int = Query(memory_debug.MEMORY_TRACE_FRAMES, ge=1, le=50)):
+    """tracemalloc 을 시작합니다. 추적 중에는 할당마다 오버헤드가 있으므로 조사 후 반드시 중지하세요."""
+    memory_debug.start_tracing(frames)
+    return memory_debug.tracemalloc_status()
+
+
+@router.post("/admin/memory/tracemalloc/stop", tags=["Admin"], dependencies=[Depends(require_admin)])
+async def stop_tracemalloc():
+    """tracemalloc 을 중지하고 저장된 스냅샷을 삭제합니다."""
+    memory_debug.stop_tracing()
+    return memory_debug.tracemalloc_status()
+
+
+@router.get("/admin/memory/top", tags=["Admin"], dependencies=[Depends(require_admin)])
+def get_top_allocations(group_by: GroupBy = "lineno", limit: int = Query(20, ge=1, le=200)):
+    """현재 살아 있는 메모리의 상위 할당 위치를 반환합니다."""
+    _require_tracing()
+    snapshot = memory_debug.take_snapshot()
+    return {"top": memory_debug.top_allocations(snapshot, group_by, limit)}
+
+
+@router.post("/admin/memory/snapshots/{name}", tags=["Admin"], dependencies=[Depends(require_admin)])
+def save_snapshot(name: str):
+    """diff 비교용 스냅샷을 이름을 붙여 저장합니다."""
+    _require_tracing()
+    memory_debug.take_snapshot(name)
+    return {"snapshots": memory_debug.snapshot_names()}
+
+
+@router.get("/admin/memory/diff", tags=["Admin"], dependencies=[Depends(require_admin)])
+def get_snapshot_diff(base: str, target: Optional[str] = None, group_by: GroupBy = "lineno",
+                      limit: int = Query(20, ge=1, le=200)):
+    """base 스냅샷 대비 target 스냅샷(생략 시 현재)에서 늘어난 할당 위치를 반환합니다."""
+    _require_tracing()
+    base_snapshot = memory_debug.get_snapshot(base)
+    target_snapshot = memory_debug.get_snapshot(target) if target else memory_debug.take_snapshot()
+    if base_snapshot is None or target_snapshot is None:
+        raise HTTPException(status_code=404, detail="스냅샷을 찾을 수 없습니다.")
+    return {"diff": memory_debug.diff_snapshots(base_snapshot, target_snapshot, group_by, limit)}
+
+
+@router.get("/admin/memory/stats", tags=["Admin"], dependencies=[Depends(require_admin)])
+def get_memory_stats():
+    """RSS, GC 세대별 카운트, 모델/요청 객체 수, 라우트별 메모리 증가량(추적 중일 때)을 반환합니다."""
+    return {
+        "rss_kb": memory_debug.rss_kb(),
+        "tracemalloc": memory_debug.tracemalloc_status(),
+        "gc": memory_debug.gc_stats(),
+        "objects": memory_debug.object_counts(_tracked_classes()),
+        "routes": memory_debug.route_memory_stats(),
+    }
@@ -0,0 +1,25 @@
+import os
+import secrets
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from dotenv import load_dotenv
+from setting.metrics import render_metrics
+
+load_dotenv()
+
+# 스크레이퍼 전용 자격 증명 (사용자 JWT 와 별개). 설정되지 않으면 /metrics 는 비활성화
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+router = APIRouter()
+
+@router.get("/metrics", tags=["Admin"], include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus 텍스트 포맷 메트릭 (Authorization: Bearer <METRICS_TOKEN>)"""
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not secrets.compare_digest(token, METRICS_TOKEN):
+        raise HTTPException(status_code=401, detail="유효하지 않은 메트릭 토큰입니다.")
+
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
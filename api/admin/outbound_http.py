@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Depends
+from api.admin.admin_login import require_admin
+from setting.http_client import outbound_snapshot
+
+router = APIRouter()
+
+@router.get("/admin/outbound-http", tags=["Admin"], dependencies=[Depends(require_admin)])
+async def get_outbound_http_stats():
+    """이 워커의 외부 호스트별 호출 수, 오류 수, 지연 시간, 서킷 브레이커 상태를 반환합니다."""
+    return outbound_snapshot()
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
+from api.admin.admin_login import require_admin
+from setting.profiler import list_profiles, read_profile
+
+router = APIRouter()
+
+@router.get("/admin/profiles", tags=["Admin"], dependencies=[Depends(require_admin)])
+async def get_profiles():
+    """X-Profile 헤더로 저장된 요청 프로파일 파일 목록을 반환합니다. (최신순)"""
+    return {"profiles": list_profiles()}
+
+@router.get("/admin/profiles/{filename}", tags=["Admin"], dependencies=[Depends(require_admin)])
+async def get_profile(filename: str):
+    """저장된 folded stack 파일을 반환합니다. (flamegraph.pl, speedscope 에서 열 수 있음)"""
+    content = read_profile(filename)
+    if content is None:
+        raise HTTPException(status_code=404, detail="프로파일을 찾을 수 없습니다.")
+    return PlainTextResponse(content)
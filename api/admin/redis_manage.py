@@ -1,21 +1,68 @@
-from fastapi import APIRouter, HTTPException
-from setting.redis_client import redis_client
+import logging
+from typing import Optional
+import redis
+from fastapi import APIRouter, Depends, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
+from api.admin.admin_login import require_admin
+from data.university_info import UNIVERSITY_INFO
+from setting.cache_namespace import CACHE_NAMESPACES, invalidate_cache
+from setting.etag import pending_bump_scopes
+from setting.local_cache import local_cache
+from setting.redis_client import redis_breaker, cache_hit_stats, scan_cache_stats
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-@router.delete("/admin/flush-redis", tags=["Admin"])
-async def flush_redis_cache():
-    """Redis 캐시를 플러시합니다."""
-    try:
-        redis_client.flushall()  # Redis 캐시 초기화
-        return {"message": "Redis cache flushed successfully"}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to flush Redis cache: {str(e)}")
+@router.post("/admin/cache/invalidate", tags=["Admin"], dependencies=[Depends(require_admin)])
+def invalidate_cache_namespace(
+    namespace: Optional[str] = Query(None, description=f"무효화할 네임스페이스 (없으면 전체): {', '.join(CACHE_NAMESPACES)}"),
+    university: Optional[str] = Query(None, description="무효화할 대학 (없으면 전체)"),
+):
+    """
+    네임스페이스·대학별 캐시 버전을 올려 해당 캐시를 무효화합니다.
+    FLUSHALL 과 달리 다른 캐시와 세션/멱등 키 등은 그대로 남고, 이전 버전 키는 TTL 후 사라집니다.
+    """
+    if namespace is not None and namespace not in CACHE_NAMESPACES:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 네임스페이스입니다: {namespace}")
+    if university is not None and university not in UNIVERSITY_INFO:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 대학입니다: {university}")
+
+    namespaces = [namespace] if namespace else list(CACHE_NAMESPACES)
+    universities = [university] if university else list(UNIVERSITY_INFO)
+    applied = invalidate_cache(namespaces, universities)
+    logger.info("Cache invalidated: namespaces=%s universities=%d deferred=%s",
+                namespaces, len(universities), not applied)
+    # deferred: Redis 장애로 보류됨 (복구 후 자동으로 다시 실행)
+    return {"namespaces": namespaces, "universities": universities, "deferred": not applied}
+
+@router.get("/admin/redis-status", tags=["Admin"], dependencies=[Depends(require_admin)])
+async def get_redis_status():
+    """
+    Redis 서킷 브레이커 상태와 Redis 복구를 기다리는 데이터/캐시 버전 scope 를 반환합니다.
+    (state_value: 0=closed, 1=half_open, 2=open)
+    """
+    return {**redis_breaker.snapshot(), "pending_version_bumps": await run_in_threadpool(pending_bump_scopes)}
 
-def flush_cache_on_startup():
-    """앱 시작 시 Redis 캐시를 플러시합니다."""
+@router.get("/admin/cache-stats", tags=["Admin"], dependencies=[Depends(require_admin)])
+def get_cache_stats(
+    max_keys: int = Query(10000, ge=100, le=1000000),
+    samples_per_namespace: int = Query(50, ge=1, le=1000),
+    match: str = "*",
+):
+    """
+    네임스페이스(키 접두사)별 키 수, TTL 분포, MEMORY USAGE 추정치와 이 워커의 hit/miss/set 횟수(L1/Redis 계층별),
+    L1 캐시 크기를 반환합니다.
+    키 목록은 SCAN 으로 나눠 조회하므로 Redis 를 블로킹하지 않습니다.
+    max_keys 에서 멈추면 match="*" 일 때만 전체 키 수를 추정하고(keys_estimated), 패턴을 지정했으면 keys 는 하한값입니다.
+    """
+    if not redis_breaker.allow_request():
+        return {"redis": "unavailable", "requests": cache_hit_stats(), "local_cache": local_cache.stats()}
     try:
-        redis_client.flushall()
-        print("Redis cache flushed on startup")
-    except Exception as e:
-        print(f"Failed to flush Redis cache on startup: {str(e)}")
+        stats = scan_cache_stats(max_keys, samples_per_namespace, match)
+    except redis.RedisError as e:
+        redis_breaker.record_failure()
+        raise HTTPException(status_code=503, detail=f"Redis 조회에 실패했습니다: {str(e)}")
+    redis_breaker.record_success()
+    stats["local_cache"] = local_cache.stats()
+    return stats
@@ -0,0 +1,142 @@
+# 앱 시작 데이터 일괄 조회
+#
+#   GET /api/v1/bootstrap
+#   GET /api/v1/bootstrap?fields=places,objects    (일부 섹션만, 실패한 섹션 재요청 등)
+#
+# 앱 실행 시 차례로 호출하던 userinfo/inquire, get_place_list, get_object_list, message_check,
+# activity/user_barrierfree 의 결과를 한 응답으로 묶는다.
+# 사용자는 한 번만 조회하고, 나머지 섹션은 각자 DB 세션을 가진 스레드에서 동시에 실행한다.
+# 섹션마다 BOOTSTRAP_SECTION_TIMEOUT 이 있어 늦거나 실패한 섹션은 null 로 두고 errors 에 사유를 적는다.
+# (타임아웃 난 섹션의 스레드는 끝까지 실행된 뒤 세션을 닫는다)
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from dotenv import load_dotenv
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+
+from models import SessionLocal, User
+from api.userInfo.manage_userinfo import build_user_info
+from api.placeRegister.placeList import displayed_place_feed
+from api.objectDetection.objectList import get_object_feed
+from api.message.check_message import find_new_message
+from api.activity.user_barrierfree_activity import collect_barrierfree_activity
+from setting.metrics import BOOTSTRAP_SECTION_DURATION, BOOTSTRAP_SECTION_RESULTS
+from setting.sparse_fields import sparse_fields
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+BOOTSTRAP_SECTION_TIMEOUT = float(os.getenv("BOOTSTRAP_SECTION_TIMEOUT", 2.0))  # 섹션별 최대 대기 시간(초)
+
+router = APIRouter()
+
+
+# --- 섹션: (DB 세션, 사용자, 요청 시각) -> 결과. 각 섹션은 개별 엔드포인트와 같은 함수를 사용 ---
+def _places_section(db: Session, user: User, now: datetime):
+    return displayed_place_feed(db, user.university, now)
+
+
+def _objects_section(db: Session, user: User, now: datetime):
+    return get_object_feed(db, user.university)
+
+
+def _message_section(db: Session, user: User, now: datetime):
+    return find_new_message(db, user.uuid)
+
+
+def _activity_section(db: Session, user: User, now: datetime):
+    return collect_barrierfree_activity(db, user)
+
+
+BOOTSTRAP_SECTIONS = {
+    "places": _places_section,      # /api/v1/get_place_list
+    "objects": _objects_section,    # /api/v1/get_object_list
+    "message": _message_section,    # /api/v1/message_check
+    "activity": _activity_section,  # /api/v1/activity/user_barrierfree
+}
+BOOTSTRAP_FIELDS = ("user",) + tuple(BOOTSTRAP_SECTIONS)
+
+
+def _run_section(section, user: User, now: datetime):
+    db: Session = SessionLocal()
+    try:
+        return section(db, user, now)
+    finally:
+        db.close()
+
+
+async def _gather_section(name: str, user: User, now: datetime):
+    """섹션 하나를 스레드에서 실행합니다. 반환: (결과, 실패 사유)"""
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(
+            asyncio.to_thread(_run_section, BOOTSTRAP_SECTIONS[name], user, now),
+            timeout=BOOTSTRAP_SECTION_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        BOOTSTRAP_SECTION_RESULTS.inc(name, "timeout")
+        logger.warning("Bootstrap section %s timed out after %.1fs", name, BOOTSTRAP_SECTION_TIMEOUT)
+        return None, "timeout"
+    except Exception as e:
+        BOOTSTRAP_SECTION_RESULTS.inc(name, "error")
+        logger.warning("Bootstrap section %s failed: %s", name, e)
+        return None, "error"
+    BOOTSTRAP_SECTION_DURATION.observe(time.perf_counter() - started, name)
+    BOOTSTRAP_SECTION_RESULTS.inc(name, "ok")
+    return result, None
+
+
+@router.get("/api/v1/bootstrap", tags=["User"])
+async def bootstrap(
+    request: Request,
+    fields: Optional[List[str]] = Depends(sparse_fields(BOOTSTRAP_FIELDS, always=())),
+):
+    """
+    앱 시작에 필요한 데이터를 한 번에 반환합니다.
+    반환 포맷:
+    {
+      "user": {...},        # /api/v1/userinfo/inquire
+      "places": [...],      # /api/v1/get_place_list
+      "objects": [...],     # /api/v1/get_object_list
+      "message": {...},     # /api/v1/message_check
+      "activity": {...},    # /api/v1/activity/user_barrierfree
+      "errors": {"activity": "timeout"}   # 실패한 섹션과 사유 (timeout, error). 해당 섹션 값은 null
+    }
+    fields 로 섹션을 고르면 해당 섹션만 반환합니다.
+    """
+    db: Session = SessionLocal()
+    try:
+        # 사용자는 한 번만 조회해 모든 섹션에서 사용
+        user_uuid = request.state.user_uuid
+        user = db.query(User).filter(User.uuid == user_uuid).first()
+        if not user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
+    finally:
+        db.close()
+
+    selected = fields or BOOTSTRAP_FIELDS
+    names = [name for name in selected if name in BOOTSTRAP_SECTIONS]
+    now = datetime.now()
+    outcomes = await asyncio.gather(*(_gather_section(name, user, now) for name in names))
+
+    payload = {}
+    if "user" in selected:
+        payload["user"] = build_user_info(user)
+    errors = {}
+    for name, (result, error) in zip(names, outcomes):
+        payload[name] = result
+        if error is not None:
+            errors[name] = error
+    payload["errors"] = errors
+    return payload
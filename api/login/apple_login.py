@@ -1,16 +1,15 @@
 import datetime
 import os
 import jwt
-import requests
 from pydantic import BaseModel
 from fastapi import APIRouter, HTTPException, Response
 from dotenv import load_dotenv
 from sqlalchemy.orm import Session
-from models import SessionLocal, User, Token
 from api.login.login_token_manage import (
     get_user_by_provider, create_user, create_or_update_token,
-    create_access_token, create_refresh_token
+    create_access_token, create_refresh_token, get_token, mark_user_deleted, run_with_session
 )
+from setting import http_client
 
 router = APIRouter()
 
@@ -24,7 +23,7 @@ APPLE_TEAM_ID = os.getenv("APPLE_TEAM_ID")
 
 # AuthKey 파일에서 비밀키를 읽어오기(이 부분은 로컬/서버 환경에 따라 경로가 다를 수 있음)
 # 삭제 금지
-auth_key_path = "/app/secrets/AuthKey_76ZFAC89DR.p8"  # 서버 경로
+auth_key_path = os.getenv("APPLE_AUTH_KEY_PATH", "/app/secrets/AuthKey_76ZFAC89DR.p8")  # 서버 경로
 # auth_key_path = "secrets/AuthKey_76ZFAC89DR.p8"  # 로컬 경로
 
 
@@ -43,11 +42,11 @@ class AppleLoginData(BaseModel):
 
 
 @router.post('/login/apple', tags=["Login"])
-def apple_login(data: AppleLoginData, response: Response):
-    db: Session = SessionLocal()
+async def apple_login(data: AppleLoginData, response: Response):
     try:
         # Request token from Apple
-        token_response = requests.post(
+        token_response = await http_client.request(
+            "POST",
             'https://appleid.apple.com/auth/token',
             data={
                 'client_id': APPLE_CLIENT_ID,
@@ -71,42 +70,9 @@ def apple_login(data: AppleLoginData, response: Response):
         if not provider_id:
             raise HTTPException(status_code=400, detail="Provider ID not found")
 
-        # Check user existence using get_user_by_provider
-        user = get_user_by_provider(db, 'APPLE', provider_id)
-
-        if not user:
-            # Create new user
-            user = create_user(
-                db,
-                email=data.userEmail,
-                provider_type='APPLE',
-                provider_id=provider_id,
-                provider_profile_image=None,
-                provider_user_name=data.userName,
-                apple_real_user_status=decoded_token.get('real_user_status'),
-                status='Need_Register'
-            )
-            message = "Need_Register"
-            response.status_code = 201
-        elif user.status == 'Need_Register':
-            message = "Need_Register"
-            response.status_code = 202
-        elif user.status == 'Active':
-            message = "Login successful"
-            response.status_code = 200
-        else:
-            raise HTTPException(status_code=400, detail="Invalid user status")
-
-        # Generate and update tokens
-        access_token = create_access_token(uuid=user.uuid)
-        refresh_token = create_refresh_token()
-        create_or_update_token(
-            db,
-            user_uuid=user.uuid,
-            refresh_token=refresh_token,
-            provider_type='APPLE',
-            provider_refresh_token=token_data.get('refresh_token')
-        )
+        # 사용자 조회/생성과 토큰 저장은 스레드풀에서 실행
+        message, response.status_code, access_token, refresh_token = await run_with_session(
+            apple_login_user, data, provider_id, decoded_token, token_data.get('refresh_token'))
 
         return {
             "message": message,
@@ -116,10 +82,46 @@ def apple_login(data: AppleLoginData, response: Response):
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"Error processing Apple login: {str(e)}")
-    finally:
-        db.close()
+
+
+def apple_login_user(db: Session, data: AppleLoginData, provider_id: str, decoded_token: dict,
+                     provider_refresh_token: str) -> tuple:
+    """반환: (메시지, 상태 코드, 액세스 토큰, 리프레시 토큰)"""
+    # Check user existence using get_user_by_provider
+    user = get_user_by_provider(db, 'APPLE', provider_id)
+
+    if not user:
+        # Create new user
+        user = create_user(
+            db,
+            email=data.userEmail,
+            provider_type='APPLE',
+            provider_id=provider_id,
+            provider_profile_image=None,
+            provider_user_name=data.userName,
+            apple_real_user_status=decoded_token.get('real_user_status'),
+            status='Need_Register'
+        )
+        message, status_code = "Need_Register", 201
+    elif user.status == 'Need_Register':
+        message, status_code = "Need_Register", 202
+    elif user.status == 'Active':
+        message, status_code = "Login successful", 200
+    else:
+        raise HTTPException(status_code=400, detail="Invalid user status")
+
+    # Generate and update tokens
+    access_token = create_access_token(uuid=user.uuid)
+    refresh_token = create_refresh_token()
+    create_or_update_token(
+        db,
+        user_uuid=user.uuid,
+        refresh_token=refresh_token,
+        provider_type='APPLE',
+        provider_refresh_token=provider_refresh_token
+    )
+    return message, status_code, access_token, refresh_token
 
 
 def create_client_secret():
@@ -148,21 +150,19 @@ def verify_and_decode_identity_token(identity_token: str) -> dict:
 
 
 # 회원 탈퇴 로직을 일반 함수로 변경
-def apple_unregister_function(user_uuid: str):
-    # 데이터베이스 세션 생성
-    db: Session = SessionLocal()
+async def apple_unregister_function(user_uuid: str):
     try:
-        # 사용자의 토큰 항목 조회
-        token_entry = db.query(Token).filter(Token.uuid == user_uuid).first()
+        # 사용자의 토큰 항목 조회 (DB 작업은 스레드풀에서 실행)
+        token_entry = await run_with_session(get_token, user_uuid)
         if not token_entry:
-            db.close()
             raise HTTPException(status_code=404, detail="유효하지 않은 사용자입니다.")
 
         # provider_refresh_token 가져오기
         user_refresh_token = token_entry.provider_refresh_token
 
         # 애플에 회원 탈퇴 요청 보내기
-        response = requests.post(
+        response = await http_client.request(
+            "POST",
             'https://appleid.apple.com/auth/revoke',
             data={
                 'client_id': APPLE_CLIENT_ID,
@@ -176,26 +176,13 @@ def apple_unregister_function(user_uuid: str):
         )
 
         if response.status_code != 200:
-            db.close()
             raise HTTPException(status_code=response.status_code, detail="애플 회원 탈퇴 실패")
 
-        # 사용자의 상태를 Deleted로 업데이트
-        user = db.query(User).filter(User.uuid == user_uuid).first()
-        if user:
-            user.status = 'Deleted'
-            db.commit()
-
-        # 토큰의 상태를 Deleted로 업데이트
-        token_entry.status = 'Deleted'
-        db.commit()
-
-        db.close()
+        # 사용자와 토큰의 상태를 Deleted로 업데이트
+        await run_with_session(mark_user_deleted, user_uuid)
         return {"message": "애플 회원 탈퇴 성공"}
 
-    except HTTPException as he:
-        db.close()
-        raise he
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
-        db.close()
-        raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
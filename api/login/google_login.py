@@ -8,9 +8,9 @@ from sqlalchemy.orm import Session
 from models import SessionLocal, Token, User
 from api.login.login_token_manage import (
     get_user_by_provider, create_user, update_user, create_or_update_token,
-    create_access_token, create_refresh_token
+    create_access_token, create_refresh_token, get_token, mark_user_deleted, run_with_session
 )
-import requests
+from setting import http_client
 
 router = APIRouter()
 
@@ -112,14 +112,11 @@ async def google_login(data: GoogleLoginData, response: Response):
         db.close()
 
 # 구글 계정 연결 해제 (revoke) 함수를 일반 함수로 변경
-def google_unregister_function(user_uuid: str):
-    # 데이터베이스 세션 생성
-    db: Session = SessionLocal()
+async def google_unregister_function(user_uuid: str):
     try:
-        # 사용자의 토큰 항목 조회
-        token_entry = db.query(Token).filter(Token.uuid == user_uuid).first()
+        # 사용자의 토큰 항목 조회 (DB 작업은 스레드풀에서 실행)
+        token_entry = await run_with_session(get_token, user_uuid)
         if not token_entry:
-            db.close()
             raise HTTPException(status_code=404, detail="유효하지 않은 사용자입니다.")
 
         # provider_access_token 가져오기
@@ -127,29 +124,16 @@ def google_unregister_function(user_uuid: str):
 
         # 구글에 연결 해제 요청 보내기
         revoke_url = f"https://accounts.google.com/o/oauth2/revoke?token={user_access_token}"
-        revoke_response = requests.post(revoke_url)
+        revoke_response = await http_client.request("POST", revoke_url)
 
         if revoke_response.status_code != 200:
-            db.close()
             raise HTTPException(status_code=revoke_response.status_code, detail="구글 계정 연결 해제 실패")
 
-        # 사용자의 상태를 Deleted로 업데이트
-        user = db.query(User).filter(User.uuid == user_uuid).first()
-        if user:
-            user.status = 'Deleted'
-            db.commit()
-
-        # 토큰의 상태를 Deleted로 업데이트
-        token_entry.status = 'Deleted'
-        db.commit()
-
-        db.close()
+        # 사용자와 토큰의 상태를 Deleted로 업데이트
+        await run_with_session(mark_user_deleted, user_uuid)
         return {"message": "구글 계정 연결 해제 성공"}
 
-    except HTTPException as he:
-        db.close()
-        raise he
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
-        db.close()
-        raise HTTPException(status_code=500, detail=f"구글 연결 해제 중 오류 발생: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"구글 연결 해제 중 오류 발생: {str(e)}")
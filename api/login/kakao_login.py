@@ -9,9 +9,9 @@ from models import SessionLocal, Token, User
 from sqlalchemy.future import select as sqlalchemy_select
 from api.login.login_token_manage import (
     get_user_by_provider, create_user, update_user, create_or_update_token,
-    create_access_token, create_refresh_token
+    create_access_token, create_refresh_token, mark_user_deleted, run_with_session
 )
-import requests
+from setting import http_client
 
 router = APIRouter()
 
@@ -98,21 +98,16 @@ def kakao_login(user_info: KakaoUserInfo, response: Response):
 
 
 # 카카오 연결 해제 (unlink) 함수를 일반 함수로 변경
-def kakao_unregister_function(user_uuid: str):
+async def kakao_unregister_function(user_uuid: str):
     if not KAKAO_ADMIN_KEY:
         raise HTTPException(status_code=500, detail="KAKAO_ADMIN_KEY가 설정되지 않았습니다.")
 
-    # 데이터베이스 세션 생성
-    db: Session = SessionLocal()
     try:
-        # 사용자의 provider_id 조회
-        user_result = db.execute(sqlalchemy_select(User).filter(User.uuid == user_uuid))
-        user = user_result.scalars().first()
-        if not user:
+        # 사용자의 provider_id 조회 (DB 작업은 스레드풀에서 실행)
+        provider_id = await run_with_session(get_provider_id, user_uuid)
+        if provider_id is None:
             raise HTTPException(status_code=404, detail="유효하지 않은 사용자입니다.")
 
-        provider_id = user.provider_id
-
         headers = {
             "Authorization": f"KakaoAK {KAKAO_ADMIN_KEY}",
             "Content-Type": "application/x-www-form-urlencoded"
@@ -124,7 +119,8 @@ def kakao_unregister_function(user_uuid: str):
         }
 
         # POST 요청으로 연결 해제
-        unregister_response = requests.post(
+        unregister_response = await http_client.request(
+            "POST",
             'https://kapi.kakao.com/v1/user/unlink',
             headers=headers,
             data=unregister_data
@@ -133,22 +129,17 @@ def kakao_unregister_function(user_uuid: str):
         if unregister_response.status_code != 200:
             raise HTTPException(status_code=unregister_response.status_code, detail="카카오 사용자 연결 해제 실패")
 
-        # 사용자의 상태를 Deleted로 업데이트
-        user.status = 'Deleted'
-        db.commit()
-
-        # 토큰의 상태를 Deleted로 업데이트
-        token_entry = db.query(Token).filter(Token.uuid == user_uuid).first()
-        if token_entry:
-            token_entry.status = 'Deleted'
-            db.commit()
-
+        # 사용자와 토큰의 상태를 Deleted로 업데이트
+        await run_with_session(mark_user_deleted, user_uuid)
         return {"message": "카카오 사용자 연결이 성공적으로 해제되었습니다."}
 
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
         raise HTTPException(status_code=500, detail=f"카카오 연결 해제 중 오류 발생: {str(e)}")
-    finally:
-        db.close()
+
+
+def get_provider_id(db: Session, user_uuid: str):
+    user_result = db.execute(sqlalchemy_select(User).filter(User.uuid == user_uuid))
+    user = user_result.scalars().first()
+    return user.provider_id if user else None
@@ -1,7 +1,9 @@
 import jwt
 import datetime
 from sqlalchemy.orm import Session
-from models import User, Token
+from starlette.concurrency import run_in_threadpool
+from models import SessionLocal, User, Token
+from api.placeRegister.placeList import bump_contributed_place_versions
 from dotenv import load_dotenv
 import os
 
@@ -34,6 +36,9 @@ def update_user(db: Session, user: User, **kwargs):
         setattr(user, key, value)
     db.commit()
     db.refresh(user)
+    # 장소 상세의 기여자 목록에 프로필 이미지가 보이므로 해당 장소들의 ETag 버전 갱신
+    if "provider_profile_image" in kwargs:
+        bump_contributed_place_versions(db, user.id)
     return user
 
 def create_or_update_token(db: Session, user_uuid: str, **kwargs):
@@ -50,6 +55,37 @@ def create_or_update_token(db: Session, user_uuid: str, **kwargs):
         db.refresh(token)
     return token
 
+def get_token(db: Session, user_uuid: str):
+    return db.query(Token).filter(Token.uuid == user_uuid).first()
+
+def mark_user_deleted(db: Session, user_uuid: str):
+    """회원 탈퇴: 사용자와 토큰의 상태를 Deleted로 업데이트"""
+    user = db.query(User).filter(User.uuid == user_uuid).first()
+    if user:
+        user.status = 'Deleted'
+    token_entry = get_token(db, user_uuid)
+    if token_entry:
+        token_entry.status = 'Deleted'
+    db.commit()
+
+def _call_with_session(func, args, kwargs):
+    db: Session = SessionLocal()
+    try:
+        return func(db, *args, **kwargs)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+async def run_with_session(func, *args, **kwargs):
+    """
+    func(db, *args, **kwargs) 를 새 DB 세션으로 스레드풀에서 실행합니다.
+    외부 API 를 await 하는 async 핸들러에서 DB 조회/커밋이 이벤트 루프를 막지 않도록 사용합니다.
+    세션은 반환 전에 닫히므로, 반환한 ORM 객체는 커밋 전에 읽어 둔 컬럼 값만 사용할 수 있습니다.
+    """
+    return await run_in_threadpool(_call_with_session, func, args, kwargs)
+
 def create_access_token(uuid: str):
     """액세스 토큰 생성, UUID 포함"""
     to_encode = {"uuid": uuid}
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 from models import SessionLocal, Token, User
 from api.login.login_token_manage import (
     get_user_by_provider, create_user, update_user, create_or_update_token,
-    create_access_token, create_refresh_token
+    create_access_token, create_refresh_token, run_with_session
 )
 from sqlalchemy.future import select
 
@@ -24,44 +24,39 @@ class UnregisterResponse(BaseModel):
     message: str
 
 @router.delete('/api/v1/unregister', response_model=UnregisterResponse, tags=["Unregister"])
-def user_unregister(request: Request):
+async def user_unregister(request: Request):
     # 사용자 UUID 가져오기
     user_uuid = request.state.user_uuid
 
     if not user_uuid:
         raise HTTPException(status_code=401, detail="인증되지 않은 사용자입니다.")
 
-    # 데이터베이스 세션 생성
-    db: Session = SessionLocal()
     try:
-        # 사용자 조회
-        user = db.query(User).filter(User.uuid == user_uuid).first()
-        if not user:
-            db.close()
+        # 사용자 조회 (DB 작업은 스레드풀에서 실행)
+        provider_type = await run_with_session(get_provider_type, user_uuid)
+        if provider_type is None:
             raise HTTPException(status_code=404, detail="유효하지 않은 사용자입니다.")
 
-        provider_type = user.provider_type
-
         if provider_type == 'KAKAO':
             # 카카오 연결 해제 함수 호출
-            result = kakao_unregister_function(user_uuid)
+            result = await kakao_unregister_function(user_uuid)
         elif provider_type == 'APPLE':
             # 애플 연결 해제 함수 호출
-            result = apple_unregister_function(user_uuid)
+            result = await apple_unregister_function(user_uuid)
         elif provider_type == 'GOOGLE':
             # 구글 연결 해제 함수 호출
-            result = google_unregister_function(user_uuid)
+            result = await google_unregister_function(user_uuid)
         else:
-            db.close()
             raise HTTPException(status_code=400, detail="지원되지 않는 provider_type입니다.")
 
-        db.close()
         return UnregisterResponse(message=result["message"])
 
-    except HTTPException as he:
-        db.close()
-        raise he
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
-        db.close()
         raise HTTPException(status_code=500, detail=f"회원 탈퇴 중 오류 발생: {str(e)}")
+
+
+def get_provider_type(db: Session, user_uuid: str):
+    user = db.query(User).filter(User.uuid == user_uuid).first()
+    return user.provider_type if user else None
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func, case
 from models import SessionLocal, User, Message
 from typing import Optional, List
 from datetime import datetime
+from setting.pagination import Cursor, keyset_page, page_cursor, page_limit, set_next_cursor
 
 router = APIRouter()
 
@@ -48,6 +49,26 @@ def get_db():
     finally:
         db.close()
 
+def find_new_message(db: Session, user_uuid: str) -> CheckMessageResponse:
+    """읽지 않은 최신 메시지 (bootstrap 에서도 사용)"""
+    latest_unread_message = db.query(Message)\
+        .filter(Message.recipient_uuid == user_uuid)\
+        .filter(Message.is_read == False)\
+        .order_by(desc(Message.created_at))\
+        .first()
+
+    if latest_unread_message:
+        return CheckMessageResponse(
+            has_new_message=True,
+            message=latest_unread_message
+        )
+    else:
+        return CheckMessageResponse(
+            has_new_message=False,
+            message=None
+        )
+
+
 # --- 기존 API 엔드포인트 ---
 @router.get(
     "/api/v1/message_check",
@@ -66,22 +87,7 @@ async def check_for_new_message(
         if not current_user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-        latest_unread_message = db.query(Message)\
-            .filter(Message.recipient_uuid == current_user.uuid)\
-            .filter(Message.is_read == False)\
-            .order_by(desc(Message.created_at))\
-            .first()
-
-        if latest_unread_message:
-            return CheckMessageResponse(
-                has_new_message=True,
-                message=latest_unread_message
-            )
-        else:
-            return CheckMessageResponse(
-                has_new_message=False,
-                message=None
-            )
+        return find_new_message(db, current_user.uuid)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
 
@@ -120,6 +126,35 @@ async def check_my_mail(
         raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
 
 
+@router.get(
+    "/api/v1/message/list",
+    response_model=List[MessageDetailsResponse],
+    tags=["Message"],
+    summary="수신한 메시지 목록 (최신순, 커서 페이지네이션)"
+)
+async def list_messages(
+    request: Request,
+    response: Response,
+    cursor: Optional[Cursor] = Depends(page_cursor),
+    limit: int = Depends(page_limit),
+    db: Session = Depends(get_db)
+):
+    """
+    현재 로그인한 사용자가 받은 메시지를 최신순으로 limit 개씩 반환합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더 값을 cursor 로 넘겨 이어서 조회합니다.
+    """
+    try:
+        user_uuid = request.state.user_uuid
+        messages, next_cursor = keyset_page(
+            db.query(Message).filter(Message.recipient_uuid == user_uuid),
+            Message.created_at, Message.id, cursor, limit,
+        )
+        set_next_cursor(response, next_cursor)
+        return messages
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
+
+
 # --- [신규] 추가된 API 엔드포인트 ---
 @router.get(
     "/api/v1/message/confirm",
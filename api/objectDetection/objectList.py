@@ -1,12 +1,151 @@
-from fastapi import APIRouter, HTTPException, Request
+from datetime import datetime
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
 from models import SessionLocal, UserObject, User
+from setting.redis_client import cache_get_json, cache_set_json
+from setting.compression import cached_json_response
+from setting.etag import resource_etag_versions, objects_scope, etag_matches, not_modified_response, set_etag_headers
+from setting.cache_namespace import OBJECT_FEED, cache_scope, namespace_version, versioned_cache_key
+from setting.sparse_fields import sparse_fields, project, row_to_dict
+from setting.batch_ids import batch_ids, in_input_order
+from setting.pagination import (
+    Cursor, MAX_PAGE_SIZE, encode_cursor, keyset_page, page_cursor, page_limit, set_next_cursor,
+)
 
 router = APIRouter()
 
-@router.get("/api/v1/get_object_list", tags=["Object"])
-async def get_object_list(request: Request):
+# 대학별 객체 피드 캐시 유효 시간 (객체 등록 시 무효화됨)
+OBJECT_FEED_CACHE_EXPIRATION = 600
+# 첫 페이지(캐시되는 피드)의 객체 수
+OBJECT_FEED_SIZE = 25
+
+# fields= 로 선택할 수 있는 필드 (응답 순서)
+OBJECT_FIELDS = (
+    "id", "resource_id", "created_at", "user_id", "created_uuid",
+    "latitude", "longitude", "object_name", "place_name", "image_url",
+)
+OBJECT_DETAIL_FIELDS = OBJECT_FIELDS + ("is_mine",)
+
+
+# --- 응답 모델 (검증과 직렬화를 pydantic-core 에서 한 번에 처리) ---
+class ObjectFeedItem(BaseModel):
+    id: int
+    resource_id: str
+    created_at: str     # 캐시에 isoformat 문자열로 저장됨
+    user_id: int
+    created_uuid: str
+    latitude: float
+    longitude: float
+    object_name: str
+    place_name: str
+    image_url: str
+
+
+class ObjectDetailResponse(BaseModel):
+    id: int
+    resource_id: str
+    created_at: datetime
+    user_id: int
+    created_uuid: str
+    latitude: float
+    longitude: float
+    object_name: str
+    place_name: str
+    image_url: str
+    is_mine: bool
+
+
+def object_feed_cache_key(university: str, version: str) -> str:
+    return versioned_cache_key(OBJECT_FEED, university, version)
+
+
+def object_feed_cursor_key(university: str, version: str) -> str:
+    """피드(첫 페이지) 다음 페이지 커서. 캐시 히트 시 피드 본문을 파싱하지 않고 X-Next-Cursor 를 붙이기 위해 따로 저장"""
+    return versioned_cache_key(OBJECT_FEED, university, version, "cursor")
+
+
+def object_feed_columns(selected) -> list:
+    """피드 응답 필드에 필요한 UserObject 컬럼 (+ 커서에 필요한 created_at)"""
+    columns = [getattr(UserObject, name) for name in selected]
+    if "created_at" not in selected:
+        columns.append(UserObject.created_at)
+    return columns
+
+
+def object_feed_item(row, selected) -> dict:
+    item = row_to_dict(row, selected)
+    if "created_at" in item:
+        item["created_at"] = item["created_at"].isoformat()
+    return item
+
+
+def fetch_object_feed(db: Session, university: str, cursor: Optional[Cursor] = None,
+                      limit: int = OBJECT_FEED_SIZE, fields: Optional[List[str]] = None) -> tuple:
+    """
+    대학의 객체들을 (created_at, id) 최신순으로 cursor 다음부터 limit 개 조회합니다. 반환: (목록, 다음 커서)
+    fields 를 지정하면 해당 컬럼만 조회합니다.
+    """
+    selected = fields or OBJECT_FIELDS
+    rows, next_cursor = keyset_page(
+        db.query(*object_feed_columns(selected)).filter(UserObject.university == university),
+        UserObject.created_at, UserObject.id, cursor, limit,
+    )
+    return [object_feed_item(row, selected) for row in rows], next_cursor
+
+
+def refresh_object_feed(db: Session, university: str, version: Optional[str] = None) -> list:
+    """
+    DB에서 객체 피드를 다시 읽어 캐시에 저장합니다. (캐시 워밍업에서도 사용)
+    version: 객체 피드 네임스페이스 버전 (없으면 조회, Redis 를 사용할 수 없으면 저장하지 않음)
+    """
+    object_list, next_cursor = fetch_object_feed(db, university)
+    version = version or namespace_version(OBJECT_FEED, university)
+    if version is not None:
+        cache_set_json(object_feed_cache_key(university, version), OBJECT_FEED_CACHE_EXPIRATION, object_list)
+        # 다음 페이지가 없으면 빈 문자열 (캐시 미스와 구분)
+        cache_set_json(object_feed_cursor_key(university, version), OBJECT_FEED_CACHE_EXPIRATION, next_cursor or "")
+    return object_list
+
+
+def get_object_feed(db: Session, university: str, version: Optional[str] = None) -> list:
+    version = version or namespace_version(OBJECT_FEED, university)
+    if version is not None:
+        cached = cache_get_json(object_feed_cache_key(university, version))
+        if cached is not None:
+            return cached
+    return refresh_object_feed(db, university, version)
+
+
+def feed_cursor(feed: list) -> Optional[str]:
+    """피드 마지막 항목 다음부터의 커서 (피드가 가득 차지 않았으면 다음 페이지 없음)"""
+    if len(feed) < OBJECT_FEED_SIZE:
+        return None
+    return encode_cursor(feed[-1]["created_at"], feed[-1]["id"])
+
+
+def object_feed_next_cursor(db: Session, university: str, version: Optional[str]) -> Optional[str]:
+    """피드(첫 페이지) 다음 페이지 커서. 없으면 None"""
+    next_cursor = cache_get_json(object_feed_cursor_key(university, version)) if version is not None else None
+    if next_cursor is None:
+        return feed_cursor(get_object_feed(db, university, version))
+    return next_cursor or None
+
+@router.get("/api/v1/get_object_list", response_model=List[ObjectFeedItem], tags=["Object"])
+async def get_object_list(
+    request: Request,
+    response: Response,
+    fields: Optional[List[str]] = Depends(sparse_fields(OBJECT_FIELDS)),
+    cursor: Optional[Cursor] = Depends(page_cursor),
+    limit: int = Query(OBJECT_FEED_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    """
+    사용자 대학의 객체를 최신순으로 반환합니다.
+    첫 페이지는 대학별로 캐시된 최신 25개, 이후 페이지는 X-Next-Cursor 값을 cursor 로 넘겨 limit 개씩 조회합니다.
+    첫 페이지에 25 가 아닌 limit 을 지정하면 캐시 없이 최신 limit 개를 조회합니다.
+    """
     try:
         # DB 세션 생성
         db: Session = SessionLocal()
@@ -19,30 +158,41 @@ async def get_object_list(request: Request):
         if not user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-        # 사용자의 대학교와 일치하는 객체들을 최신순으로 최대 25개 조회
-        objects = db.query(UserObject)\
-            .filter(UserObject.university == user.university)\
-            .order_by(desc(UserObject.created_at))\
-            .limit(25)\
-            .all()
+        # 다음 페이지 또는 캐시된 피드와 크기가 다른 첫 페이지: 키셋 조회 (캐시/ETag 없음)
+        if cursor is not None or limit != OBJECT_FEED_SIZE:
+            items, next_cursor = fetch_object_feed(db, user.university, cursor, limit, fields)
+            page = ORJSONResponse(items)
+            set_next_cursor(page, next_cursor)
+            return page
 
-        # 객체 리스트 반환
-        object_list = []
-        for obj in objects:
-            object_list.append({
-                "id": obj.id,
-                "resource_id": obj.resource_id,
-                "created_at": obj.created_at,
-                "user_id": obj.user_id,
-                "created_uuid": obj.created_uuid,
-                "latitude": obj.latitude,
-                "longitude": obj.longitude,
-                "object_name": obj.object_name,
-                "place_name": obj.place_name,
-                "image_url": obj.image_url
-            })
-
-        return object_list
+        # 대학별 객체 버전이 그대로면 304 (피드 조회/직렬화 생략)
+        # 피드 캐시 키의 네임스페이스 버전도 같은 MGET 으로 조회
+        etag, versions = resource_etag_versions(
+            "object_list", [objects_scope(user.university), cache_scope(OBJECT_FEED, user.university)], fields)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        feed_version = versions[1] if versions else None
+
+        # 필드 선택 시 캐시된 피드에서 요청한 필드만 골라 응답
+        if fields:
+            feed = get_object_feed(db, user.university, feed_version)
+            selected = ORJSONResponse([project(item, fields) for item in feed])
+            set_etag_headers(selected, etag)
+            set_next_cursor(selected, object_feed_next_cursor(db, user.university, feed_version))
+            return selected
+
+        # 사용자의 대학교와 일치하는 객체들을 최신순으로 최대 25개 조회 (대학별 캐시 사용)
+        # 캐시 히트 시 캐시된 JSON(또는 미리 압축해 둔 본문)을 그대로 응답
+        if feed_version is not None:
+            cached_response = cached_json_response(request, object_feed_cache_key(user.university, feed_version))
+            if cached_response is not None:
+                set_etag_headers(cached_response, etag)
+                set_next_cursor(cached_response, object_feed_next_cursor(db, user.university, feed_version))
+                return cached_response
+        set_etag_headers(response, etag)
+        feed = refresh_object_feed(db, user.university, feed_version)
+        set_next_cursor(response, feed_cursor(feed))
+        return feed
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
@@ -50,18 +200,42 @@ async def get_object_list(request: Request):
     finally:
         db.close()
 
-@router.get("/api/v1/get_specific_object/{id}", tags=["Object"])
-async def get_specific_object(id: int, request: Request):
+def object_detail_columns(selected) -> list:
+    """상세 응답 필드에 필요한 UserObject 컬럼 (is_mine 은 created_uuid 로 계산)"""
+    columns = [name for name in selected if name != "is_mine"]
+    if "is_mine" in selected and "created_uuid" not in columns:
+        columns.append("created_uuid")
+    return [getattr(UserObject, name) for name in columns]
+
+
+def object_detail(obj, selected, current_user_uuid: str) -> dict:
+    result = row_to_dict(obj, [name for name in selected if name != "is_mine"])
+    if "is_mine" in selected:
+        # 객체를 생성한 사용자의 UUID와 현재 요청을 보낸 사용자의 UUID를 비교
+        result["is_mine"] = (obj.created_uuid == current_user_uuid)
+    return result
+
+@router.get("/api/v1/get_specific_object/{id}", response_model=ObjectDetailResponse, tags=["Object"])
+async def get_specific_object(
+    id: int,
+    request: Request,
+    fields: Optional[List[str]] = Depends(sparse_fields(OBJECT_DETAIL_FIELDS)),
+):
     """
     특정 ID의 객체 정보를 조회합니다.
     요청을 보낸 사용자가 객체의 소유주인지 여부를 'is_mine' 필드에 담아 반환합니다.
+    fields 를 지정하면 해당 컬럼만 조회합니다. (is_mine 은 created_uuid 로 계산)
     """
     try:
         # DB 세션 생성
         db: Session = SessionLocal()
 
-        # 특정 ID에 해당하는 객체를 DB에서 가져옴
-        obj = db.query(UserObject).filter(UserObject.id == id).first()
+        selected = fields or OBJECT_DETAIL_FIELDS
+
+        # 특정 ID에 해당하는 객체를 DB에서 가져옴 (필요한 컬럼만)
+        obj = db.query(*object_detail_columns(selected))\
+            .filter(UserObject.id == id)\
+            .first()
 
         if obj is None:
             raise HTTPException(status_code=404, detail="객체를 찾을 수 없습니다.")
@@ -69,23 +243,37 @@ async def get_specific_object(id: int, request: Request):
         # 미들웨어를 통해 전달된 현재 사용자의 UUID를 가져옵니다.
         current_user_uuid = request.state.user_uuid
 
-        # 객체를 생성한 사용자의 UUID와 현재 요청을 보낸 사용자의 UUID를 비교합니다.
-        is_mine_value = (obj.created_uuid == current_user_uuid)
-
         # 객체 정보와 함께 is_mine 값을 반환합니다.
-        return {
-            "id": obj.id,
-            "resource_id": obj.resource_id,
-            "created_at": obj.created_at,
-            "user_id": obj.user_id,
-            "created_uuid": obj.created_uuid,
-            "latitude": obj.latitude,
-            "longitude": obj.longitude,
-            "object_name": obj.object_name,
-            "place_name": obj.place_name,
-            "image_url": obj.image_url,
-            "is_mine": is_mine_value
-        }
+        result = object_detail(obj, selected, current_user_uuid)
+
+        return ORJSONResponse(result) if fields else result
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
+
+    finally:
+        db.close()
+
+@router.get("/api/v1/objects", tags=["Object"])
+async def get_objects(
+    request: Request,
+    ids: List[int] = Depends(batch_ids),
+    fields: Optional[List[str]] = Depends(sparse_fields(OBJECT_DETAIL_FIELDS)),
+):
+    """
+    여러 객체를 한 번에 조회합니다. (get_specific_object 의 배치 버전, IN 쿼리 한 번)
+    반환: ids 순서대로 객체 상세 목록, 없는 ID 는 {"id": ..., "not_found": true}
+    """
+    try:
+        # DB 세션 생성
+        db: Session = SessionLocal()
+
+        selected = fields or OBJECT_DETAIL_FIELDS
+        rows = db.query(*object_detail_columns(selected)).filter(UserObject.id.in_(ids)).all()
+
+        current_user_uuid = request.state.user_uuid
+        found = {row.id: object_detail(row, selected, current_user_uuid) for row in rows}
+        return ORJSONResponse(in_input_order(ids, found))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
@@ -94,7 +282,16 @@ async def get_specific_object(id: int, request: Request):
         db.close()
 
 @router.get("/api/v1/user_object_list", tags=["Object"])
-async def get_user_object_list(request: Request):
+async def get_user_object_list(
+    request: Request,
+    fields: Optional[List[str]] = Depends(sparse_fields(OBJECT_FIELDS)),
+    cursor: Optional[Cursor] = Depends(page_cursor),
+    limit: int = Depends(page_limit),
+):
+    """
+    사용자가 등록한 객체를 최신순으로 limit 개씩 반환합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더 값을 cursor 로 넘겨 이어서 조회합니다.
+    """
     try:
         # DB 세션 생성
         db: Session = SessionLocal()
@@ -102,32 +299,21 @@ async def get_user_object_list(request: Request):
         # 인증된 사용자 UUID 가져오기
         user_uuid = request.state.user_uuid
 
-        # 해당 사용자의 UUID로 등록된 객체들을 created_at 기준 최신순으로 가져옴
-        objects = db.query(UserObject)\
-            .filter(UserObject.created_uuid == user_uuid)\
-            .order_by(desc(UserObject.created_at))\
-            .all()
+        # 해당 사용자의 UUID로 등록된 객체들을 (created_at, id) 최신순으로 한 페이지 가져옴
+        # (요청한 컬럼 + 커서에 필요한 created_at)
+        selected = fields or OBJECT_FIELDS
+        objects, next_cursor = keyset_page(
+            db.query(*object_feed_columns(selected)).filter(UserObject.created_uuid == user_uuid),
+            UserObject.created_at, UserObject.id, cursor, limit,
+        )
 
         # 객체 리스트 반환
-        object_list = []
-        for obj in objects:
-            object_list.append({
-                "id": obj.id,
-                "resource_id": obj.resource_id,
-                "created_at": obj.created_at,
-                "user_id": obj.user_id,
-                "created_uuid": obj.created_uuid,
-                "latitude": obj.latitude,
-                "longitude": obj.longitude,
-                "object_name": obj.object_name,
-                "place_name": obj.place_name,
-                "image_url": obj.image_url
-            })
-
-        return object_list
+        page = ORJSONResponse([row_to_dict(obj, selected) for obj in objects])
+        set_next_cursor(page, next_cursor)
+        return page
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
 
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
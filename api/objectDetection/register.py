@@ -1,26 +1,22 @@
 import os
-import uuid
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request
 from sqlalchemy.orm import Session
 from models import SessionLocal, UserObject, User  # User 모델 임포트
+from setting.cache_namespace import OBJECT_FEED, cache_scope
+from setting.etag import bump_data_version, objects_scope
+from setting.s3_client import upload_image
+from setting.idempotency import idempotent
 from dotenv import load_dotenv
 from datetime import datetime
-import boto3
 
 load_dotenv()
 
-# S3 클라이언트 설정
-s3_client = boto3.client(
-    's3',
-    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-    region_name=os.getenv('AWS_REGION')
-)
 S3_BUCKET = os.getenv('S3_BUCKET_NAME')
 
 router = APIRouter()
 
 @router.post("/api/v1/register", tags=["Object"])
+@idempotent("object_register")
 async def register_object(
     request: Request,
     latitude: float = Form(...),
@@ -47,18 +43,7 @@ async def register_object(
         user_university = user.university  # university 데이터 가져오기
 
         # S3에 이미지 업로드
-        file_extension = imageData.filename.split('.')[-1]
-        s3_filename = f"{uuid.uuid4()}.{file_extension}"
-        imageData.file.seek(0)  # 파일 포인터를 시작 위치로 재설정
-        s3_client.upload_fileobj(
-            imageData.file,
-            S3_BUCKET,
-            s3_filename,
-            ExtraArgs={
-                'ContentType': f'image/{file_extension}',  # 적절한 MIME 타입 설정
-            }
-        )
-        image_url = f"https://{S3_BUCKET}.s3.{os.getenv('AWS_REGION')}.amazonaws.com/{s3_filename}"
+        image_url = upload_image(imageData, S3_BUCKET)
 
         # UserObject 객체 생성
         db_object = UserObject(
@@ -75,6 +60,10 @@ async def register_object(
         db.commit()
         db.refresh(db_object)
 
+        # ETag 버전과 대학별 객체 피드 캐시 버전 갱신 (이전 피드 키는 더 이상 읽히지 않음)
+        # Redis 장애로 실패하면 보류했다가 복구 후 다시 올림 (setting/etag.py)
+        bump_data_version(objects_scope(user_university), cache_scope(OBJECT_FEED, user_university))
+
         return {"id": db_object.id, "resource_id": db_object.resource_id}
 
     except Exception as e:
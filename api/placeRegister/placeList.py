@@ -1,21 +1,189 @@
 from datetime import datetime
 import random
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field # Pydantic 모델을 위해 추가
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import desc, func, distinct # distinct를 위해 추가
 from models import SessionLocal, PlaceContribution, PlaceMaster, PlaceContributionImage, User
-from typing import List, Optional # Pydantic 모델을 위해 추가
+from setting.redis_client import cache_get_json, cache_set_json
+from setting.etag import (
+    resource_etag, resource_etag_versions, places_scope, place_scope, bump_data_version,
+    etag_matches, not_modified_response, set_etag_headers,
+)
+from setting.cache_namespace import PLACE_FEED, cache_scope, namespace_version, versioned_cache_key
+from setting.sparse_fields import sparse_fields, project, row_to_dict
+from setting.batch_ids import batch_ids, in_input_order
+from setting.pagination import Cursor, MAX_PAGE_SIZE, keyset_page, page_cursor, set_next_cursor
+from typing import Dict, List, Optional # Pydantic 모델을 위해 추가
 
 router = APIRouter()
 
 # 최대 몇 개의 장소를 visible=True 로 표시할지 설정
 MAX_VISIBLE = 4
 
-@router.get("/api/v1/get_place_list", tags=["Place"])
-async def get_place_list(request: Request):
+# 대학별 장소 피드 캐시 유효 시간 (장소 등록 시 무효화됨)
+PLACE_FEED_CACHE_EXPIRATION = 600
+# 첫 페이지(캐시되는 피드)의 장소 수
+PLACE_FEED_SIZE = 25
+
+# fields= 로 선택할 수 있는 필드 (응답 순서)
+PLACE_FEED_FIELDS = ("id", "place_name", "latitude", "longitude", "contributor_count", "display")
+PLACE_CONTRIBUTION_SECTIONS = ("aggregated_data", "contributor", "indoor_images", "outdoor_images")
+PLACE_DETAIL_SECTIONS = ("base_info",) + PLACE_CONTRIBUTION_SECTIONS
+USER_PLACE_FIELDS = ("place_id", "place_name", "contributor_count", "image_url")
+
+
+# --- 응답 모델 (검증과 직렬화를 pydantic-core 에서 한 번에 처리) ---
+class PlaceFeedItem(BaseModel):
+    id: int
+    place_name: str
+    latitude: float
+    longitude: float
+    contributor_count: int
+    display: bool
+
+
+class PlaceBaseInfo(BaseModel):
+    id: int
+    place_name: str
+    latitude: float
+    longitude: float
+    university: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class PlaceContributor(BaseModel):
+    user_id: int
+    nickname: Optional[str] = None
+    provider_profile_image: Optional[str] = None
+
+
+class PlaceDetailResponse(BaseModel):
+    base_info: PlaceBaseInfo
+    aggregated_data: Dict[str, Dict[str, int]]
+    contributor: List[PlaceContributor]
+    indoor_images: List[str]
+    outdoor_images: List[str]
+
+
+def place_feed_cache_key(university: str, version: str) -> str:
+    return versioned_cache_key(PLACE_FEED, university, version)
+
+
+def place_feed_cursor_key(university: str, version: str) -> str:
+    """피드(첫 페이지) 다음 페이지 커서 (피드 항목에는 created_at 이 없어 따로 저장)"""
+    return versioned_cache_key(PLACE_FEED, university, version, "cursor")
+
+
+def fetch_place_feed(db: Session, university: str, cursor: Optional[Cursor] = None,
+                     limit: int = PLACE_FEED_SIZE, fields: Optional[List[str]] = None) -> tuple:
+    """
+    대학의 place_master 를 (created_at, id) 최신순으로 cursor 다음부터 limit 개와 기여자 수를 조회합니다.
+    (셔플/display 적용 전) 반환: (목록, 다음 커서)
+    fields 를 지정하면 해당 컬럼만 조회합니다. (contributor_count 가 없으면 place_contribution 을 join 하지 않음)
+    """
+    selected = [name for name in (fields or PLACE_FEED_FIELDS) if name != "display"]
+    columns = {
+        "id": PlaceMaster.id,
+        "place_name": PlaceMaster.place_name,
+        "latitude": PlaceMaster.latitude,
+        "longitude": PlaceMaster.longitude,
+        "contributor_count": func.count(PlaceContribution.id).label("contributor_count"),
+    }
+    # 요청한 컬럼 + 커서에 필요한 created_at
+    query = db.query(*(columns[name] for name in selected), PlaceMaster.created_at)
+    if "contributor_count" in selected:
+        query = query.outerjoin(
+            PlaceContribution,
+            PlaceContribution.place_master_id == PlaceMaster.id
+        ).group_by(PlaceMaster.id)
+    query = query.filter(PlaceMaster.university == university)
+    rows, next_cursor = keyset_page(query, PlaceMaster.created_at, PlaceMaster.id, cursor, limit)
+
+    return [row_to_dict(row, selected) for row in rows], next_cursor
+
+
+def _refresh_place_feed(db: Session, university: str, version: Optional[str]) -> tuple:
+    items, next_cursor = fetch_place_feed(db, university)
+    version = version or namespace_version(PLACE_FEED, university)
+    if version is not None:
+        cache_set_json(place_feed_cache_key(university, version), PLACE_FEED_CACHE_EXPIRATION, items)
+        # 다음 페이지가 없으면 빈 문자열 (캐시 미스와 구분)
+        cache_set_json(place_feed_cursor_key(university, version), PLACE_FEED_CACHE_EXPIRATION, next_cursor or "")
+    return items, next_cursor
+
+
+def refresh_place_feed(db: Session, university: str, version: Optional[str] = None) -> list:
+    """
+    DB에서 장소 피드를 다시 읽어 캐시에 저장합니다. (캐시 워밍업에서도 사용)
+    version: 장소 피드 네임스페이스 버전 (없으면 조회, Redis 를 사용할 수 없으면 저장하지 않음)
+    """
+    items, _ = _refresh_place_feed(db, university, version)
+    return items
+
+
+def get_place_feed(db: Session, university: str, version: Optional[str] = None) -> list:
+    version = version or namespace_version(PLACE_FEED, university)
+    if version is not None:
+        cached = cache_get_json(place_feed_cache_key(university, version))
+        if cached is not None:
+            return cached
+    return refresh_place_feed(db, university, version)
+
+
+def place_feed_next_cursor(db: Session, university: str, version: str) -> Optional[str]:
+    """캐시된 피드(첫 페이지)의 다음 페이지 커서. 없으면 None"""
+    next_cursor = cache_get_json(place_feed_cursor_key(university, version))
+    if next_cursor is None:
+        _, next_cursor = _refresh_place_feed(db, university, version)
+    return next_cursor or None
+
+
+def get_place_feed_page(db: Session, university: str, version: Optional[str] = None) -> tuple:
+    """
+    장소 피드와 다음 페이지 커서. 반환: (목록, 다음 커서 또는 None)
+    캐시 미스면 한 번 조회한 결과로 둘 다 채움 (커서 캐시는 피드가 캐시에 있을 때만 읽음)
+    """
+    version = version or namespace_version(PLACE_FEED, university)
+    if version is not None:
+        cached = cache_get_json(place_feed_cache_key(university, version))
+        if cached is not None:
+            return cached, place_feed_next_cursor(db, university, version)
+    items, next_cursor = _refresh_place_feed(db, university, version)
+    return items, next_cursor or None
+
+def displayed_place_feed(db: Session, university: str, now: datetime, version: Optional[str] = None) -> list:
+    """장소 피드를 현재 시각(hour) 기준으로 섞고 앞에서 MAX_VISIBLE 개만 display=True 로 표시합니다."""
+    # 2~3) place_master + contributor_count 조회 (대학별 캐시 사용)
+    return shuffle_for_display(get_place_feed(db, university, version), now)
+
+
+def shuffle_for_display(items: list, now: datetime, display: bool = True) -> list:
+    # 4) 현재 시간(hour) 기반으로 seed 설정 후 섞기
+    rng = random.Random(now.hour)
+    rng.shuffle(items)
+
+    # 5) 앞에서부터 MAX_VISIBLE 개수만 display=True, 나머지 False (display 필드를 요청하지 않았으면 생략)
+    if display:
+        for idx, item in enumerate(items):
+            item["display"] = idx < MAX_VISIBLE
+    return items
+
+@router.get("/api/v1/get_place_list", response_model=List[PlaceFeedItem], tags=["Place"])
+async def get_place_list(
+    request: Request,
+    response: Response,
+    fields: Optional[List[str]] = Depends(sparse_fields(PLACE_FEED_FIELDS)),
+    cursor: Optional[Cursor] = Depends(page_cursor),
+    limit: int = Query(PLACE_FEED_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
     """
     특정 사용자가 속한 university의 place_master 목록을 최신순으로 가져온다.
+    첫 페이지는 최신 25개를 섞어 앞의 MAX_VISIBLE 개만 display=True,
+    이후 페이지는 X-Next-Cursor 값을 cursor 로 넘겨 최신순으로 limit 개씩 조회한다. (display=False)
+    첫 페이지에 25 가 아닌 limit 을 지정하면 캐시 없이 최신 limit 개를 같은 방식으로 섞는다.
     반환 데이터: [
       {
         id,
@@ -37,43 +205,48 @@ async def get_place_list(request: Request):
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
         user_uni = user.university
 
-        # 2) place_master + contributor_count 조회
-        query = (
-            db.query(
-                PlaceMaster,
-                func.count(PlaceContribution.id).label("contributor_count")
-            )
-            .outerjoin(
-                PlaceContribution,
-                PlaceContribution.place_master_id == PlaceMaster.id
-            )
-            .filter(PlaceMaster.university == user_uni)
-            .group_by(PlaceMaster.id)
-            .order_by(desc(PlaceMaster.created_at))
-            .limit(25)
-        )
-        results = query.all()
-
-        # 3) dict 형태로 변환
-        items = []
-        for pm, contrib_count in results:
-            items.append({
-                "id": pm.id,
-                "place_name": pm.place_name,
-                "latitude": pm.latitude,
-                "longitude": pm.longitude,
-                "contributor_count": contrib_count,
-            })
-
-        # 4) 현재 시간(hour) 기반으로 seed 설정 후 섞기
+        # 키셋 조회 페이지는 요청한 컬럼만 조회 (display 는 요청했을 때만 표시)
+        display = not fields or "display" in fields
+
+        # 다음 페이지: 커서 위치부터 키셋 조회 (섞지 않음, 캐시/ETag 없음)
+        if cursor is not None:
+            items, next_cursor = fetch_place_feed(db, user_uni, cursor, limit, fields)
+            if display:
+                for item in items:
+                    item["display"] = False
+            page = ORJSONResponse(items)
+            set_next_cursor(page, next_cursor)
+            return page
+
+        # 캐시된 피드와 크기가 다른 첫 페이지: 최신 limit 개를 키셋 조회 후 섞음 (캐시/ETag 없음)
+        if limit != PLACE_FEED_SIZE:
+            items, next_cursor = fetch_place_feed(db, user_uni, None, limit, fields)
+            shuffle_for_display(items, datetime.now(), display)
+            page = ORJSONResponse(items)
+            set_next_cursor(page, next_cursor)
+            return page
+
+        # 대학별 장소 버전과 셔플 기준 시각(hour)이 그대로면 304
         now = datetime.now()
-        rng = random.Random(now.hour)
-        rng.shuffle(items)
-
-        # 5) 앞에서부터 MAX_VISIBLE 개수만 display=True, 나머지 False
-        for idx, item in enumerate(items):
-            item["display"] = idx < MAX_VISIBLE
-
+        # 피드 캐시 키의 네임스페이스 버전도 같은 MGET 으로 조회
+        etag, versions = resource_etag_versions(
+            "place_list", [places_scope(user_uni), cache_scope(PLACE_FEED, user_uni)], now.hour, fields)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        set_etag_headers(response, etag)
+        feed_version = versions[1] if versions else None
+
+        # 2~5) 장소 피드 조회 후 섞고 display 표시
+        items, next_cursor = get_place_feed_page(db, user_uni, feed_version)
+        shuffle_for_display(items, now)
+
+        # 필드 선택 시 캐시된 피드에서 요청한 필드만 골라 응답
+        if fields:
+            selected = ORJSONResponse([project(item, fields) for item in items])
+            set_etag_headers(selected, etag)
+            set_next_cursor(selected, next_cursor)
+            return selected
+        set_next_cursor(response, next_cursor)
         return items
 
     except Exception as e:
@@ -83,42 +256,18 @@ async def get_place_list(request: Request):
         db.close()
 
 
-@router.get("/api/v1/get_specfic_place/{place_master_id}", tags=["Place"])
-async def get_specific_place(request: Request, place_master_id: int):
+def aggregate_place_contributions(contributions, sections=PLACE_CONTRIBUTION_SECTIONS) -> dict:
     """
-    특정 place_master.id로 조회:
-      - base_info: place_master의 기본 정보
-      - aggregated_data: 각 편의시설 필드별 (값 -> 개수) 형태
-      - contributor: 기여자 목록 [ { user_id, nickname, provider_profile_image }, ... ]
+    장소의 기여 목록을 상세 응답 형태로 집계합니다.
+      - aggregated_data: 각 편의시설 필드별 (값 -> 개수)
+      - contributor: 중복 제거된 기여자 목록
       - indoor_images, outdoor_images: 이미지 URL 모음
+    sections 에 포함된 항목만 계산합니다. (필요 없는 user/images 관계는 읽지 않음)
     """
-    try:
-        db: Session = SessionLocal()
+    result = {}
 
-        # 1) place_master 조회 (+ contributions 관계를 미리 joinedload)
-        place_master = db.query(PlaceMaster)\
-            .options(joinedload(PlaceMaster.contributions).joinedload(PlaceContribution.user))\
-            .options(joinedload(PlaceMaster.contributions).joinedload(PlaceContribution.images))\
-            .filter(PlaceMaster.id == place_master_id)\
-            .first()
-
-        if not place_master:
-            raise HTTPException(status_code=404, detail="해당 place_master를 찾을 수 없습니다.")
-
-        # 2) base_info: place_master의 기본 컬럼
-        base_info = {
-            "id": place_master.id,
-            "place_name": place_master.place_name,
-            "latitude": place_master.latitude,
-            "longitude": place_master.longitude,
-            "university": place_master.university,
-            "created_at": place_master.created_at,
-            "updated_at": place_master.updated_at
-        }
-
-        contributions = place_master.contributions  # 연관된 모든 PlaceContribution
-
-        # 3) 편의시설 필드를 값별로 집계 (예: {"0": 2, "1": 3})
+    # 3) 편의시설 필드를 값별로 집계 (예: {"0": 2, "1": 3})
+    if "aggregated_data" in sections:
         fields_to_aggregate = [
             "wheele_chair_accessible",
             "rest_room_exist",
@@ -142,10 +291,12 @@ async def get_specific_place(request: Request, place_master_id: int):
                     if str_value in value_counts:
                         value_counts[str_value] += 1
             aggregated_data[field_name] = value_counts
+        result["aggregated_data"] = aggregated_data
 
-        # 4) contributor 목록 생성
-        #   - 각 contribution.user에서 user_id, nickname, provider_profile_image를 가져옴
-        #   - 중복 유저가 있을 수 있으니 dict로 중복 제거 후 list 변환
+    # 4) contributor 목록 생성
+    #   - 각 contribution.user에서 user_id, nickname, provider_profile_image를 가져옴
+    #   - 중복 유저가 있을 수 있으니 dict로 중복 제거 후 list 변환
+    if "contributor" in sections:
         contributor_dict = {}
         for contrib in contributions:
             if contrib.user:
@@ -156,10 +307,10 @@ async def get_specific_place(request: Request, place_master_id: int):
                         "nickname": u.nickname,
                         "provider_profile_image": u.provider_profile_image
                     }
+        result["contributor"] = list(contributor_dict.values())
 
-        contributor_list = list(contributor_dict.values())
-
-        # 5) 이미지(indoor/outdoor) 전체 모으기
+    # 5) 이미지(indoor/outdoor) 전체 모으기
+    if "indoor_images" in sections or "outdoor_images" in sections:
         indoor_images = []
         outdoor_images = []
 
@@ -170,15 +321,104 @@ async def get_specific_place(request: Request, place_master_id: int):
                 elif img.image_type == "outdoor":
                     outdoor_images.append(img.image_url)
 
-        # 6) 최종 응답
-        return {
-            "base_info": base_info,
-            "aggregated_data": aggregated_data,
-            "contributor": contributor_list,
-            "indoor_images": indoor_images,
-            "outdoor_images": outdoor_images
+        if "indoor_images" in sections:
+            result["indoor_images"] = indoor_images
+        if "outdoor_images" in sections:
+            result["outdoor_images"] = outdoor_images
+
+    return result
+
+
+def bump_contributed_place_versions(db: Session, user_id: int):
+    """사용자 닉네임/프로필 이미지 변경 시, 기여자 목록에 그 사용자가 보이는 장소들의 ETag 버전을 올립니다."""
+    place_ids = db.query(distinct(PlaceContribution.place_master_id))\
+        .filter(PlaceContribution.user_id == user_id)\
+        .all()
+    bump_data_version(*(place_scope(place_id) for place_id, in place_ids))
+
+
+def place_detail_options(sections, loader) -> list:
+    """
+    요청한 상세 항목에 필요한 contributions 관계 로딩 옵션.
+    loader: 단건 조회는 joinedload, 여러 장소를 한 번에 조회할 때는 selectinload (관계별 IN 쿼리 한 번)
+    """
+    options = []
+    if "contributor" in sections:
+        options.append(loader(PlaceMaster.contributions).options(loader(PlaceContribution.user)))
+    if "indoor_images" in sections or "outdoor_images" in sections:
+        options.append(loader(PlaceMaster.contributions).options(loader(PlaceContribution.images)))
+    elif "aggregated_data" in sections:
+        options.append(loader(PlaceMaster.contributions))
+    return options
+
+
+def build_place_detail(place_master: PlaceMaster, sections) -> dict:
+    """장소 상세 응답 중 sections 에 포함된 항목"""
+    detail = {}
+
+    # 2) base_info: place_master의 기본 컬럼
+    if "base_info" in sections:
+        detail["base_info"] = {
+            "id": place_master.id,
+            "place_name": place_master.place_name,
+            "latitude": place_master.latitude,
+            "longitude": place_master.longitude,
+            "university": place_master.university,
+            "created_at": place_master.created_at,
+            "updated_at": place_master.updated_at
         }
 
+    # 3~5) 편의시설 집계, 기여자 목록, 이미지 모으기
+    contribution_sections = [name for name in sections if name in PLACE_CONTRIBUTION_SECTIONS]
+    if contribution_sections:
+        contributions = place_master.contributions  # 연관된 모든 PlaceContribution
+        detail.update(aggregate_place_contributions(contributions, contribution_sections))
+    return detail
+
+@router.get("/api/v1/get_specfic_place/{place_master_id}", response_model=PlaceDetailResponse, tags=["Place"])
+async def get_specific_place(
+    request: Request,
+    place_master_id: int,
+    response: Response,
+    fields: Optional[List[str]] = Depends(sparse_fields(PLACE_DETAIL_SECTIONS, always=())),
+):
+    """
+    특정 place_master.id로 조회:
+      - base_info: place_master의 기본 정보
+      - aggregated_data: 각 편의시설 필드별 (값 -> 개수) 형태
+      - contributor: 기여자 목록 [ { user_id, nickname, provider_profile_image }, ... ]
+      - indoor_images, outdoor_images: 이미지 URL 모음
+    fields 로 항목을 고르면 필요한 관계만 join 합니다. (예: fields=base_info 는 place_master 만 조회)
+    """
+    try:
+        db: Session = SessionLocal()
+
+        # 장소 버전(기여 등록, 기여자 프로필 변경 시 갱신)이 그대로면 304
+        etag = resource_etag("place_detail", [place_scope(place_master_id)], fields)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        set_etag_headers(response, etag)
+
+        sections = fields or PLACE_DETAIL_SECTIONS
+
+        # 1) place_master 조회 (+ 요청한 항목에 필요한 contributions 관계만 미리 joinedload)
+        place_master = db.query(PlaceMaster)\
+            .options(*place_detail_options(sections, joinedload))\
+            .filter(PlaceMaster.id == place_master_id)\
+            .first()
+
+        if not place_master:
+            raise HTTPException(status_code=404, detail="해당 place_master를 찾을 수 없습니다.")
+
+        # 2~5) base_info, 편의시설 집계, 기여자 목록, 이미지 모으기
+        detail = build_place_detail(place_master, sections)
+
+        if fields:
+            selected = ORJSONResponse(detail)
+            set_etag_headers(selected, etag)
+            return selected
+        return detail
+
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -188,6 +428,34 @@ async def get_specific_place(request: Request, place_master_id: int):
         db.close()
 
 
+@router.get("/api/v1/places", tags=["Place"])
+async def get_places(
+    ids: List[int] = Depends(batch_ids),
+    fields: Optional[List[str]] = Depends(sparse_fields(PLACE_DETAIL_SECTIONS, always=())),
+):
+    """
+    여러 장소의 상세 정보를 한 번에 조회합니다. (get_specfic_place 의 배치 버전)
+    place_master 는 IN 쿼리 한 번, 기여/기여자/이미지는 관계별로 IN 쿼리 한 번씩 일괄 로딩합니다.
+    반환: ids 순서대로 [{"id": ..., base_info, aggregated_data, ...}], 없는 ID 는 {"id": ..., "not_found": true}
+    """
+    try:
+        db: Session = SessionLocal()
+
+        sections = fields or PLACE_DETAIL_SECTIONS
+        place_masters = db.query(PlaceMaster)\
+            .options(*place_detail_options(sections, selectinload))\
+            .filter(PlaceMaster.id.in_(ids))\
+            .all()
+
+        found = {pm.id: {"id": pm.id, **build_place_detail(pm, sections)} for pm in place_masters}
+        return ORJSONResponse(in_input_order(ids, found))
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
+    finally:
+        db.close()
+
+
 class UserPlaceResponseItem(BaseModel):
     place_id: int
     place_name: str
@@ -201,19 +469,30 @@ class UserPlaceResponseItem(BaseModel):
     tags=["Place"],
     summary="사용자가 기여한 장소 목록 조회"
 )
-async def user_place_list(request: Request):
+async def user_place_list(
+    request: Request,
+    response: Response,
+    fields: Optional[List[str]] = Depends(sparse_fields(USER_PLACE_FIELDS, always=("place_id",))),
+):
     """
     현재 로그인한 사용자가 정보를 기여한 장소들의 목록을 반환합니다.
+    fields 로 항목을 고르면 요청하지 않은 서브쿼리(기여자 수, 최신 이미지)는 실행하지 않습니다.
     """
     db: Session = SessionLocal()
     try:
         # 1. 현재 사용자 ID 조회
         user_uuid = request.state.user_uuid
-        user = db.query(User.id).filter(User.uuid == user_uuid).first()
+        user = db.query(User.id, User.university).filter(User.uuid == user_uuid).first()
         if not user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
         user_id = user.id
 
+        # 대학별 장소 버전(기여자 수/이미지 변경 포함)이 그대로면 304
+        etag = resource_etag("user_place_list", [places_scope(user.university)], user_id, fields)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        set_etag_headers(response, etag)
+
         # 2. 사용자가 기여한 모든 장소의 고유 ID (place_master_id) 목록 조회
         place_ids_query = db.query(distinct(PlaceContribution.place_master_id)).filter(PlaceContribution.user_id == user_id)
         place_ids = [pid for pid, in place_ids_query.all()]
@@ -240,19 +519,25 @@ async def user_place_list(request: Request):
             .as_scalar()
         )
 
-        # 5. 메인 쿼리: 위에서 얻은 장소 ID 목록과 서브쿼리들을 사용하여 최종 데이터 조회
+        # 5. 메인 쿼리: 위에서 얻은 장소 ID 목록과 서브쿼리들을 사용하여 최종 데이터 조회 (요청한 항목만)
+        selected = fields or USER_PLACE_FIELDS
+        columns = {
+            "place_id": PlaceMaster.id.label("place_id"),
+            "place_name": PlaceMaster.place_name,
+            "contributor_count": contributor_count_subquery.label("contributor_count"),
+            "image_url": image_url_subquery.label("image_url"),
+        }
         results = (
-            db.query(
-                PlaceMaster.id.label("place_id"),
-                PlaceMaster.place_name,
-                contributor_count_subquery.label("contributor_count"),
-                image_url_subquery.label("image_url")
-            )
+            db.query(*(columns[name] for name in selected))
             .filter(PlaceMaster.id.in_(place_ids))
             .order_by(desc(PlaceMaster.created_at)) # 장소의 최신 등록 순으로 정렬
             .all()
         )
 
+        if fields:
+            selected = ORJSONResponse([row_to_dict(row, fields) for row in results])
+            set_etag_headers(selected, etag)
+            return selected
         return results
 
     except Exception as e:
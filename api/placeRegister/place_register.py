@@ -1,27 +1,24 @@
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request
 from sqlalchemy.orm import Session
 from models import SessionLocal, PlaceMaster, PlaceContribution, PlaceContributionImage, User
+from setting.cache_namespace import PLACE_FEED, PLACE_INDEX, cache_scope
+from setting.etag import bump_data_version, places_scope, place_scope
+from setting.s3_client import upload_image
+from setting.idempotency import idempotent
 
-import uuid
 import os
-import boto3
 from datetime import datetime
 from typing import List
 from dotenv import load_dotenv
 
 load_dotenv()
 
-s3_client = boto3.client(
-    's3',
-    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-    region_name=os.getenv('AWS_REGION')
-)
 S3_BUCKET = os.getenv('S3_PLACE_BUCKET_NAME')
 
 router = APIRouter()
 
 @router.post("/api/v1/register_moving_data", tags=["Place"])
+@idempotent("place_register")
 async def register_moving_data(
     request: Request,
     placeName: str = Form(...),
@@ -85,16 +82,7 @@ async def register_moving_data(
         def upload_files(files, image_type):
             urls = []
             for file in files:
-                ext = file.filename.split('.')[-1]
-                s3_filename = f"{uuid.uuid4()}.{ext}"
-                file.file.seek(0)
-                s3_client.upload_fileobj(
-                    file.file,
-                    S3_BUCKET,
-                    s3_filename,
-                    ExtraArgs={'ContentType': f'image/{ext}'}
-                )
-                image_url = f"https://{S3_BUCKET}.s3.{os.getenv('AWS_REGION')}.amazonaws.com/{s3_filename}"
+                image_url = upload_image(file, S3_BUCKET)
                 # DB 저장
                 db_image = PlaceContributionImage(
                     place_contribution_id=db_contrib.id,
@@ -115,6 +103,15 @@ async def register_moving_data(
 
         db.commit()
 
+        # ETag 버전과 대학별 장소 피드/검색 인덱스 캐시 버전 갱신 (검색 응답 캐시는 places_scope 로 무효화)
+        # Redis 장애로 실패하면 보류했다가 복구 후 다시 올림 (setting/etag.py)
+        bump_data_version(
+            places_scope(user_university),
+            place_scope(place_master.id),
+            cache_scope(PLACE_FEED, user_university),
+            cache_scope(PLACE_INDEX, user_university),
+        )
+
         return {
             "place_master_id": place_master.id,
             "place_contribution_id": db_contrib.id,
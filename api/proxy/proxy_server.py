@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Request, Response, HTTPException
-import httpx
+from setting import http_client
 
 router = APIRouter()
 
@@ -17,8 +17,7 @@ async def proxy(request: Request):
 
     body = await request.body()
 
-    async with httpx.AsyncClient() as client:
-        response = await client.request(method, target_url, headers=headers, content=body)
+    response = await http_client.request(method, target_url, headers=headers, content=body)
 
     # CORS 허용을 위한 헤더를 명시적으로 추가
     custom_headers = dict(response.headers)
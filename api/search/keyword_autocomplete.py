@@ -1,152 +1,156 @@
 from fastapi import APIRouter, HTTPException, Request
-import redis
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from models import SessionLocal, PlaceMaster, User  # 변경: Place -> PlaceMaster
-from setting.redis_client import redis_client
-import json
-from typing import List
+from starlette.concurrency import run_in_threadpool
+from models import SessionLocal, PlaceMaster  # 변경: Place -> PlaceMaster
+from setting.redis_client import cache_set_json
+from setting.redis_async import cache_get_json_async, cache_set_json_async, get_async_redis
+from setting.response_cache import response_cache, user_university
+from setting.etag import places_scope
+from setting.cache_namespace import (
+    PLACE_INDEX, PLACE_SEARCH, PLACE_SEARCH_COORDS, namespace_version, namespace_version_async, versioned_cache_key,
+)
+from typing import List, Optional
 from difflib import SequenceMatcher
 
 CACHE_EXPIRATION = 3600  # 캐시 유효 시간 (1시간)
 
 router = APIRouter()
 
+
+# --- 응답 모델 ---
+class SearchPlacesResponse(BaseModel):
+    query: str
+    items: List[str]
+
+
+class PlaceCoordinatesItem(BaseModel):
+    id: int
+    place_name: str
+    latitude: float
+    longitude: float
+
+
+class SearchPlacesCoordinatesResponse(BaseModel):
+    query: str
+    items: List[PlaceCoordinatesItem]
+
+
+def place_search_scopes(university: str) -> list:
+    """검색 결과는 대학의 장소 목록에 의존 (장소 등록 시 버전 갱신)"""
+    return [places_scope(university)]
+
 def calculate_similarity(keyword: str, target: str) -> float:
     """두 문자열 간 유사도를 계산 (0~1 사이 값 반환)."""
     return SequenceMatcher(None, keyword.lower(), target.lower()).ratio()
 
-@router.get("/api/v1/search/place", tags=["Search"])
+
+def place_index_cache_key(university: str, version: str) -> str:
+    return versioned_cache_key(PLACE_INDEX, university, version)
+
+
+def fetch_place_index(db: Session, university: str) -> list:
+    """대학의 전체 장소 목록 [id, place_name, latitude, longitude] 을 조회합니다."""
+    records = db.query(
+        PlaceMaster.id,
+        PlaceMaster.place_name,
+        PlaceMaster.latitude,
+        PlaceMaster.longitude
+    ).filter(
+        PlaceMaster.university == university
+    ).all()
+    return [[pid, name, lat, lon] for pid, name, lat, lon in records]
+
+
+def refresh_place_index(db: Session, university: str, version: Optional[str] = None) -> list:
+    """장소 검색 인덱스를 다시 읽어 캐시에 저장합니다. (캐시 워밍업에서도 사용)"""
+    records = fetch_place_index(db, university)
+    version = version or namespace_version(PLACE_INDEX, university)
+    if version is not None:
+        cache_set_json(place_index_cache_key(university, version), CACHE_EXPIRATION, records)
+    return records
+
+
+def load_place_index(university: str) -> list:
+    """새 세션으로 장소 인덱스를 DB 에서 읽습니다. (스레드풀에서 실행)"""
+    db: Session = SessionLocal()
+    try:
+        return fetch_place_index(db, university)
+    finally:
+        db.close()
+
+
+async def get_place_index_async(request: Request, university: str) -> list:
+    """
+    키워드 캐시 미스 시 MySQL LIKE 검색 대신 사용하는 대학별 장소 인덱스.
+    캐시는 app.state.redis 로, DB 조회는 스레드풀에서 처리해 응답 캐시 미스에서도 이벤트 루프를 막지 않습니다.
+    """
+    client = get_async_redis(request)
+    version = await namespace_version_async(client, PLACE_INDEX, university) if client is not None else None
+    if version is not None:
+        cached = await cache_get_json_async(client, place_index_cache_key(university, version))
+        if cached is not None:
+            return cached
+    records = await run_in_threadpool(load_place_index, university)
+    if version is not None:
+        await cache_set_json_async(client, place_index_cache_key(university, version), CACHE_EXPIRATION, records)
+    return records
+
+
+async def user_place_index(request: Request) -> list:
+    """인증된 사용자 대학의 장소 인덱스"""
+    university = await user_university(request.state.user_uuid)
+    if university is None:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    return await get_place_index_async(request, university)
+
+
+def match_places(records: list, keyword: str) -> list:
+    """장소명에 키워드가 포함된 레코드를 유사도 순으로 정렬합니다."""
+    keyword_lower = keyword.lower()
+    matched = [record for record in records if keyword_lower in record[1].lower()]
+    return sorted(
+        matched,
+        key=lambda record: calculate_similarity(keyword, record[1]),
+        reverse=True
+    )
+
+@router.get("/api/v1/search/place", response_model=SearchPlacesResponse, tags=["Search"])
+@response_cache(PLACE_SEARCH, ttl=CACHE_EXPIRATION, scopes=place_search_scopes)
 async def search_places(
     request: Request,
     keyword: str,
     limit: int = 10
 ):
     try:
-        # 인증된 사용자 UUID
-        user_uuid = request.state.user_uuid
-        
-        db: Session = SessionLocal()
-        
-        # 사용자 조회
-        user = db.query(User).filter(User.uuid == user_uuid).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-        
-        # 캐시 키
-        cache_key = f"place_search:{user.university}:{keyword}"
-        
-        # 캐시 확인
-        cached_result = redis_client.get(cache_key)
-        if cached_result:
-            return {
-                "query": keyword,
-                "items": json.loads(cached_result)
-            }
-        
-        # DB에서 검색 - PlaceMaster 사용
-        # status 컬럼이 없으므로, status=='Active' 조건 제거
-        places_query = db.query(PlaceMaster.place_name)\
-            .filter(
-                PlaceMaster.university == user.university,
-                func.lower(PlaceMaster.place_name).contains(func.lower(keyword))
-            )\
-            .distinct()
-        
-        places = places_query.all()  # [(place_name,), (place_name,)...] 형태
-        
-        # 유사도 정렬
-        place_names = [p[0] for p in places]  # 실제 문자열 리스트
-        sorted_places = sorted(
-            place_names,
-            key=lambda pname: calculate_similarity(keyword, pname),
-            reverse=True
-        )
+        # 인증된 사용자 대학의 장소 인덱스에서 검색 후 유사도 정렬 (장소명 중복 제거)
+        matched = match_places(await user_place_index(request), keyword)
+        sorted_places = list(dict.fromkeys(record[1] for record in matched))
         
         # 제한
         result = sorted_places[:limit]
         
-        # 캐싱
-        redis_client.setex(cache_key, CACHE_EXPIRATION, json.dumps(result))
-        
         return {
             "query": keyword,
             "items": result
         }
     
-    except redis.RedisError:
-        # Redis 오류 시, DB 결과만
-        places_query = db.query(PlaceMaster.place_name)\
-            .filter(
-                PlaceMaster.university == user.university,
-                func.lower(PlaceMaster.place_name).contains(func.lower(keyword))
-            )\
-            .distinct()
-        
-        places = places_query.all()
-        place_names = [p[0] for p in places]
-        sorted_places = sorted(
-            place_names,
-            key=lambda pname: calculate_similarity(keyword, pname),
-            reverse=True
-        )
-        
-        return {
-            "query": keyword,
-            "items": sorted_places[:limit]
-        }
-    
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {str(e)}")
-    
-    finally:
-        db.close()
 
 
-@router.get("/api/v1/search/place/coordinates", tags=["Search"])
+@router.get("/api/v1/search/place/coordinates", response_model=SearchPlacesCoordinatesResponse, tags=["Search"])
+@response_cache(PLACE_SEARCH_COORDS, ttl=CACHE_EXPIRATION, scopes=place_search_scopes)
 async def search_places_coordinates(
     request: Request,
     keyword: str,
     limit: int = 10
 ):
     try:
-        # 1) 인증된 사용자 UUID
-        user_uuid = request.state.user_uuid
-        db: Session = SessionLocal()
-
-        # 2) 사용자 조회
-        user = db.query(User).filter(User.uuid == user_uuid).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-
-        # 3) 캐시 키
-        cache_key = f"place_search_coords:{user.university}:{keyword}"
-        cached = redis_client.get(cache_key)
-        if cached:
-            return {
-                "query": keyword,
-                "items": json.loads(cached)
-            }
+        # 1~4) 사용자 대학의 장소 인덱스(id, place_name, latitude, longitude)에서 검색 후 유사도 정렬
+        sorted_records = match_places(await user_place_index(request), keyword)[:limit]
 
-        # 4) DB에서 id, place_name, latitude, longitude 함께 조회
-        records = db.query(
-            PlaceMaster.id,
-            PlaceMaster.place_name,
-            PlaceMaster.latitude,
-            PlaceMaster.longitude
-        ).filter(
-            PlaceMaster.university == user.university,
-            func.lower(PlaceMaster.place_name).contains(func.lower(keyword))
-        ).distinct().all()
-
-        # 5) 유사도 계산 후 정렬 (name이 튜플의 두 번째 요소이므로 x[1] 사용)
-        sorted_records = sorted(
-            records,
-            key=lambda x: calculate_similarity(keyword, x[1]),
-            reverse=True
-        )[:limit]
-
-        # 6) dict 형태로 가공 (id 포함)
+        # 5) dict 형태로 가공 (id 포함)
         items = [
             {
                 "id": pid,
@@ -157,42 +161,7 @@ async def search_places_coordinates(
             for pid, name, lat, lon in sorted_records
         ]
 
-        # 7) 캐싱
-        redis_client.setex(cache_key, CACHE_EXPIRATION, json.dumps(items))
-
-        return {"query": keyword, "items": items}
-
-    except redis.RedisError:
-        # Redis 오류 발생 시 DB 결과만 반환
-        records = db.query(
-            PlaceMaster.id,
-            PlaceMaster.place_name,
-            PlaceMaster.latitude,
-            PlaceMaster.longitude
-        ).filter(
-            PlaceMaster.university == user.university,
-            func.lower(PlaceMaster.place_name).contains(func.lower(keyword))
-        ).distinct().all()
-
-        sorted_records = sorted(
-            records,
-            key=lambda x: calculate_similarity(keyword, x[1]),
-            reverse=True
-        )[:limit]
-
-        items = [
-            {
-                "id": pid,
-                "place_name": name,
-                "latitude": lat,
-                "longitude": lon
-            }
-            for pid, name, lat, lon in sorted_records
-        ]
         return {"query": keyword, "items": items}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다: {e}")
-
-    finally:
-        db.close()
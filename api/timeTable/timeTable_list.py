@@ -1,13 +1,85 @@
-from fastapi import APIRouter, HTTPException, Request
+from datetime import datetime, time
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from models import SessionLocal, UserTimetable
 from sqlalchemy import and_
+from setting.etag import resource_etag, timetable_scope, etag_matches, not_modified_response, set_etag_headers
+from setting.sparse_fields import sparse_fields
 
 router = APIRouter()
 
-@router.get("/api/v1/timetable", tags=["Timetable"])
-async def get_user_timetable(request: Request):
-    """유저의 시간표 데이터를 조회하는 기능"""
+# fields= 로 선택할 수 있는 필드 (응답 순서)
+TIMETABLE_FIELDS = ("id", "lname", "day", "start_time", "end_time", "classroom", "created_at", "updated_at")
+# 겹침 판정에 필요한 컬럼 (응답 필드와 관계없이 조회)
+TIMETABLE_SPAN_FIELDS = ("day", "start_time", "end_time")
+
+
+# --- 응답 모델 (검증과 직렬화를 pydantic-core 에서 한 번에 처리) ---
+class TimetableItem(BaseModel):
+    id: int
+    lname: str
+    day: str
+    start_time: time
+    end_time: time
+    classroom: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class TimetableEmptyResponse(BaseModel):
+    message: str
+
+
+def dedupe_timetables(timetables, fields=TIMETABLE_FIELDS) -> list:
+    """
+    최신순으로 정렬된 시간표에서 같은 요일에 이미 선택된 강의와 시간이 겹치는 강의를 제외합니다.
+    (겹치는 경우 더 최근에 등록된 강의가 남음)
+    fields: 결과에 담을 필드 (day/start_time/end_time 은 응답에 없어도 겹침 판정에 사용)
+    """
+    result = []
+    time_slots = {}
+
+    for timetable in timetables:
+        day = timetable.day
+        start_time = timetable.start_time
+        end_time = timetable.end_time
+
+        # 중복된 시간대가 있는지 확인
+        is_overlapping = False
+        for saved_start, saved_end, _ in time_slots.get(day, []):
+            if (start_time < saved_end and end_time > saved_start):
+                is_overlapping = True
+                break
+
+        # 겹치는 시간이 없거나 가장 최신 데이터라면 저장
+        if not is_overlapping:
+            if day not in time_slots:
+                time_slots[day] = []
+
+            time_slots[day].append(
+                (start_time, end_time, {name: getattr(timetable, name) for name in fields})
+            )
+
+    # 시간대별로 최신 데이터를 result에 추가
+    for day, schedules in time_slots.items():
+        result.extend(entry for _, _, entry in schedules)
+
+    return result
+
+@router.get(
+    "/api/v1/timetable",
+    response_model=Union[List[TimetableItem], TimetableEmptyResponse],
+    tags=["Timetable"]
+)
+async def get_user_timetable(
+    request: Request,
+    response: Response,
+    fields: Optional[List[str]] = Depends(sparse_fields(TIMETABLE_FIELDS)),
+):
+    """유저의 시간표 데이터를 조회하는 기능 (fields 로 응답 필드 선택)"""
     
     try:
         # 인증된 사용자 UUID 가져오기 (미들웨어에서 이미 처리된 부분)
@@ -18,48 +90,29 @@ async def get_user_timetable(request: Request):
         # DB 세션 생성
         db: Session = SessionLocal()
 
-        # 유저의 Active 상태의 시간표 데이터 조회
-        timetables = db.query(UserTimetable).filter(
+        # 시간표 버전이 그대로면 304 (DB 조회 생략)
+        etag = resource_etag("timetable", [timetable_scope(user_uuid)], fields)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        set_etag_headers(response, etag)
+
+        # 유저의 Active 상태의 시간표 데이터 조회 (응답 필드 + 겹침 판정 컬럼만 SELECT)
+        selected = fields or TIMETABLE_FIELDS
+        columns = [name for name in TIMETABLE_FIELDS if name in selected or name in TIMETABLE_SPAN_FIELDS]
+        timetables = db.query(*(getattr(UserTimetable, name) for name in columns)).filter(
             and_(UserTimetable.created_uuid == user_uuid, UserTimetable.user_object_status == 'Active')
         ).order_by(UserTimetable.updated_at.desc(), UserTimetable.id.desc()).all()
 
         # 조회된 시간표 데이터에서 중복 시간 처리
-        result = []
-        time_slots = {}
-
-        for timetable in timetables:
-            day = timetable.day
-            start_time = timetable.start_time
-            end_time = timetable.end_time
-
-            # 중복된 시간대가 있는지 확인
-            is_overlapping = False
-            for saved_timetable in time_slots.get(day, []):
-                if (start_time < saved_timetable['end_time'] and end_time > saved_timetable['start_time']):
-                    is_overlapping = True
-                    break
-
-            # 겹치는 시간이 없거나 가장 최신 데이터라면 저장
-            if not is_overlapping:
-                if day not in time_slots:
-                    time_slots[day] = []
-                
-                time_slots[day].append({
-                    "id": timetable.id,
-                    "lname": timetable.lname,
-                    "day": timetable.day,
-                    "start_time": timetable.start_time,
-                    "end_time": timetable.end_time,
-                    "classroom": timetable.classroom,
-                    "created_at": timetable.created_at,
-                    "updated_at": timetable.updated_at,
-                })
-
-        # 시간대별로 최신 데이터를 result에 추가
-        for day, schedules in time_slots.items():
-            result.extend(schedules)
-
-        return result if result else {"message": "No timetable data found for this user."}
+        result = dedupe_timetables(timetables, selected)
+
+        if not result:
+            return {"message": "No timetable data found for this user."}
+        if fields:
+            selected = ORJSONResponse(result)
+            set_etag_headers(selected, etag)
+            return selected
+        return result
 
     except HTTPException as e:
         raise e
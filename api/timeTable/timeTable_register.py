@@ -1,27 +1,40 @@
-import json, os, random, uuid, boto3, requests, xml.etree.ElementTree as ET
+import json, os, random, httpx, xml.etree.ElementTree as ET
 from dotenv import load_dotenv
 from fastapi import APIRouter, File, Form, HTTPException, Request, UploadFile
-from openai import OpenAI
+from openai import AsyncOpenAI
 from sqlalchemy.orm import Session
 from models import SessionLocal, UserTimetable
 from datetime import time
+from setting import http_client
+from setting.s3_client import upload_image
+from setting.etag import bump_data_version, timetable_scope
+from setting.idempotency import idempotent
 
 
 router = APIRouter()
 
 load_dotenv()
 
-# S3 클라이언트 설정(유저 시간표 이미지를 저장할 버킷)
-s3_client = boto3.client(
-    's3',
-    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
-    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-    region_name=os.getenv('AWS_REGION')
-)
+# 유저 시간표 이미지를 저장할 버킷
 S3_BUCKET = os.getenv('S3_USER_TIMETABLE_BUCKET_NAME')
 
 # OpenAI API 키 설정
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
+OPENAI_TIMEOUT = float(os.getenv('OPENAI_TIMEOUT', 60))  # 이미지 분석은 일반 외부 호출보다 오래 걸림
+
+_openai_client = None
+
+def get_openai_client() -> AsyncOpenAI:
+    """공용 HTTP 클라이언트를 사용하는 OpenAI 클라이언트 (워커당 1개)"""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=http_client.get_http_client(),
+            timeout=httpx.Timeout(OPENAI_TIMEOUT, connect=http_client.HTTP_CONNECT_TIMEOUT),
+            max_retries=2
+        )
+    return _openai_client
 
 # OpenAI API 요청 시 사용할 프롬프트 (영어로 번역)
 gpt_prompt = """
@@ -74,6 +87,9 @@ def save_timetable(db: Session, user_uuid: str, lname: str, day: str, start_time
         db.commit()
         db.refresh(new_timetable)
 
+        # 시간표 조회 ETag 버전 갱신
+        bump_data_version(timetable_scope(user_uuid))
+
         return new_timetable
 
     except Exception as e:
@@ -136,6 +152,7 @@ async def register_individual_timetable(
 
 
 @router.post("/api/v1/timetable/regByImage", tags=["Timetable"])
+@idempotent("timetable_image_register")
 async def register_timetable_by_image(
     request: Request,
     timeTable_image: UploadFile = File(...)
@@ -150,25 +167,12 @@ async def register_timetable_by_image(
             raise HTTPException(status_code=401, detail="Invalid user.")
 
         # 이미지 파일을 S3에 업로드
-        file_extension = timeTable_image.filename.split('.')[-1]
-        s3_filename = f"{uuid.uuid4()}.{file_extension}"
-        timeTable_image.file.seek(0)
-        s3_client.upload_fileobj(
-            timeTable_image.file,
-            S3_BUCKET,
-            s3_filename,
-            ExtraArgs={
-                'ContentType': f'image/{file_extension}'
-            }
-        )
-        image_url = f"https://{S3_BUCKET}.s3.{os.getenv('AWS_REGION')}.amazonaws.com/{s3_filename}"
+        image_url = upload_image(timeTable_image, S3_BUCKET)
 
         # OpenAI API를 통해 이미지에서 시간표 정보 추출
-        client = OpenAI(
-            api_key=OPENAI_API_KEY
-        )
+        client = get_openai_client()
 
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o",
             temperature=0.1,
             response_format={"type": "json_object"},
@@ -291,7 +295,7 @@ async def register_timetable_by_url(
     }
 
     # 외부 API 요청 보내기
-    response = requests.post("https://api.everytime.kr/find/timetable/table/friend", headers=headers, data=payload)
+    response = await http_client.request("POST", "https://api.everytime.kr/find/timetable/table/friend", headers=headers, data=payload)
 
     # 응답 검증
     if response.status_code != 200:
@@ -3,6 +3,8 @@ from sqlalchemy.orm import Session
 from data.university_KorEng import UNIVERSITY_KOR_ENG_DATA  # 대학 한글-영문 데이터
 from data.university_info import UNIVERSITY_INFO
 from models import SessionLocal, User  # User 모델 임포트
+from api.placeRegister.placeList import bump_contributed_place_versions
+from setting.response_cache import forget_user_university
 from datetime import datetime
 from typing import Optional
 
@@ -49,6 +51,13 @@ async def update_user_info(
         db.commit()
         db.refresh(user)  # 업데이트된 사용자 정보 반환
 
+        # 장소 상세의 기여자 목록에 닉네임이 보이므로 해당 장소들의 ETag 버전 갱신
+        if nickname is not None:
+            bump_contributed_place_versions(db, user.id)
+        # 응답 캐시의 대학 조회 결과 갱신
+        if university is not None:
+            forget_user_university(user_uuid)
+
         return {
             "uuid": user.uuid,
             "nickname": user.nickname,
@@ -98,6 +107,9 @@ async def register_complete(
         # 변경 사항 커밋
         db.commit()
         db.refresh(user)  # 업데이트된 정보 반환 준비
+        # 장소 상세의 기여자 목록에 닉네임이 보이므로 해당 장소들의 ETag 버전 갱신 (재가입 등으로 기여가 남아 있는 경우)
+        bump_contributed_place_versions(db, user.id)
+        forget_user_university(user_uuid)
 
         return {
             "uuid": user.uuid,
@@ -116,6 +128,50 @@ async def register_complete(
         db.close()
 
 
+def build_user_info(user: User) -> dict:
+    """유저 정보 조회 응답 (bootstrap 에서도 사용)"""
+    # 유저 정보 (nickname, university, profile_number, provider_profile_image, provider_type) 가져오기
+    user_info = {
+        "uuid": user.uuid,
+        "nickname": user.nickname,
+        "email": user.email,
+        "university": user.university,
+        "profile_number": user.profile_number,
+        "provider_profile_image": user.provider_profile_image,
+        "provider_type": user.provider_type  # provider_type 추가
+    }
+
+    # university 정보가 있으면 위치 정보도 개별 필드로 추가
+    if user.university and user.university in UNIVERSITY_INFO:
+        university_location = UNIVERSITY_INFO.get(user.university)
+        user_info.update({
+            "univ_sw_lat": university_location.get("sw_lat"),
+            "univ_sw_lng": university_location.get("sw_lng"),
+            "univ_ne_lat": university_location.get("ne_lat"),
+            "univ_ne_lng": university_location.get("ne_lng"),
+            "univ_center_lat": university_location.get("center_lat"),
+            "univ_center_lng": university_location.get("center_lng"),
+        })
+    else:
+        # university가 없거나 위치 정보가 없는 경우 위치 필드를 None으로 설정
+        user_info.update({
+            "univ_sw_lat": None,
+            "univ_sw_lng": None,
+            "univ_ne_lat": None,
+            "univ_ne_lng": None,
+            "univ_center_lat": None,
+            "univ_center_lng": None
+        })
+
+    # university를 한글로 변환
+    for kor_name, eng_name in UNIVERSITY_KOR_ENG_DATA.items():
+        if user_info["university"] == eng_name:
+            user_info["university"] = kor_name
+            break
+
+    return user_info
+
+
 # 유저 정보 조회
 @router.get("/api/v1/userinfo/inquire", tags=["User"])
 async def inquire_user_info(request: Request):
@@ -129,46 +185,7 @@ async def inquire_user_info(request: Request):
         if not user:
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-        # 유저 정보 (nickname, university, profile_number, provider_profile_image, provider_type) 가져오기
-        user_info = {
-            "uuid": user.uuid,
-            "nickname": user.nickname,
-            "email": user.email,
-            "university": user.university,
-            "profile_number": user.profile_number,
-            "provider_profile_image": user.provider_profile_image,
-            "provider_type": user.provider_type  # provider_type 추가
-        }
-
-        # university 정보가 있으면 위치 정보도 개별 필드로 추가
-        if user.university and user.university in UNIVERSITY_INFO:
-            university_location = UNIVERSITY_INFO.get(user.university)
-            user_info.update({
-                "univ_sw_lat": university_location.get("sw_lat"),
-                "univ_sw_lng": university_location.get("sw_lng"),
-                "univ_ne_lat": university_location.get("ne_lat"),
-                "univ_ne_lng": university_location.get("ne_lng"),
-                "univ_center_lat": university_location.get("center_lat"),
-                "univ_center_lng": university_location.get("center_lng"),
-            })
-        else:
-            # university가 없거나 위치 정보가 없는 경우 위치 필드를 None으로 설정
-            user_info.update({
-                "univ_sw_lat": None,
-                "univ_sw_lng": None,
-                "univ_ne_lat": None,
-                "univ_ne_lng": None,
-                "univ_center_lat": None,
-                "univ_center_lng": None
-            })
-
-        # university를 한글로 변환
-        for kor_name, eng_name in UNIVERSITY_KOR_ENG_DATA.items():
-            if user_info["university"] == eng_name:
-                user_info["university"] = kor_name
-                break
-
-        return user_info
+        return build_user_info(user)
 
     except HTTPException as e:
         raise e  # 이미 발생한 HTTPException을 그대로 다시 발생시킴
@@ -0,0 +1,351 @@
+# 벤치마크 케이스
+#
+# 각 케이스는 준비 작업을 마친 뒤 run(n) 함수를 반환한다. run(n) 은 측정 대상을 n 번 실행한다.
+# 준비(데이터 생성, 토큰 발급 등)는 측정 시간에 포함되지 않는다.
+# SQLite/파일 I/O 를 거치는 케이스는 디스크·페이지 캐시 상태에 따라 편차가 커서 회귀 허용 범위를 넓게 둔다.
+
+import asyncio
+import io
+import random
+from datetime import datetime, time as dtime, timedelta
+from types import SimpleNamespace
+
+BENCHMARKS = {}
+TOLERANCES = {}     # 케이스별 회귀 허용 비율 (없으면 run.py 의 --tolerance)
+IO_TOLERANCE = 1.0  # SQLite/로컬 S3 케이스: baseline 의 2배 이상 느려질 때만 회귀
+
+UNIVERSITY = "KONKUK_SEOUL"
+USER_UUID = "U20240101999999999999"
+PLACE_COUNT = 2000
+CONTRIBUTIONS_PER_PLACE = 40
+TIMETABLE_ROWS = 60
+
+_PLACE_PREFIXES = ["공학", "인문", "경영", "생명과학", "예술디자인", "법학", "수의학", "새천년", "상허", "산학협동"]
+_PLACE_SUFFIXES = ["관", "관 A동", "관 B동", "도서관", "학생회관", "기숙사", "연구동", "체육관"]
+
+
+def benchmark(name: str, tolerance: float = None):
+    def decorator(func):
+        BENCHMARKS[name] = func
+        if tolerance is not None:
+            TOLERANCES[name] = tolerance
+        return func
+    return decorator
+
+
+def _run_async(loop, make_coro):
+    def run(n):
+        async def batch():
+            for _ in range(n):
+                await make_coro()
+        loop.run_until_complete(batch())
+    return run
+
+
+def place_names(count: int = PLACE_COUNT) -> list:
+    rng = random.Random(42)
+    return [f"{rng.choice(_PLACE_PREFIXES)}{rng.choice(_PLACE_SUFFIXES)} {i}" for i in range(count)]
+
+
+def make_timetables(count: int = TIMETABLE_ROWS) -> list:
+    """최신순으로 정렬된, 일부가 서로 겹치는 시간표 행"""
+    from models import UserTimetable
+    rng = random.Random(7)
+    now = datetime(2024, 3, 1)
+    rows = []
+    for i in range(count):
+        start_hour = rng.randint(9, 17)
+        rows.append(UserTimetable(
+            id=count - i,
+            lname=f"강의 {i}",
+            day=rng.choice(["월", "화", "수", "목", "금"]),
+            start_time=dtime(start_hour, rng.choice([0, 30])),
+            end_time=dtime(start_hour + rng.randint(1, 2), 15),
+            classroom=f"공학관 {rng.randint(100, 500)}호",
+            created_uuid=USER_UUID,
+            created_at=now - timedelta(days=i),
+            updated_at=now - timedelta(days=i),
+        ))
+    return rows
+
+
+def make_contributions(count: int = CONTRIBUTIONS_PER_PLACE, place_master_id: int = None) -> list:
+    """사용자/이미지 관계가 채워진 PlaceContribution 목록"""
+    from models import PlaceContribution, PlaceContributionImage, User
+    rng = random.Random(11)
+    users = [
+        User(id=i + 1, uuid=f"U20240101{i + 1:011d}", nickname=f"user{i}", provider_id=str(i),
+             provider_profile_image=f"https://example.com/profile/{i}.png", university=UNIVERSITY)
+        for i in range(10)
+    ]
+    contributions = []
+    for i in range(count):
+        contribution = PlaceContribution(
+            place_master_id=place_master_id,
+            wheele_chair_accessible=rng.randint(1, 3),
+            rest_room_exist=rng.randint(0, 2),
+            rest_room_floor=rng.randint(0, 3),
+            elevator_accessible=rng.randint(0, 2),
+            ramp_accessible=rng.choice([None, 0, 1, 2, 3]),
+        )
+        contribution.user = users[i % len(users)]
+        contribution.images = [
+            PlaceContributionImage(image_url=f"https://example.com/{i}/{kind}.jpg", image_type=kind)
+            for kind in ("indoor", "outdoor")
+        ]
+        contributions.append(contribution)
+    return contributions
+
+
+def seed_database():
+    """SQLite 에 사용자, 장소/기여, 시간표 데이터를 채웁니다."""
+    from models import SessionLocal, PlaceMaster, User
+    db = SessionLocal()
+    try:
+        db.add(User(id=100, uuid=USER_UUID, nickname="bench", provider_id="bench", university=UNIVERSITY))
+        for timetable in make_timetables():
+            timetable.id = None
+            db.add(timetable)
+
+        places = [
+            PlaceMaster(place_name=name, latitude=37.54, longitude=127.07, university=UNIVERSITY)
+            for name in place_names()
+        ]
+        db.add_all(places)
+        db.flush()
+
+        db.add_all(make_contributions(place_master_id=places[0].id))
+        db.commit()
+        return places[0].id
+    finally:
+        db.close()
+
+
+@benchmark("authentication_middleware")
+def bench_authentication_middleware(ctx):
+    from fastapi import Request, Response
+    from middleware import authentication_middleware
+    from api.tokens.token_management import create_access_token
+
+    token = create_access_token(USER_UUID)
+    headers = [(b"authorization", f"Bearer {token}".encode())]
+    response = Response()
+
+    async def call_next(request):
+        return response
+
+    def make_coro():
+        scope = {"type": "http", "method": "GET", "path": "/api/v1/get_place_list",
+                 "query_string": b"", "headers": headers}
+        return authentication_middleware(Request(scope), call_next)
+
+    return _run_async(ctx.loop, make_coro)
+
+
+@benchmark("verify_access_token")
+def bench_verify_access_token(ctx):
+    from api.tokens.token_management import create_access_token, verify_access_token
+    token = create_access_token(USER_UUID)
+
+    def run(n):
+        for _ in range(n):
+            verify_access_token(token)
+    return run
+
+
+@benchmark("create_access_token")
+def bench_create_access_token(ctx):
+    from api.tokens.token_management import create_access_token
+
+    def run(n):
+        for _ in range(n):
+            create_access_token(USER_UUID)
+    return run
+
+
+@benchmark("search_similarity_ranking")
+def bench_search_similarity_ranking(ctx):
+    from api.search.keyword_autocomplete import match_places
+    records = [[i, name, 37.54, 127.07] for i, name in enumerate(place_names())]
+
+    def run(n):
+        for _ in range(n):
+            match_places(records, "공학")
+    return run
+
+
+@benchmark("timetable_dedupe")
+def bench_timetable_dedupe(ctx):
+    from api.timeTable.timeTable_list import dedupe_timetables
+    timetables = make_timetables()
+
+    def run(n):
+        for _ in range(n):
+            dedupe_timetables(timetables)
+    return run
+
+
+@benchmark("place_contribution_aggregation")
+def bench_place_contribution_aggregation(ctx):
+    from api.placeRegister.placeList import aggregate_place_contributions
+    contributions = make_contributions()
+
+    def run(n):
+        for _ in range(n):
+            aggregate_place_contributions(contributions)
+    return run
+
+
+@benchmark("generate_uuid")
+def bench_generate_uuid(ctx):
+    from models import generate_uuid
+    now = datetime.utcnow()
+
+    def run(n):
+        for i in range(n):
+            generate_uuid("UO", now, i)
+    return run
+
+
+@benchmark("get_specific_place_sqlite", tolerance=IO_TOLERANCE)
+def bench_get_specific_place_sqlite(ctx):
+    from fastapi import Response
+    from api.placeRegister.placeList import get_specific_place
+    request = SimpleNamespace(state=SimpleNamespace(user_uuid=USER_UUID), headers={})
+    return _run_async(ctx.loop, lambda: get_specific_place(request, ctx.place_master_id, Response(), fields=None))
+
+
+@benchmark("get_places_batch_20_sqlite", tolerance=IO_TOLERANCE)
+def bench_get_places_batch_20_sqlite(ctx):
+    from api.placeRegister.placeList import get_places
+    ids = list(range(ctx.place_master_id, ctx.place_master_id + 20))
+    return _run_async(ctx.loop, lambda: get_places(ids=ids, fields=None))
+
+
+@benchmark("get_user_timetable_sqlite", tolerance=IO_TOLERANCE)
+def bench_get_user_timetable_sqlite(ctx):
+    from fastapi import Response
+    from api.timeTable.timeTable_list import get_user_timetable
+    request = SimpleNamespace(state=SimpleNamespace(user_uuid=USER_UUID), headers={})
+    return _run_async(ctx.loop, lambda: get_user_timetable(request, Response(), fields=None))
+
+
+@benchmark("bootstrap_sqlite", tolerance=IO_TOLERANCE)
+def bench_bootstrap_sqlite(ctx):
+    from api.bootstrap.app_bootstrap import bootstrap
+    request = SimpleNamespace(state=SimpleNamespace(user_uuid=USER_UUID), headers={})
+    return _run_async(ctx.loop, lambda: bootstrap(request, fields=None))
+
+
+@benchmark("search_places_cache_hit")
+def bench_search_places_cache_hit(ctx):
+    from fastapi import Request
+    from api.search.keyword_autocomplete import search_places
+    from setting.redis_async import create_async_redis
+
+    # 응답 캐시는 app.state.redis(asyncio 클라이언트)를 사용
+    app = SimpleNamespace(state=SimpleNamespace(redis=create_async_redis()))
+
+    def call():
+        # 응답 캐시 데코레이터가 경로/쿼리/사용자로 키를 만들므로 실제 Request 사용
+        request = Request({
+            "type": "http", "method": "GET", "path": "/api/v1/search/place",
+            "query_string": "keyword=공학&limit=10".encode(), "headers": [],
+            "state": {"user_uuid": USER_UUID}, "app": app,
+        })
+        return search_places(request=request, keyword="공학", limit=10)
+
+    ctx.loop.run_until_complete(call())   # 캐시 채우기
+    return _run_async(ctx.loop, call)
+
+
+def make_object_feed(count: int) -> list:
+    """get_object_list 응답 형태의 객체 목록"""
+    now = datetime(2024, 3, 1)
+    return [
+        {
+            "id": i,
+            "resource_id": f"UO20240301{i:011d}",
+            "created_at": (now - timedelta(minutes=i)).isoformat(),
+            "user_id": i % 50,
+            "created_uuid": f"U20240101{i % 50:011d}",
+            "latitude": 37.54 + i * 1e-5,
+            "longitude": 127.07 + i * 1e-5,
+            "object_name": f"위험 요소 {i}",
+            "place_name": f"공학관 {i % 20}",
+            "image_url": f"https://example.com/objects/{i}.jpg",
+        }
+        for i in range(count)
+    ]
+
+
+def _serialization_benchmark(ctx, count: int, fast: bool):
+    """
+    FastAPI 가 엔드포인트 반환값을 응답 본문으로 만드는 과정(serialize_response + render)
+      - fast=False: 응답 모델 없이 jsonable_encoder + 표준 json (기존 경로)
+      - fast=True: 응답 모델 검증/직렬화 + orjson (현재 경로)
+    """
+    from typing import List
+    from fastapi.responses import JSONResponse, ORJSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+    from api.objectDetection.objectList import ObjectFeedItem
+
+    payload = make_object_feed(count)
+    field = create_model_field("Response_get_object_list", List[ObjectFeedItem]) if fast else None
+    response_class = ORJSONResponse if fast else JSONResponse
+
+    async def serialize():
+        content = await serialize_response(field=field, response_content=payload)
+        return response_class(content).body
+
+    return _run_async(ctx.loop, serialize)
+
+
+def _register_serialization_benchmarks():
+    for count in (25, 1000):
+        for suffix, fast in (("stdlib", False), ("orjson", True)):
+            benchmark(f"serialize_object_feed_{count}_{suffix}")(
+                lambda ctx, count=count, fast=fast: _serialization_benchmark(ctx, count, fast))
+
+
+_register_serialization_benchmarks()
+
+
+@benchmark("upload_image_local_s3", tolerance=IO_TOLERANCE)
+def bench_upload_image_local_s3(ctx):
+    from fastapi import UploadFile
+    from setting.s3_client import upload_image
+    payload = bytes(random.Random(3).getrandbits(8) for _ in range(64 * 1024))
+
+    def run(n):
+        for _ in range(n):
+            upload_image(UploadFile(io.BytesIO(payload), filename="photo.jpg"), "benchmark-bucket")
+    return run
+
+
+# L1 캐시를 켜면 이후 케이스의 Redis 조회도 바뀌므로 마지막에 등록
+@benchmark("search_places_local_cache_hit")
+def bench_search_places_local_cache_hit(ctx):
+    """search_places_cache_hit 과 같은 요청을 L1(프로세스 내 캐시)에서 처리"""
+    import time
+    from setting.local_cache import local_cache, invalidation_listener
+
+    invalidation_listener.start()
+    deadline = time.monotonic() + 5
+    while not local_cache.active and time.monotonic() < deadline:
+        time.sleep(0.01)
+    ctx.cleanups.append(invalidation_listener.stop)
+    return bench_search_places_cache_hit(ctx)
+
+
+class BenchmarkContext:
+    def __init__(self, place_master_id: int):
+        self.place_master_id = place_master_id
+        self.loop = asyncio.new_event_loop()
+        self.cleanups = []
+
+    def close(self):
+        for cleanup in self.cleanups:
+            cleanup()
+        self.loop.close()
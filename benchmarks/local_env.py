@@ -0,0 +1,262 @@
+# 벤치마크용 로컬 대체 환경
+#
+# MySQL 대신 SQLite 파일, Redis 대신 메모리 FakeRedis(동기/asyncio), S3 대신 로컬 디렉터리를 사용한다.
+# 앱 모듈을 import 하기 전에 install_local_env() 를 먼저 호출해야 한다.
+
+import fnmatch
+import os
+import queue
+import shutil
+import time
+
+
+class FakeRedis:
+    """앱이 사용하는 Redis 명령만 구현한 메모리 저장소 (TTL 지원, 단일 프로세스용)"""
+
+    def __init__(self):
+        self._data = {}
+        self._expires = {}
+        self._subscribers = []
+
+    def _alive(self, key) -> bool:
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    def config_set(self, name, value):
+        return True
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        return self._data.get(key) if self._alive(key) else None
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and self._alive(key):
+            return None
+        self._data[key] = value
+        if px is not None:
+            ex = px / 1000
+        if ex is not None:
+            self._expires[key] = time.monotonic() + ex
+        else:
+            self._expires.pop(key, None)
+        return True
+
+    def setex(self, key, expiration, value):
+        return self.set(key, value, ex=expiration)
+
+    def delete(self, *keys):
+        deleted = 0
+        for key in keys:
+            if self._alive(key):
+                deleted += 1
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return deleted
+
+    def exists(self, *keys):
+        return sum(1 for key in keys if self._alive(key))
+
+    def incr(self, key, amount=1):
+        value = int(self.get(key) or 0) + amount
+        self._data[key] = str(value)
+        return value
+
+    def expire(self, key, seconds):
+        if not self._alive(key):
+            return False
+        self._expires[key] = time.monotonic() + seconds
+        return True
+
+    def pexpire(self, key, milliseconds):
+        return self.expire(key, milliseconds / 1000)
+
+    def pfadd(self, key, *values):
+        # HyperLogLog 대신 정확한 집합 (벤치마크 규모에서는 충분)
+        if not self._alive(key):
+            self._data[key] = set()
+        members = self._data[key]
+        before = len(members)
+        members.update(values)
+        return int(len(members) != before)
+
+    def pfcount(self, *keys):
+        members = set()
+        for key in keys:
+            if self._alive(key):
+                members |= self._data[key]
+        return len(members)
+
+    def ttl(self, key):
+        if not self._alive(key):
+            return -2
+        expires_at = self._expires.get(key)
+        return -1 if expires_at is None else int(expires_at - time.monotonic())
+
+    def scan_iter(self, match="*", count=None):
+        for key in list(self._data):
+            if self._alive(key) and fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def flushdb(self):
+        self._data.clear()
+        self._expires.clear()
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+    def publish(self, channel, message):
+        receivers = [subscriber for subscriber in self._subscribers if channel in subscriber.channels]
+        for subscriber in receivers:
+            subscriber.messages.put({"type": "message", "channel": channel, "data": message})
+        return len(receivers)
+
+
+class FakePubSub:
+    """같은 프로세스의 publish() 를 전달받는 구독 (get_message 폴링만 지원)"""
+
+    def __init__(self, fake: FakeRedis):
+        self._fake = fake
+        self.channels = set()
+        self.messages = queue.SimpleQueue()
+
+    def subscribe(self, *channels):
+        self.channels.update(channels)
+        self._fake._subscribers.append(self)
+
+    def get_message(self, timeout=0.0):
+        try:
+            return self.messages.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        if self in self._fake._subscribers:
+            self._fake._subscribers.remove(self)
+
+
+class FakePipeline:
+    """명령을 모았다가 execute() 에서 순서대로 실행"""
+
+    def __init__(self, fake: FakeRedis):
+        self._fake = fake
+        self._commands = []
+
+    def __getattr__(self, name):
+        command = getattr(self._fake, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((command, args, kwargs))
+            return self
+        return queue
+
+    def execute(self, raise_on_error=True):
+        commands, self._commands = self._commands, []
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+class FakeBinaryRedis:
+    """decode_responses=False 클라이언트처럼 문자열 값을 bytes 로 돌려주는 FakeRedis 뷰"""
+
+    def __init__(self, fake: FakeRedis):
+        self._fake = fake
+
+    def __getattr__(self, name):
+        return getattr(self._fake, name)
+
+    def get(self, key):
+        value = self._fake.get(key)
+        return value.encode() if isinstance(value, str) else value
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def setex(self, key, expiration, value):
+        return self._fake.setex(key, expiration, value)
+
+
+class FakeAsyncRedis:
+    """redis.asyncio 클라이언트(decode_responses=False)처럼 await 하는 FakeRedis 뷰"""
+
+    def __init__(self, fake: FakeRedis):
+        self._fake = fake
+        self._binary = FakeBinaryRedis(fake)
+
+    def __getattr__(self, name):
+        command = getattr(self._binary, name)
+
+        async def call(*args, **kwargs):
+            return command(*args, **kwargs)
+        call.__name__ = name
+        return call
+
+    def pipeline(self, transaction=True):
+        return FakeAsyncPipeline(self._fake)
+
+    async def aclose(self, close_connection_pool=None):
+        pass
+
+
+class FakeAsyncPipeline(FakePipeline):
+    async def execute(self, raise_on_error=True):
+        return super().execute(raise_on_error)
+
+
+class LocalS3Stub:
+    """upload_fileobj 를 로컬 디렉터리 쓰기로 대신하는 S3 클라이언트"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None):
+        path = os.path.join(self.root, bucket, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            shutil.copyfileobj(fileobj, f)
+
+
+def install_local_env(workdir: str):
+    """
+    SQLite/FakeRedis/LocalS3Stub 을 사용하도록 환경을 구성하고 테이블을 생성합니다.
+    반환값: (fake_redis, s3_stub)
+    """
+    os.makedirs(workdir, exist_ok=True)
+    db_path = os.path.join(workdir, "bench.db")
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("S3_BUCKET", "benchmark-bucket")
+    os.environ.setdefault("AWS_REGION", "ap-northeast-2")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    # 애플 로그인 모듈은 import 시 비밀키 파일을 읽으므로 빈 파일로 대체
+    apple_key_path = os.path.join(workdir, "AuthKey.p8")
+    open(apple_key_path, "w").close()
+    os.environ["APPLE_AUTH_KEY_PATH"] = apple_key_path
+
+    from setting import redis_client, redis_async, s3_client
+
+    fake_redis = FakeRedis()
+    redis_client.redis_client = fake_redis
+    redis_client.redis_bytes_client = FakeBinaryRedis(fake_redis)
+    redis_client.redis_breaker.record_success()
+    redis_async.create_async_redis = lambda: FakeAsyncRedis(fake_redis)
+
+    s3_stub = LocalS3Stub(os.path.join(workdir, "s3"))
+    s3_client.s3_client = s3_stub
+
+    from models import Base, engine
+    Base.metadata.create_all(engine)
+    return fake_redis, s3_stub
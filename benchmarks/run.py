@@ -0,0 +1,222 @@
+# 핫패스 마이크로벤치마크 실행기
+#
+#   python -m benchmarks.run                    # 실행 후 baseline.json 과 비교 (회귀 시 exit 1)
+#   python -m benchmarks.run -k search          # 이름에 search 가 들어간 케이스만
+#   python -m benchmarks.run --update-baseline  # 현재 결과를 baseline 으로 저장
+#
+# 외부 서비스 없이 SQLite / FakeRedis / 로컬 S3 stub 으로 실행한다. (benchmarks/local_env.py)
+# 회귀 판정은 반복 측정 중 최솟값(min_us) 기준으로, baseline 대비 tolerance 이상 느려지면 실패한다.
+# - 순간적인 머신 부하로 인한 오탐을 줄이기 위해, 느려진 케이스는 바로 다시 측정해(--retries)
+#   모든 측정에서 느려졌을 때만 회귀로 본다. (결과에는 가장 빠른 측정을 기록)
+# - SQLite/로컬 S3 처럼 I/O 를 거치는 케이스는 cases.py 에서 더 넓은 허용 범위를 지정한다.
+# - 각 반복 사이에 고정된 순수 Python 기준 작업(reference)을 번갈아 측정해 relative(= 케이스 / 기준) 도 기록하고,
+#   baseline 에 relative 가 있으면 그것으로 비교한다. 머신 전체가 느려진 구간에서는 기준 작업도 함께 느려져 상쇄된다.
+# 측정값은 머신에 따라 달라지므로 baseline 은 같은 환경(CI 러너 등)에서 갱신해야 한다.
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results", "latest.json")
+DEFAULT_TOLERANCE = 0.25    # baseline 대비 25% 이상 느려지면 회귀
+MIN_BATCH_SECONDS = 0.05    # 한 번의 측정이 최소 이 시간 이상 걸리도록 반복 횟수 조정
+REPEATS = 7
+DEFAULT_RETRIES = 2         # 느려진 케이스를 다시 측정하는 횟수
+
+
+REFERENCE_ITEMS = [f"item-{i:05d}" for i in range(2000)]
+
+
+def reference_run(n):
+    """머신 속도 기준 작업: 정렬·dict·문자열 처리 (앱 코드와 무관하게 고정)"""
+    for _ in range(n):
+        counts = {}
+        for item in sorted(REFERENCE_ITEMS, reverse=True):
+            counts[item[-1]] = counts.get(item[-1], 0) + len(item.upper())
+
+
+def _calibrate(run) -> int:
+    """한 번의 측정이 MIN_BATCH_SECONDS 이상 걸리는 반복 횟수"""
+    run(1)  # 워밍업
+    iterations = 1
+    while True:
+        start = time.perf_counter()
+        run(iterations)
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_BATCH_SECONDS:
+            break
+        iterations *= 2 if elapsed < MIN_BATCH_SECONDS / 10 else max(2, int(MIN_BATCH_SECONDS / elapsed) + 1)
+    return iterations
+
+
+def _timed(run, iterations: int) -> float:
+    start = time.perf_counter()
+    run(iterations)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def measure(run) -> dict:
+    iterations = _calibrate(run)
+    reference_iterations = _calibrate(reference_run)
+
+    # timeit 과 마찬가지로 측정 중에는 GC 를 끔 (이전 케이스가 남긴 객체로 인한 편차 방지)
+    timings = []
+    reference_timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(REPEATS):
+            reference_timings.append(_timed(reference_run, reference_iterations))
+            timings.append(_timed(run, iterations))
+    finally:
+        gc.enable()
+
+    return {
+        "min_us": round(min(timings), 3),
+        "relative": round(min(timings) / min(reference_timings), 4),
+        "median_us": round(statistics.median(timings), 3),
+        "ops_per_sec": round(1e6 / statistics.median(timings), 1),
+        "iterations": iterations,
+        "repeats": REPEATS,
+    }
+
+
+def slowdown(result: dict, base: dict) -> float:
+    """baseline 대비 비율. 둘 다 relative 가 있으면 기준 작업으로 보정한 값"""
+    if "relative" in result and "relative" in base:
+        return result["relative"] / base["relative"]
+    return result["min_us"] / base["min_us"]
+
+
+def is_regression(result: dict, base: dict, tolerance: float) -> bool:
+    return base is not None and slowdown(result, base) > 1 + tolerance
+
+
+def measure_with_retries(run, base: dict, tolerance: float, retries: int) -> dict:
+    """baseline 보다 느리면 최대 retries 번 다시 측정해 가장 빠른 결과를 반환합니다."""
+    result = measure(run)
+    for _ in range(retries):
+        if not is_regression(result, base, tolerance):
+            break
+        retry = measure(run)
+        if slowdown(retry, result) < 1:
+            result = retry
+    return result
+
+
+def compare(results: dict, baseline: dict, tolerances: dict, default_tolerance: float) -> list:
+    """(이름, 현재, baseline, 비율, 회귀 여부) 목록"""
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            rows.append((name, result["min_us"], None, None, False))
+            continue
+        tolerance = tolerances.get(name, default_tolerance)
+        ratio = slowdown(result, base)
+        rows.append((name, result["min_us"], base["min_us"], ratio, is_regression(result, base, tolerance)))
+    return rows
+
+
+def _environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="MapDa 핫패스 마이크로벤치마크")
+    parser.add_argument("-k", dest="keyword", help="이름에 keyword 가 포함된 케이스만 실행")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="케이스별 허용 범위가 없는 케이스의 회귀 기준 (I/O 케이스는 cases.py 의 값 사용)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="baseline 보다 느린 케이스를 다시 측정하는 횟수")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    baseline_results = baseline.get("results", {})
+
+    workdir = tempfile.mkdtemp(prefix="mapda-bench-")
+
+    # 앱 모듈 import 전에 로컬 대체 환경을 설치해야 함
+    from benchmarks.local_env import install_local_env
+    install_local_env(workdir)
+    from benchmarks.cases import BENCHMARKS, TOLERANCES, BenchmarkContext, seed_database
+
+    ctx = BenchmarkContext(seed_database())
+    results = {}
+    try:
+        for name, setup in BENCHMARKS.items():
+            if args.keyword and args.keyword not in name:
+                continue
+            run = setup(ctx)
+            if args.update_baseline:
+                results[name] = measure(run)
+            else:
+                # 뒤 케이스가 앞 케이스의 환경을 바꿀 수 있으므로(L1 캐시 등) 다시 측정은 바로 이어서 함
+                tolerance = TOLERANCES.get(name, args.tolerance)
+                results[name] = measure_with_retries(run, baseline_results.get(name), tolerance, args.retries)
+            print(f"{name:<36} {results[name]['min_us']:>12.2f} us/op", flush=True)
+    finally:
+        ctx.close()
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": _environment(),
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.update_baseline:
+        merged = {**baseline_results, **results}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({**report, "results": merged}, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"\nbaseline 갱신: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"\nbaseline 이 없습니다: {args.baseline} (--update-baseline 으로 생성)")
+        return 0
+
+    if baseline.get("environment") != report["environment"]:
+        print("\n경고: baseline 과 실행 환경이 다릅니다. 비교 결과가 부정확할 수 있습니다.")
+
+    print(f"\n{'benchmark':<36} {'current':>10} {'baseline':>10} {'ratio':>7}")
+    regressions = []
+    for name, current, base, ratio, regressed in compare(results, baseline_results, TOLERANCES, args.tolerance):
+        if base is None:
+            print(f"{name:<36} {current:>10.2f} {'-':>10} {'new':>7}")
+            continue
+        mark = "  REGRESSION" if regressed else ""
+        print(f"{name:<36} {current:>10.2f} {base:>10.2f} {ratio:>6.2f}x{mark}")
+        if regressed:
+            regressions.append(name)
+
+    if regressions:
+        print(f"\n{len(regressions)}개 케이스가 baseline 대비 허용 범위 이상 느려졌습니다: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,8 @@ PUBLIC_PATHS = [
     "/login/apple",
     "/promotion",
     "/promotion/status/app_open",
+    "/health/ready",
+    "/metrics",  # 별도 METRICS_TOKEN 으로 인증
     # 기타 인증이 필요 없는 경로 추가
 ]
 
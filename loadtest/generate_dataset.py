@@ -0,0 +1,339 @@
+# 부하 테스트용 합성 캠퍼스 데이터 생성기
+#
+#   DATABASE_URL=mysql+pymysql://root:pw@localhost:3306/mapda \
+#       python -m loadtest.generate_dataset --scale 10
+#
+# data/university_info.py 의 대학별 영역(bounding box) 안에 건물 클러스터를 만들고,
+# 그 주변에 장소/객체 좌표를 분포시킨다. 대학별 데이터 양은 Zipf 분포로 차이를 둔다.
+# (일부 대형 캠퍼스에 데이터가 몰리는 실제 분포를 흉내냄)
+# --scale 1 이 현재 운영 데이터 규모이며, 10/100 으로 늘려 확장성을 확인한다.
+# 생성된 사용자/장소/객체 id 샘플은 manifest 파일로 저장되어 loadtest.run_load 가 사용한다.
+
+import argparse
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta, time as dtime
+
+from sqlalchemy import func, insert
+
+from data.university_info import UNIVERSITY_INFO
+from models import (SessionLocal, User, PlaceMaster, PlaceContribution, PlaceContributionImage,
+                    UserObject, UserTimetable, Message, Campaign, generate_uuid)
+
+# --scale 1 기준 전체 행 수
+BASE_COUNTS = {
+    "users": 3000,
+    "places": 800,
+    "objects": 2000,
+    "messages": 4000,
+    "campaigns": 1500,
+}
+CONTRIBUTIONS_PER_PLACE = (1, 8)        # 장소당 기여 수 범위 (작은 값이 더 흔함)
+IMAGES_PER_CONTRIBUTION = (0, 3)
+TIMETABLE_USER_RATIO = 0.6              # 시간표를 등록한 사용자 비율
+TIMETABLE_CLASSES = (6, 12)
+TIMETABLE_OVERLAP_RATIO = 0.1           # 같은 시간대에 다시 등록된 강의 비율 (중복 제거 로직 부하)
+BATCH_SIZE = 5000
+MANIFEST_SAMPLE_SIZE = 200
+
+# 합성 데이터 uuid 에 사용하는 날짜 (실제 데이터와 겹치지 않도록 고정)
+SYNTHETIC_DATE = datetime(2000, 1, 1)
+
+BUILDING_NAMES = ["공학관", "인문관", "경영관", "생명과학관", "예술디자인관", "법학관", "새천년관", "학생회관",
+                  "중앙도서관", "기숙사", "체육관", "의생명관", "산학협동관", "과학관", "교육관", "사회과학관"]
+OBJECT_NAMES = ["볼라드", "계단", "경사로", "공사장", "자전거", "킥보드", "단차", "맨홀", "입간판", "화단"]
+DAYS = ["월", "화", "수", "목", "금"]
+
+
+def university_weights(rng: random.Random) -> dict:
+    """대학별 데이터 비중 (Zipf, s=0.8)"""
+    universities = list(UNIVERSITY_INFO)
+    rng.shuffle(universities)
+    raw = {uni: 1 / (rank + 1) ** 0.8 for rank, uni in enumerate(universities)}
+    total = sum(raw.values())
+    return {uni: weight / total for uni, weight in raw.items()}
+
+
+def split_counts(total: int, weights: dict) -> dict:
+    counts = {uni: int(total * weight) for uni, weight in weights.items()}
+    # 반올림으로 빠진 나머지는 가장 큰 대학에 더함
+    largest = max(weights, key=weights.get)
+    counts[largest] += total - sum(counts.values())
+    return counts
+
+
+class Campus:
+    """대학 영역 안의 건물 클러스터와 좌표 샘플러"""
+
+    def __init__(self, university: str, rng: random.Random):
+        info = UNIVERSITY_INFO[university]
+        self.university = university
+        self.rng = rng
+        self.sw_lat, self.sw_lng = info["sw_lat"], info["sw_lng"]
+        self.ne_lat, self.ne_lng = info["ne_lat"], info["ne_lng"]
+        names = rng.sample(BUILDING_NAMES, len(BUILDING_NAMES))
+        self.buildings = []     # (건물명, 위도, 경도)
+        for i in range(rng.randint(12, 32)):
+            name = names[i % len(names)] + (f" {i // len(names) + 1}" if i >= len(names) else "")
+            self.buildings.append((name, rng.uniform(self.sw_lat, self.ne_lat), rng.uniform(self.sw_lng, self.ne_lng)))
+
+    def point_near(self, building) -> tuple:
+        _, lat, lng = building
+        sigma_lat = (self.ne_lat - self.sw_lat) * 0.02
+        sigma_lng = (self.ne_lng - self.sw_lng) * 0.02
+        return (
+            min(max(self.rng.gauss(lat, sigma_lat), self.sw_lat), self.ne_lat),
+            min(max(self.rng.gauss(lng, sigma_lng), self.sw_lng), self.ne_lng),
+        )
+
+    def building(self):
+        # 앞쪽 건물일수록 자주 선택됨 (주요 건물에 데이터 집중)
+        index = min(int(self.rng.expovariate(1 / (len(self.buildings) / 4))), len(self.buildings) - 1)
+        return self.buildings[index]
+
+
+def recent_datetime(rng: random.Random, days: int = 365) -> datetime:
+    # 최근 데이터가 더 많도록 지수 분포
+    offset = min(rng.expovariate(1 / (days / 4)), days)
+    return datetime.utcnow() - timedelta(days=offset, seconds=rng.randint(0, 86399))
+
+
+def _next_id(db, model) -> int:
+    return (db.query(func.max(model.id)).scalar() or 0) + 1
+
+
+def _bulk_insert(db, model, rows: list):
+    for start in range(0, len(rows), BATCH_SIZE):
+        db.execute(insert(model), rows[start:start + BATCH_SIZE])
+    db.commit()
+
+
+class DatasetGenerator:
+    def __init__(self, db, scale: float, seed: int):
+        self.db = db
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.weights = university_weights(self.rng)
+        self.campuses = {uni: Campus(uni, self.rng) for uni in UNIVERSITY_INFO}
+        self.users_by_uni = {uni: [] for uni in UNIVERSITY_INFO}       # (id, uuid)
+        self.places_by_uni = {uni: [] for uni in UNIVERSITY_INFO}      # (id, place_name)
+        self.objects_by_uni = {uni: [] for uni in UNIVERSITY_INFO}     # id
+
+    def count(self, name: str) -> dict:
+        return split_counts(int(BASE_COUNTS[name] * self.scale), self.weights)
+
+    def generate_users(self):
+        next_id = _next_id(self.db, User)
+        seq = self.db.query(func.count(User.id)).filter(
+            User.uuid.like(f"U{SYNTHETIC_DATE:%Y%m%d}%")).scalar() + 1
+        rows = []
+        for uni, count in self.count("users").items():
+            for _ in range(count):
+                uuid = generate_uuid("U", SYNTHETIC_DATE, seq)
+                created_at = recent_datetime(self.rng)
+                rows.append({
+                    "id": next_id, "uuid": uuid, "role": "user", "status": "Active",
+                    "created_at": created_at, "updated_at": created_at,
+                    "email": f"{uuid.lower()}@example.com", "nickname": f"user{seq}",
+                    "university": uni, "profile_number": self.rng.randint(1, 6),
+                    "provider_type": self.rng.choice(["KAKAO", "APPLE", "GOOGLE"]),
+                    "provider_id": f"synthetic-{uuid}",
+                })
+                self.users_by_uni[uni].append((next_id, uuid))
+                next_id += 1
+                seq += 1
+        _bulk_insert(self.db, User, rows)
+        return len(rows)
+
+    def generate_places(self):
+        place_id = _next_id(self.db, PlaceMaster)
+        contribution_id = _next_id(self.db, PlaceContribution)
+        places, contributions, images = [], [], []
+        for uni, count in self.count("places").items():
+            campus = self.campuses[uni]
+            users = self.users_by_uni[uni]
+            for i in range(count):
+                building = campus.building()
+                lat, lng = campus.point_near(building)
+                created_at = recent_datetime(self.rng)
+                name = f"{building[0]} {self.rng.choice(['정문', '후문', '1층 로비', '엘리베이터', '주차장'])} {i}"
+                places.append({"id": place_id, "place_name": name, "latitude": lat, "longitude": lng,
+                               "university": uni, "created_at": created_at, "updated_at": created_at})
+                self.places_by_uni[uni].append((place_id, name))
+
+                low, high = CONTRIBUTIONS_PER_PLACE
+                for _ in range(min(low + int(self.rng.expovariate(0.5)), high) if users else 0):
+                    contributed_at = created_at + timedelta(hours=self.rng.randint(0, 2000))
+                    contributions.append({
+                        "id": contribution_id, "place_master_id": place_id,
+                        "user_id": self.rng.choice(users)[0],
+                        "wheele_chair_accessible": self.rng.randint(1, 3),
+                        "rest_room_exist": self.rng.randint(0, 2),
+                        "rest_room_floor": self.rng.randint(0, 3),
+                        "elevator_accessible": self.rng.randint(0, 2),
+                        "ramp_accessible": self.rng.choice([None, 0, 1, 2, 3]),
+                        "status": "Active", "created_at": contributed_at, "updated_at": contributed_at,
+                    })
+                    for n in range(self.rng.randint(*IMAGES_PER_CONTRIBUTION)):
+                        images.append({
+                            "place_contribution_id": contribution_id,
+                            "image_url": f"https://synthetic.example.com/place/{contribution_id}/{n}.jpg",
+                            "image_type": self.rng.choice(["indoor", "outdoor"]),
+                            "created_at": contributed_at, "updated_at": contributed_at,
+                        })
+                    contribution_id += 1
+                place_id += 1
+        _bulk_insert(self.db, PlaceMaster, places)
+        _bulk_insert(self.db, PlaceContribution, contributions)
+        _bulk_insert(self.db, PlaceContributionImage, images)
+        return len(places), len(contributions), len(images)
+
+    def generate_objects(self):
+        object_id = _next_id(self.db, UserObject)
+        seq = self.db.query(func.count(UserObject.id)).filter(
+            UserObject.resource_id.like(f"UO{SYNTHETIC_DATE:%Y%m%d}%")).scalar() + 1
+        rows = []
+        for uni, count in self.count("objects").items():
+            campus = self.campuses[uni]
+            users = self.users_by_uni[uni]
+            if not users:
+                continue
+            for _ in range(count):
+                building = campus.building()
+                lat, lng = campus.point_near(building)
+                user_id, user_uuid = self.rng.choice(users)
+                created_at = recent_datetime(self.rng, days=90)
+                rows.append({
+                    "id": object_id, "resource_id": generate_uuid("UO", SYNTHETIC_DATE, seq),
+                    "created_at": created_at, "updated_at": created_at, "status": "Active",
+                    "user_id": user_id, "latitude": lat, "longitude": lng,
+                    "object_name": self.rng.choice(OBJECT_NAMES), "place_name": building[0],
+                    "image_url": f"https://synthetic.example.com/object/{object_id}.jpg",
+                    "created_uuid": user_uuid, "university": uni,
+                })
+                self.objects_by_uni[uni].append(object_id)
+                object_id += 1
+                seq += 1
+        _bulk_insert(self.db, UserObject, rows)
+        return len(rows)
+
+    def generate_timetables(self):
+        rows = []
+        for uni, users in self.users_by_uni.items():
+            buildings = self.campuses[uni].buildings
+            for _, user_uuid in users:
+                if self.rng.random() > TIMETABLE_USER_RATIO:
+                    continue
+                registered_at = recent_datetime(self.rng, days=180)
+                classes = []
+                for n in range(self.rng.randint(*TIMETABLE_CLASSES)):
+                    if classes and self.rng.random() < TIMETABLE_OVERLAP_RATIO:
+                        day, start_hour = self.rng.choice(classes)     # 겹치는 강의 재등록
+                    else:
+                        day, start_hour = self.rng.choice(DAYS), self.rng.randint(9, 17)
+                    classes.append((day, start_hour))
+                    updated_at = registered_at + timedelta(minutes=n)
+                    rows.append({
+                        "lname": f"강의 {self.rng.randint(1, 500)}", "day": day,
+                        "start_time": dtime(start_hour, self.rng.choice([0, 30])),
+                        "end_time": dtime(min(start_hour + self.rng.randint(1, 3), 22), 15),
+                        "classroom": f"{self.rng.choice(buildings)[0]} {self.rng.randint(101, 599)}호",
+                        "created_uuid": user_uuid, "created_at": updated_at, "updated_at": updated_at,
+                        "user_object_status": "Active",
+                    })
+        _bulk_insert(self.db, UserTimetable, rows)
+        return len(rows)
+
+    def generate_messages(self):
+        rows = []
+        for uni, count in self.count("messages").items():
+            users = self.users_by_uni[uni]
+            objects = self.objects_by_uni[uni]
+            if len(users) < 2:
+                continue
+            for _ in range(count):
+                (_, sender), (_, recipient) = self.rng.sample(users, 2)
+                created_at = recent_datetime(self.rng, days=60)
+                is_read = self.rng.random() < 0.5
+                types = set(self.rng.sample(range(1, 7), self.rng.randint(1, 3)))
+                rows.append({
+                    "sender_uuid": sender, "recipient_uuid": recipient,
+                    "danger_obj_id": self.rng.choice(objects) if objects else None,
+                    **{f"message_type_{i}": i in types for i in range(1, 7)},
+                    "is_read": is_read, "read_at": created_at + timedelta(hours=1) if is_read else None,
+                    "created_at": created_at,
+                })
+        _bulk_insert(self.db, Message, rows)
+        return len(rows)
+
+    def generate_campaigns(self):
+        all_users = [uuid for users in self.users_by_uni.values() for _, uuid in users]
+        rows = []
+        for _ in range(int(BASE_COUNTS["campaigns"] * self.scale)):
+            status = self.rng.choices(["Converted", "APP_OPEN", "MATCH"], weights=[6, 3, 1])[0]
+            rows.append({
+                "utm_source": self.rng.choice(["instagram", "facebook", "kakao", "everytime"]),
+                "utm_medium": self.rng.choice(["cpc", "social", "banner"]),
+                "utm_campaign": f"campus_{self.rng.randint(1, 12)}",
+                "utm_content": self.rng.choice(["a", "b"]),
+                "x_real_ip": f"10.{self.rng.randint(0, 255)}.{self.rng.randint(0, 255)}.{self.rng.randint(1, 254)}",
+                "status": status,
+                "match_UUID": self.rng.choice(all_users) if status == "MATCH" and all_users else None,
+                "created_at": recent_datetime(self.rng, days=120),
+            })
+        _bulk_insert(self.db, Campaign, rows)
+        return len(rows)
+
+    def manifest(self) -> dict:
+        """부하 테스트에서 요청에 사용할 id 샘플"""
+        universities = {}
+        for uni in UNIVERSITY_INFO:
+            users = self.users_by_uni[uni]
+            if not users:
+                continue
+            places = self.places_by_uni[uni]
+            universities[uni] = {
+                "weight": round(self.weights[uni], 4),
+                "users": [uuid for _, uuid in self.rng.sample(users, min(len(users), MANIFEST_SAMPLE_SIZE))],
+                "places": [pid for pid, _ in self.rng.sample(places, min(len(places), MANIFEST_SAMPLE_SIZE))],
+                "objects": self.rng.sample(self.objects_by_uni[uni],
+                                           min(len(self.objects_by_uni[uni]), MANIFEST_SAMPLE_SIZE)),
+                "keywords": sorted({building[0][:2] for building in self.campuses[uni].buildings}),
+            }
+        return {"scale": self.scale, "created_at": datetime.utcnow().isoformat(), "universities": universities}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="부하 테스트용 합성 캠퍼스 데이터 생성")
+    parser.add_argument("--scale", type=float, default=1, help="현재 데이터 대비 배수 (예: 1, 10, 100)")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--manifest", default=os.path.join(os.path.dirname(__file__), "manifest.json"))
+    args = parser.parse_args(argv)
+
+    db = SessionLocal()
+    try:
+        generator = DatasetGenerator(db, args.scale, args.seed)
+        steps = [
+            ("users", generator.generate_users),
+            ("place_master / place_contribution / images", generator.generate_places),
+            ("user_objects", generator.generate_objects),
+            ("user_timetable", generator.generate_timetables),
+            ("messages", generator.generate_messages),
+            ("campaign_table", generator.generate_campaigns),
+        ]
+        for name, step in steps:
+            start = time.perf_counter()
+            result = step()
+            print(f"{name:<44} {result}  ({time.perf_counter() - start:.1f}s)", flush=True)
+
+        with open(args.manifest, "w", encoding="utf-8") as f:
+            json.dump(generator.manifest(), f, ensure_ascii=False, indent=2)
+        print(f"manifest: {args.manifest}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
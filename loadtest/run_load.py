@@ -0,0 +1,186 @@
+# 주요 모바일 흐름 부하 테스트
+#
+#   python -m loadtest.run_load --base-url http://localhost:8000 --concurrency 1,10,50,100 --duration 30
+#
+# loadtest.generate_dataset 이 만든 manifest 의 사용자/장소/객체로 요청을 보낸다.
+# 동시 사용자 수(concurrency)를 단계별로 올리며 엔드포인트별 p50/p95/p99 와 처리량, 오류 수를 측정한다.
+# 액세스 토큰은 서버와 같은 JWT_SECRET_KEY 로 직접 발급한다. (로컬 스택 전용)
+# 외부 서비스(S3, OpenAI 등)를 호출하는 쓰기 흐름은 포함하지 않는다.
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import random
+import time
+from collections import defaultdict
+
+import httpx
+import jwt
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 흐름별 가중치와 요청 순서: (엔드포인트 라벨, 경로 생성 함수)
+FLOWS = {
+    "home": (40, [
+        ("GET /api/v1/get_place_list", lambda s: "/api/v1/get_place_list"),
+        ("GET /api/v1/get_object_list", lambda s: "/api/v1/get_object_list"),
+        ("GET /api/v1/message_check", lambda s: "/api/v1/message_check"),
+    ]),
+    "launch": (10, [
+        ("GET /api/v1/bootstrap", lambda s: "/api/v1/bootstrap"),
+    ]),
+    "place_detail": (20, [
+        ("GET /api/v1/get_specfic_place/{id}", lambda s: f"/api/v1/get_specfic_place/{s.choice('places')}"),
+    ]),
+    "object_detail": (10, [
+        ("GET /api/v1/get_specific_object/{id}", lambda s: f"/api/v1/get_specific_object/{s.choice('objects')}"),
+    ]),
+    "search": (15, [
+        ("GET /api/v1/search/place", lambda s: f"/api/v1/search/place?keyword={s.choice('keywords')}"),
+        ("GET /api/v1/search/place/coordinates",
+         lambda s: f"/api/v1/search/place/coordinates?keyword={s.choice('keywords')}"),
+    ]),
+    "timetable": (5, [
+        ("GET /api/v1/timetable", lambda s: "/api/v1/timetable"),
+    ]),
+    "my_page": (10, [
+        ("GET /api/v1/userinfo/inquire", lambda s: "/api/v1/userinfo/inquire"),
+        ("GET /api/v1/activity/user_barrierfree", lambda s: "/api/v1/activity/user_barrierfree"),
+        ("GET /api/v1/user_object_list", lambda s: "/api/v1/user_object_list"),
+        ("GET /api/v1/user_place_list", lambda s: "/api/v1/user_place_list"),
+    ]),
+}
+
+
+def create_access_token(uuid: str, secret: str) -> str:
+    """api.tokens.token_management.create_access_token 과 같은 형식의 토큰"""
+    expire = datetime.datetime.utcnow() + datetime.timedelta(hours=6)
+    return jwt.encode({"uuid": uuid, "exp": expire}, secret, algorithm="HS256")
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Session:
+    """가상 사용자 한 명 (한 대학의 사용자로 로그인한 상태)"""
+
+    def __init__(self, university: str, data: dict, secret: str, rng: random.Random):
+        self.data = data
+        self.rng = rng
+        self.university = university
+        self.headers = {"Authorization": f"Bearer {create_access_token(rng.choice(data['users']), secret)}"}
+
+    def choice(self, key: str):
+        return self.rng.choice(self.data[key])
+
+
+async def virtual_user(client, session: Session, deadline: float, latencies, errors, flows):
+    names = list(flows)
+    weights = [flows[name][0] for name in names]
+    while time.monotonic() < deadline:
+        _, steps = flows[session.rng.choices(names, weights)[0]]
+        for label, make_path in steps:
+            try:
+                path = make_path(session)
+            except IndexError:
+                continue    # manifest 에 해당 대학 데이터가 없음
+            start = time.perf_counter()
+            try:
+                response = await client.get(path, headers=session.headers)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies[label].append((time.perf_counter() - start) * 1000)
+            if failed:
+                errors[label] += 1
+
+
+async def run_level(base_url: str, manifest: dict, concurrency: int, duration: float, secret: str, seed: int) -> dict:
+    rng = random.Random(seed + concurrency)
+    universities = manifest["universities"]
+    names = list(universities)
+    weights = [universities[name]["weight"] for name in names]
+    # 대학 비중대로 가상 사용자 배정
+    sessions = [
+        Session(uni, universities[uni], secret, random.Random(rng.random()))
+        for uni in rng.choices(names, weights, k=concurrency)
+    ]
+
+    latencies = defaultdict(list)
+    errors = defaultdict(int)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        deadline = time.monotonic() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            virtual_user(client, session, deadline, latencies, errors, FLOWS) for session in sessions
+        ))
+        elapsed = time.perf_counter() - started
+
+    endpoints = {}
+    for label, values in sorted(latencies.items()):
+        values.sort()
+        endpoints[label] = {
+            "requests": len(values),
+            "errors": errors[label],
+            "rps": round(len(values) / elapsed, 1),
+            "p50_ms": round(percentile(values, 50), 1),
+            "p95_ms": round(percentile(values, 95), 1),
+            "p99_ms": round(percentile(values, 99), 1),
+        }
+    return {"concurrency": concurrency, "duration_s": round(elapsed, 1), "endpoints": endpoints}
+
+
+def print_level(result: dict):
+    print(f"\n== concurrency {result['concurrency']} ({result['duration_s']}s) ==")
+    print(f"{'endpoint':<44} {'req':>7} {'err':>5} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for label, stats in result["endpoints"].items():
+        print(f"{label:<44} {stats['requests']:>7} {stats['errors']:>5} {stats['rps']:>8} "
+              f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8}")
+
+
+async def main_async(args):
+    with open(args.manifest, encoding="utf-8") as f:
+        manifest = json.load(f)
+    secret = os.getenv("JWT_SECRET_KEY")
+    if not secret:
+        raise SystemExit("JWT_SECRET_KEY 가 필요합니다. (서버와 같은 값)")
+
+    results = []
+    for concurrency in args.concurrency:
+        result = await run_level(args.base_url, manifest, concurrency, args.duration, secret, args.seed)
+        print_level(result)
+        results.append(result)
+
+    report = {
+        "base_url": args.base_url,
+        "dataset_scale": manifest.get("scale"),
+        "created_at": datetime.datetime.utcnow().isoformat(),
+        "levels": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\nresults: {args.output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="주요 모바일 흐름 부하 테스트")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--manifest", default=os.path.join(os.path.dirname(__file__), "manifest.json"))
+    parser.add_argument("--concurrency", default="1,10,50,100",
+                        type=lambda value: [int(v) for v in value.split(",")])
+    parser.add_argument("--duration", type=float, default=30, help="단계별 실행 시간(초)")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--output", default="loadtest_results.json")
+    asyncio.run(main_async(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
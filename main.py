@@ -1,12 +1,32 @@
+from setting.logging_config import setup_logging, instrument_db_timing
+
+# 구조화 로깅 설정 (다른 모듈 import 전에)
+setup_logging()
+
+import asyncio
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from middleware import authentication_middleware, add_utf8_encoding
+from middleware import authentication_middleware, add_utf8_encoding, access_log_middleware, tracing_middleware, ProfilingMiddleware
 from openapi_config import custom_openapi
 from router_config import register_routers
-from api.admin.redis_manage import flush_cache_on_startup
+from api.admin.cache_warmup import warm_up_cache, warmup_state, CACHE_WARMUP_ENABLED
 from api.admin.admin_login import AdminTokenManager
+from setting.loop_monitor import loop_monitor, LOOP_MONITOR_ENABLED
+from setting.http_client import close_http_client, get_host_breakers
+from setting.metrics import MetricsMiddleware, register_db_pool_metrics, register_breaker_metrics, register_local_cache_metrics
+from setting.redis_client import redis_breaker
+from setting.local_cache import local_cache, invalidation_listener
+from setting.redis_async import create_async_redis, close_async_redis
+from setting.tracing import instrument_db_tracing
+from setting.memory_debug import RouteMemoryMiddleware
+from setting.compression import CompressionMiddleware
+from setting.pagination import NEXT_CURSOR_HEADER
+from setting.idempotency import IDEMPOTENCY_REPLAYED_HEADER
+from models import engine
 
-app = FastAPI()
+# 기본 응답을 orjson(C 구현)으로 직렬화
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # CORS 정책 허용
 app.add_middleware(
@@ -15,11 +35,33 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, IDEMPOTENCY_REPLAYED_HEADER],
 )
 
 # 미들웨어 등록
+app.add_middleware(ProfilingMiddleware)     # 인증 이후에 실행되도록 가장 안쪽에 등록 (순수 ASGI)
 app.middleware("http")(authentication_middleware)
 app.middleware("http")(add_utf8_encoding)
+app.middleware("http")(tracing_middleware)     # 루트 span (TRACE_SAMPLE_RATE > 0 일 때만)
+app.middleware("http")(access_log_middleware)  # 가장 바깥쪽: 요청 ID, 접근 로그
+
+# Accept-Encoding 협상 응답 압축 (br/gzip, COMPRESSION_MIN_SIZE 이상)
+app.add_middleware(CompressionMiddleware)
+
+# 라우트별 메모리 증가량 (tracemalloc 추적 중일 때만 동작)
+app.add_middleware(RouteMemoryMiddleware)
+
+# 라우트별 지연 시간/크기/상태 코드 메트릭 (순수 ASGI, 가장 바깥쪽)
+app.add_middleware(MetricsMiddleware)
+
+# 요청별 DB 시간 측정, 쿼리 span 기록
+instrument_db_timing(engine)
+instrument_db_tracing(engine)
+
+# DB 풀, Redis/외부 호스트 서킷 브레이커 상태 게이지
+register_db_pool_metrics(engine)
+register_breaker_metrics(lambda: [redis_breaker] + get_host_breakers())
+register_local_cache_metrics(local_cache)
 
 # 라우터 등록
 register_routers(app)
@@ -27,8 +69,52 @@ register_routers(app)
 # OpenAPI 스키마 커스터마이징
 app.openapi = lambda: custom_openapi(app)
 
-# 앱 시작 시 Redis 캐시 플러시
-flush_cache_on_startup()
+# 대학별 핫 데이터 캐시 워밍업 (백그라운드)
+# 시작 시 캐시를 비우지 않음: 캐시 키에 네임스페이스 버전이 들어가 쓰기 시점에 무효화되고,
+# 값 형식이 바뀌는 배포는 CACHE_SCHEMA_VERSION 으로 새 키를 사용 (setting/cache_namespace.py)
+_background_tasks = set()
+
+@app.on_event("startup")
+async def start_cache_warmup():
+    if not CACHE_WARMUP_ENABLED:
+        warmup_state["ready"] = True
+        return
+    task = asyncio.create_task(warm_up_cache())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+# async 경로용 Redis 클라이언트 (크기를 정한 커넥션 풀, setting/redis_async.py)
+@app.on_event("startup")
+async def open_redis_pool():
+    app.state.redis = create_async_redis()
+
+@app.on_event("shutdown")
+async def close_redis_pool():
+    await close_async_redis(app.state.redis)
+
+# Redis 앞단 L1 캐시: 무효화 채널 구독 후 사용 (LOCAL_CACHE_ENABLED=true 일 때만)
+@app.on_event("startup")
+async def start_local_cache():
+    invalidation_listener.start()
+
+@app.on_event("shutdown")
+async def stop_local_cache():
+    await asyncio.to_thread(invalidation_listener.stop)
+
+# 이벤트 루프 블로킹 감지 (LOOP_MONITOR_ENABLED=true 일 때만)
+@app.on_event("startup")
+async def start_loop_monitor():
+    if LOOP_MONITOR_ENABLED:
+        loop_monitor.start(app)
+
+@app.on_event("shutdown")
+async def stop_loop_monitor():
+    loop_monitor.stop()
+
+# 공용 외부 HTTP 클라이언트 정리
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    await close_http_client()
 
 # # AdminTokenManager 초기화
 # AdminTokenManager()
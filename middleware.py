@@ -1,8 +1,17 @@
 # 미들웨어 설정
 
+import time
+import uuid
 from fastapi import Request, Response
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
 from api.tokens import token_management
+from api.admin.admin_login import is_admin_uuid
 from config import PUBLIC_PATHS, PUBLIC_PATH_PREFIXES  # config에서 import
+from setting.logging_config import access_logger, request_id_var, db_time_var, should_log_access
+from setting.tracing import start_root_span, current_span_var
+from setting.profiler import RequestProfiler, PROFILE_HEADER
+from setting.active_users import active_user_tracker
 
 async def authentication_middleware(request: Request, call_next):
     path = request.url.path
@@ -22,13 +31,126 @@ async def authentication_middleware(request: Request, call_next):
         return Response(content="유효하지 않은 토큰입니다.", status_code=401)
 
     request.state.user_uuid = user_uuid
+    active_user_tracker.record(user_uuid)  # DAU/MAU 집계 (백그라운드 스레드에서 Redis 기록)
     return await call_next(request)
 
 async def add_utf8_encoding(request: Request, call_next):
     response = await call_next(request)
+    if "charset" in response.headers.get("content-type", ""):
+        # 이미 charset 을 지정한 응답(예: /metrics 의 text/plain)은 그대로 둠
+        return response
     if "text" in response.headers.get("content-type", ""):
         response.headers["Content-Type"] = "text/html; charset=utf-8"
     elif "application/json" in response.headers.get("content-type", ""):
         response.headers["Content-Type"] = "application/json; charset=utf-8"
     return response
 
+
+
+async def access_log_middleware(request: Request, call_next):
+    """요청 ID를 부여하고 요청별 접근 로그(JSON)를 남깁니다."""
+    request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+    request_id_token = request_id_var.set(request_id)
+    db_time = [0.0]
+    db_time_token = db_time_var.set(db_time)
+
+    start = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        response.headers["X-Request-ID"] = request_id
+        return response
+    finally:
+        latency_ms = (time.perf_counter() - start) * 1000
+        route = request.scope.get("route")
+        route_path = getattr(route, "path", request.url.path)
+        if should_log_access(route_path, status_code, latency_ms):
+            access_logger.info(
+                "access",
+                extra={
+                    "method": request.method,
+                    "route": route_path,
+                    "path": request.url.path,
+                    "status": status_code,
+                    "latency_ms": round(latency_ms, 2),
+                    "db_ms": round(db_time[0] * 1000, 2),
+                    "user_uuid": getattr(request.state, "user_uuid", None),
+                },
+            )
+        db_time_var.reset(db_time_token)
+        request_id_var.reset(request_id_token)
+
+
+async def tracing_middleware(request: Request, call_next):
+    """샘플링된 요청에 루트 span 을 만들어 하위 DB/Redis/S3/외부 호출 span 의 부모로 사용합니다."""
+    span = start_root_span(f"{request.method} {request.url.path}", request.headers.get("traceparent"), {
+        "http.request.method": request.method,
+        "url.path": request.url.path,
+    })
+    if span is None:
+        return await call_next(request)
+
+    span_token = current_span_var.set(span)
+    error = None
+    try:
+        response = await call_next(request)
+        span.set_attribute("http.response.status_code", response.status_code)
+        response.headers["X-Trace-ID"] = span.trace_id
+        return response
+    except Exception as e:
+        error = e
+        raise
+    finally:
+        route = request.scope.get("route")
+        if route is not None:
+            span.name = f"{request.method} {route.path}"
+            span.set_attribute("http.route", route.path)
+        request_id = request_id_var.get()
+        if request_id:
+            span.set_attribute("request_id", request_id)
+        span.end(error)
+        current_span_var.reset(span_token)
+
+
+class ProfilingMiddleware:
+    """
+    관리자 요청에 X-Profile: 1 헤더가 있으면 해당 요청을 샘플링 프로파일러로 실행하는 순수 ASGI 미들웨어.
+    헤더가 없는 요청은 Request 객체도 만들지 않고 그대로 통과시킵니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.header = PROFILE_HEADER.lower().encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (self.header, b"1") not in scope["headers"]:
+            await self.app(scope, receive, send)
+            return
+
+        user_uuid = scope.get("state", {}).get("user_uuid")
+        if not await run_in_threadpool(is_admin_uuid, user_uuid):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = RequestProfiler(scope)
+        profiler.start()
+        stopped = False
+
+        async def send_wrapper(message):
+            nonlocal stopped
+            # 응답 시작 시점에 엔드포인트 실행이 끝나므로 여기서 멈추고 결과 파일을 헤더로 알려줌
+            if message["type"] == "http.response.start" and not stopped:
+                stopped = True
+                profiler.stop()
+                filename = await run_in_threadpool(profiler.save, request_id_var.get() or "request")
+                headers = MutableHeaders(scope=message)
+                headers["X-Profile-File"] = filename
+                headers["X-Profile-Samples"] = str(profiler.sample_count)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if not stopped:
+                profiler.stop()
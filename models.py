@@ -1,4 +1,4 @@
-from sqlalchemy import Time, create_engine, Column, Integer, String, Float, DateTime, Date, Enum, ForeignKey, func, Boolean
+from sqlalchemy import Time, create_engine, Column, Integer, String, Float, DateTime, Date, Enum, ForeignKey, func, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
 from dotenv import load_dotenv
@@ -8,8 +8,9 @@ from data.university_info import UNIVERSITY_INFO
 
 load_dotenv()
 
-# Database connection setup
-DATABASE_URL = f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@" \
+# Database connection setup (DATABASE_URL 을 지정하면 우선 사용, 예: 벤치마크용 SQLite)
+DATABASE_URL = os.getenv('DATABASE_URL') or \
+               f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@" \
                f"{os.getenv('DB_ENDPOINT')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
 
 engine = create_engine(DATABASE_URL)
@@ -99,6 +100,12 @@ class UserObject(Base):
     # Relationship
     user = relationship('User', back_populates='user_objects')
 
+    # 키셋 페이지네이션 (대학별 피드, 사용자별 목록) 을 (created_at, id) 역순 인덱스 스캔으로 처리
+    __table_args__ = (
+        Index('ix_user_objects_university_created', 'university', 'created_at', 'id'),
+        Index('ix_user_objects_created_uuid_created', 'created_uuid', 'created_at', 'id'),
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if not self.resource_id:
@@ -124,6 +131,11 @@ class PlaceMaster(Base):
     # 관계 설정
     contributions = relationship("PlaceContribution", back_populates="place_master")
 
+    # 대학별 장소 피드 키셋 페이지네이션
+    __table_args__ = (
+        Index('ix_place_master_university_created', 'university', 'created_at', 'id'),
+    )
+
 # PlaceContribution model definition
 class PlaceContribution(Base):
     __tablename__ = "place_contribution"
@@ -183,6 +195,14 @@ class UserTimetable(Base):
     # Relationship
     user = relationship('User', back_populates='timetables')
 
+class PendingVersionBump(Base):
+    """Redis 장애로 올리지 못한 데이터 버전 scope (모든 워커가 보고 복구 후 다시 올림, setting/etag.py)"""
+    __tablename__ = "pending_version_bumps"
+
+    scope = Column(String(255), primary_key=True)
+    failed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
 # Campaign model definition (campaign_table)
 class Campaign(Base):
     __tablename__ = "campaign_table"
@@ -226,5 +246,11 @@ class Message(Base):
     sender = relationship('User', foreign_keys=[sender_uuid])
     recipient = relationship('User', foreign_keys=[recipient_uuid])
 
+    # 수신 메시지 목록 키셋 페이지네이션, 새 메시지 확인
+    __table_args__ = (
+        Index('ix_messages_recipient_created', 'recipient_uuid', 'created_at', 'id'),
+    )
+
 # Create all tables in the database
+# (기존 테이블에는 __table_args__ 인덱스를 추가하지 않음. README 의 DB indexes 참고)
 Base.metadata.create_all(bind=engine)
@@ -0,0 +1,181 @@
+# 활성 사용자(DAU/WAU/MAU) 집계
+#
+# 인증된 요청의 uuid 를 일자별/대학별 Redis HyperLogLog 에 PFADD 한다.
+# 요청 경로에서는 샘플링 판정, 프로세스 내 중복 제거, 큐 적재만 수행하고
+# uuid -> 대학 조회(MySQL, 캐시됨)와 Redis 쓰기는 백그라운드 스레드가 배치로 처리한다.
+# 샘플링은 uuid 해시 기준이라 같은 사용자는 항상 포함/제외되며, 집계 시 1/샘플링 비율로 보정한다.
+# 중복 제거 집합에는 PFADD 가 성공한 사용자만 넣는다. Redis 쓰기나 대학 조회가 실패하면
+# 그 사용자는 다음 요청에서 다시 큐에 들어간다. (PFADD 는 멱등이라 다시 써도 집계는 같음)
+
+import logging
+import os
+import queue
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from cachetools import TTLCache
+from dotenv import load_dotenv
+
+import setting.redis_client as cache
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_USER_TRACKING_ENABLED = os.getenv("ACTIVE_USER_TRACKING_ENABLED", "true").lower() == "true"
+ACTIVE_USER_SAMPLE_RATE = float(os.getenv("ACTIVE_USER_SAMPLE_RATE", 1.0))
+ACTIVE_USER_TIMEZONE = ZoneInfo(os.getenv("ACTIVE_USER_TIMEZONE", "Asia/Seoul"))
+ACTIVE_USER_KEY_TTL = 40 * 24 * 60 * 60      # MAU(30일) 계산에 필요한 기간 + 여유
+ACTIVE_USER_ALL = "all"                      # 전체 대학 합산 키
+LOCAL_DEDUPE_MAX = 100000                    # 프로세스 내 중복 제거 집합 최대 크기
+FLUSH_INTERVAL = 1.0                         # 배치 쓰기 간격(초)
+FLUSH_BATCH_SIZE = 1000
+
+_SAMPLE_THRESHOLD = int(ACTIVE_USER_SAMPLE_RATE * 10000)
+
+
+def active_user_key(day: str, scope: str) -> str:
+    """day: YYYYMMDD, scope: 대학 이름 또는 all"""
+    return f"active_users:{day}:{scope}"
+
+
+def today() -> date:
+    return datetime.now(ACTIVE_USER_TIMEZONE).date()
+
+
+def _lookup_universities(uuids) -> dict:
+    """uuid -> 대학 (없는 사용자는 None). 조회에 실패하면 빈 dict"""
+    from models import SessionLocal, User
+    db = SessionLocal()
+    try:
+        rows = db.query(User.uuid, User.university).filter(User.uuid.in_(list(uuids))).all()
+    except Exception as e:
+        logger.warning("Failed to look up universities for active users: %s", e)
+        return {}
+    finally:
+        db.close()
+    found = dict(rows)
+    return {uuid: found.get(uuid) for uuid in uuids}
+
+
+class ActiveUserTracker:
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._seen = set()         # 오늘 PFADD 가 끝난 사용자
+        self._pending = set()      # 큐에 넣었지만 아직 쓰지 않은 사용자
+        self._seen_day = None
+        self._day = None
+        self._day_ends_at = 0.0
+        self._universities = TTLCache(maxsize=100000, ttl=3600)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def record(self, user_uuid: str):
+        """인증된 사용자를 오늘의 활성 사용자로 기록합니다. (요청 경로에서 호출)"""
+        if not ACTIVE_USER_TRACKING_ENABLED or not user_uuid:
+            return
+        if _SAMPLE_THRESHOLD < 10000 and zlib.crc32(user_uuid.encode()) % 10000 >= _SAMPLE_THRESHOLD:
+            return
+
+        day = self._current_day()
+        if day != self._seen_day or len(self._seen) >= LOCAL_DEDUPE_MAX:
+            self._seen = set()
+            self._pending = set()
+            self._seen_day = day
+        if user_uuid in self._seen or user_uuid in self._pending:
+            return
+        self._pending.add(user_uuid)
+
+        if self._thread is None:
+            self._start()
+        self._queue.put((day, user_uuid))
+
+    def _current_day(self) -> str:
+        # 요청마다 날짜를 계산하지 않도록 다음 자정까지 캐시
+        now = time.time()
+        if now >= self._day_ends_at:
+            current = datetime.now(ACTIVE_USER_TIMEZONE)
+            midnight = datetime.combine(current.date() + timedelta(days=1), datetime.min.time(),
+                                        tzinfo=ACTIVE_USER_TIMEZONE)
+            self._day = current.strftime("%Y%m%d")
+            self._day_ends_at = midnight.timestamp()
+        return self._day
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="active-user-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < FLUSH_BATCH_SIZE:
+                    batch.append(self._queue.get(timeout=FLUSH_INTERVAL))
+            except queue.Empty:
+                pass
+            written = False
+            try:
+                written = self._flush(batch)
+            except Exception:
+                logger.exception("Failed to record %d active users", len(batch))
+            self._settle(batch, written)
+
+    def _flush(self, batch) -> bool:
+        """배치를 PFADD 합니다. 반환값: Redis 쓰기 성공 여부"""
+        unknown = {uuid for _, uuid in batch if uuid not in self._universities}
+        if unknown:
+            self._universities.update(_lookup_universities(unknown))
+
+        members = defaultdict(set)
+        for day, uuid in batch:
+            members[active_user_key(day, ACTIVE_USER_ALL)].add(uuid)
+            university = self._universities.get(uuid)
+            if university:
+                members[active_user_key(day, university)].add(uuid)
+
+        pipe = cache.redis_client.pipeline(transaction=False)
+        for key, uuids in members.items():
+            pipe.pfadd(key, *uuids)
+            pipe.expire(key, ACTIVE_USER_KEY_TTL)
+        return cache._guarded(pipe.execute) is not None
+
+    def _settle(self, batch, written: bool):
+        """쓰기에 성공했고 대학도 조회된 사용자만 중복 제거 집합에 넣고, 나머지는 다음 요청에서 다시 기록"""
+        seen, pending, seen_day = self._seen, self._pending, self._seen_day
+        for day, uuid in batch:
+            if day != seen_day:     # 그 사이 날짜가 바뀌어 집합이 초기화됨
+                continue
+            if written and uuid in self._universities:
+                seen.add(uuid)
+            pending.discard(uuid)
+
+
+active_user_tracker = ActiveUserTracker()
+
+
+def count_active_users(day: date, scopes: list) -> dict:
+    """
+    scope 별 DAU/WAU/MAU 추정치를 반환합니다.
+    여러 날의 키를 한 번에 PFCOUNT 하면 Redis 가 내부적으로 합집합(PFMERGE 와 동일)을 계산합니다.
+    Redis 오류는 호출 측에서 처리합니다. (redis.RedisError)
+    """
+    days = [(day - timedelta(days=offset)).strftime("%Y%m%d") for offset in range(30)]
+    windows = {"dau": days[:1], "wau": days[:7], "mau": days}
+
+    pipe = cache.redis_client.pipeline(transaction=False)
+    for scope in scopes:
+        for window_days in windows.values():
+            pipe.pfcount(*(active_user_key(d, scope) for d in window_days))
+    replies = iter(pipe.execute())
+
+    scale = 1 / ACTIVE_USER_SAMPLE_RATE if ACTIVE_USER_SAMPLE_RATE > 0 else 0
+    return {
+        scope: {window: round(next(replies) * scale) for window in windows}
+        for scope in scopes
+    }
@@ -0,0 +1,42 @@
+# 여러 ID 를 한 번에 조회하는 배치 엔드포인트 공용
+#
+#   GET /api/v1/objects?ids=3,1,2
+#
+# ids 는 쉼표로 구분한 정수 목록. 중복은 처음 나온 위치만 남긴다.
+# 응답은 입력 순서를 따르고, 없는 ID 는 {"id": ..., "not_found": true} 로 자리를 채운다.
+
+import os
+from typing import List, Sequence
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, Query
+
+load_dotenv()
+
+BATCH_GET_MAX_IDS = int(os.getenv("BATCH_GET_MAX_IDS", 50))   # 한 번에 조회할 수 있는 최대 ID 수
+
+
+def batch_ids(
+    ids: str = Query(..., description=f"쉼표로 구분한 ID 목록 (최대 {BATCH_GET_MAX_IDS}개)")
+) -> List[int]:
+    """ids 쿼리 파라미터 의존성. 정수가 아니거나 개수를 넘으면 400"""
+    parsed = []
+    for raw in ids.split(","):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            parsed.append(int(raw))
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"잘못된 ID 입니다: {raw}")
+    parsed = list(dict.fromkeys(parsed))
+    if not parsed:
+        raise HTTPException(status_code=400, detail="ids 가 비어 있습니다.")
+    if len(parsed) > BATCH_GET_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"ids 는 최대 {BATCH_GET_MAX_IDS}개까지 조회할 수 있습니다.")
+    return parsed
+
+
+def in_input_order(ids: Sequence[int], found: dict) -> list:
+    """found(id -> 항목)를 입력 순서대로 나열하고 없는 ID 는 not_found 표시로 채웁니다."""
+    return [found[item_id] if item_id in found else {"id": item_id, "not_found": True} for item_id in ids]
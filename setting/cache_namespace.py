@@ -0,0 +1,67 @@
+# 캐시 네임스페이스 버전
+#
+#   키 = {namespace}:{CACHE_SCHEMA_VERSION}:{university}:{버전}[:접미사]
+#   예) object_feed:1:KONKUK_SEOUL:1729312345000000001
+#       object_feed:1:KONKUK_SEOUL:1729312345000000001:cursor
+#
+# 네임스페이스·대학별 버전 카운터(data_version:cache:{namespace}:{university}, setting/etag.py 와 같은 방식)를
+# 키에 넣고, 무효화는 그 버전을 INCR 하는 것으로 끝낸다. 이전 버전 키는 더 이상 읽히지 않고 TTL 이 지나면 사라진다.
+# FLUSHALL/KEYS 없이 필요한 네임스페이스·대학만 무효화하므로 다른 워커의 캐시나
+# 세션/멱등 키/활성 사용자 집계 같은 다른 데이터는 그대로 남는다.
+# Redis 장애로 INCR 하지 못한 무효화는 bump_data_version 의 보류 목록에 남았다가 복구 후 다시 실행되고,
+# 그동안 이 워커는 해당 네임스페이스를 캐시하지 않아 이전 버전 키에 새 데이터를 쓰지 않는다.
+# 캐시 값 형식이 바뀌는 배포는 CACHE_SCHEMA_VERSION 을 올려 모든 네임스페이스를 새 키로 옮긴다.
+
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from setting.etag import get_data_versions, get_data_versions_async, bump_data_version
+
+load_dotenv()
+
+CACHE_SCHEMA_VERSION = os.getenv("CACHE_SCHEMA_VERSION", "1")
+
+# --- 네임스페이스 ---
+OBJECT_FEED = "object_feed"                   # 대학별 객체 피드 (첫 페이지 + 다음 커서)
+PLACE_FEED = "place_feed"                     # 대학별 장소 피드 (첫 페이지 + 다음 커서)
+PLACE_INDEX = "place_index"                   # 대학별 장소 검색 인덱스
+PLACE_SEARCH = "place_search"                 # 장소 검색 응답 캐시 (setting/response_cache.py)
+PLACE_SEARCH_COORDS = "place_search_coords"   # 장소 좌표 검색 응답 캐시
+
+CACHE_NAMESPACES = (OBJECT_FEED, PLACE_FEED, PLACE_INDEX, PLACE_SEARCH, PLACE_SEARCH_COORDS)
+
+
+def cache_scope(namespace: str, university: str) -> str:
+    """네임스페이스 버전 카운터의 scope 이름 (get_data_versions/bump_data_version 에 그대로 사용)"""
+    return f"cache:{namespace}:{university}"
+
+
+def versioned_cache_key(namespace: str, university: str, version: str, *suffix: str) -> str:
+    return ":".join((namespace, CACHE_SCHEMA_VERSION, university, version, *suffix))
+
+
+def namespace_version(namespace: str, university: str) -> Optional[str]:
+    """현재 네임스페이스 버전. Redis 를 사용할 수 없으면 None"""
+    versions = get_data_versions(cache_scope(namespace, university))
+    return versions[0] if versions else None
+
+
+async def namespace_version_async(client, namespace: str, university: str) -> Optional[str]:
+    """namespace_version 의 asyncio 버전 (client: app.state.redis)"""
+    versions = await get_data_versions_async(client, cache_scope(namespace, university))
+    return versions[0] if versions else None
+
+
+def invalidate_cache(namespaces, universities) -> bool:
+    """
+    네임스페이스·대학 조합의 버전을 올려 캐시를 무효화합니다. (파이프라인 한 번)
+    Redis 장애로 보류되면 False. 보류된 무효화는 Redis 가 복구되면 다시 실행되고,
+    그동안 해당 네임스페이스는 캐시 없이 동작합니다. (setting/etag.py)
+    """
+    return bump_data_version(*(
+        cache_scope(namespace, university)
+        for namespace in namespaces
+        for university in universities
+    ))
@@ -0,0 +1,99 @@
+# 서킷 브레이커
+#
+# 연속 실패가 임계값을 넘으면 open 상태가 되어 recovery_timeout 동안 호출을 즉시 거부한다.
+# 이후 half_open 상태에서 한 번의 probe 호출만 허용해, 성공하면 closed 로 복구하고
+# 실패하면 다시 open 으로 돌아간다.
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    # 메트릭으로 내보낼 때 사용하는 숫자 값
+    STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 10.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_count = 0        # open 으로 전환된 횟수
+        self.rejected_count = 0      # open 상태에서 거부된 호출 수
+        self._opened_at = 0.0
+        self._probe_started_at = None
+        self._lock = threading.Lock()
+        self._success_listeners = []
+        self._failure_listeners = []
+
+    def allow_request(self) -> bool:
+        """호출을 진행해도 되는지 반환합니다. False 이면 호출 없이 바로 fallback 해야 합니다."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            now = time.monotonic()
+            if self.state == self.OPEN:
+                if now - self._opened_at < self.recovery_timeout:
+                    self.rejected_count += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_started_at = now
+                return True
+
+            # half_open: probe 가 진행 중이면 거부 (probe 결과가 기록되지 않은 채 오래되면 재시도 허용)
+            if self._probe_started_at is not None and now - self._probe_started_at < self.recovery_timeout:
+                self.rejected_count += 1
+                return False
+            self._probe_started_at = now
+            return True
+
+    def add_success_listener(self, callback):
+        """호출이 성공할 때마다 callback() 을 실행합니다. (장애 중 밀린 작업 재시도 등, 빠르게 반환해야 함)"""
+        self._success_listeners.append(callback)
+
+    def add_failure_listener(self, callback):
+        """호출이 실패할 때마다 callback() 을 실행합니다. (빠르게 반환해야 함)"""
+        self._failure_listeners.append(callback)
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("Circuit breaker '%s' closed", self.name)
+            self.state = self.CLOSED
+            self.consecutive_failures = 0
+            self._probe_started_at = None
+        for callback in self._success_listeners:
+            callback()
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.opened_count += 1
+                    logger.warning("Circuit breaker '%s' opened after %d consecutive failures",
+                                   self.name, self.consecutive_failures)
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+        for callback in self._failure_listeners:
+            callback()
+
+    def snapshot(self) -> dict:
+        return {
+            "name": self.name,
+            "state": self.state,
+            "state_value": self.STATE_VALUES[self.state],
+            "consecutive_failures": self.consecutive_failures,
+            "opened_count": self.opened_count,
+            "rejected_count": self.rejected_count,
+        }
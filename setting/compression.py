@@ -0,0 +1,252 @@
+# 응답 압축 (Accept-Encoding 협상)
+#
+# CompressionMiddleware 는 JSON/텍스트 응답이 COMPRESSION_MIN_SIZE 이상이면 br 또는 gzip 으로 압축한다.
+# 이미 Content-Encoding 이 지정된 응답(미리 압축해 둔 캐시 응답 등)은 그대로 통과시킨다.
+# cached_json_response() 는 Redis 에 캐시된 JSON 본문으로 응답을 만들되, 인코딩별로 압축한 본문을
+# 따로 캐싱해 두어 캐시 히트 시 매번 다시 압축하지 않는다.
+
+import gzip
+import os
+import zlib
+from functools import lru_cache
+from typing import Callable, Optional
+
+import brotli
+from dotenv import load_dotenv
+from fastapi import Request, Response
+from starlette.datastructures import MutableHeaders
+
+from setting.redis_client import cache_mget_bytes, cache_setex_bytes, cache_ttl, compressed_cache_key
+from setting.redis_async import cache_mget_bytes_async, cache_setex_many_async, cache_ttl_async
+
+load_dotenv()
+
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))         # 이보다 작은 응답은 압축하지 않음 (bytes)
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))
+
+# 캐시에 저장할 본문은 한 번만 압축하므로 최고 압축률 사용
+PRECOMPRESS_GZIP_LEVEL = 9
+PRECOMPRESS_BROTLI_QUALITY = 11
+
+# 같은 q 값이면 앞쪽 인코딩을 선호
+SUPPORTED_ENCODINGS = ("br", "gzip")
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+
+
+@lru_cache(maxsize=256)
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 헤더에서 사용할 인코딩을 고릅니다. (없으면 None)"""
+    preferences = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        preferences[coding] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = preferences.get(encoding, preferences.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str, precompress: bool = False) -> bytes:
+    if encoding == "br":
+        quality = PRECOMPRESS_BROTLI_QUALITY if precompress else COMPRESSION_BROTLI_QUALITY
+        return brotli.compress(body, quality=quality)
+    level = PRECOMPRESS_GZIP_LEVEL if precompress else COMPRESSION_GZIP_LEVEL
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+class StreamCompressor:
+    """청크 단위로 나뉘어 오는 본문을 이어서 압축합니다."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+            self._compress, self._finish = self._compressor.process, self._compressor.finish
+        else:
+            self._compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)  # 31: gzip 헤더
+            self._compress, self._finish = self._compressor.compress, self._compressor.flush
+
+    def compress(self, chunk: bytes, final: bool) -> bytes:
+        data = self._compress(chunk)
+        return data + self._finish() if final else data
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def request_encoding(request: Request) -> Optional[str]:
+    if not COMPRESSION_ENABLED:
+        return None
+    return negotiate_encoding(request.headers.get("accept-encoding", ""))
+
+
+def encoded_json_response(body: bytes, encoding: str) -> Response:
+    """이미 압축된 JSON 본문 응답 (CompressionMiddleware 는 그대로 통과)"""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+    )
+
+
+def _response_from_cache(cached: bytes, compressed: Optional[bytes], encoding: Optional[str], wrap):
+    """캐시 값으로 응답을 만듭니다. 반환: (응답, 새로 만들어 저장할 압축 변형 또는 None)"""
+    if encoding is None:
+        return Response(content=wrap(cached) if wrap else cached, media_type="application/json"), None
+    if compressed is not None:
+        return encoded_json_response(compressed, encoding), None
+
+    body = wrap(cached) if wrap else cached
+    if len(body) < COMPRESSION_MIN_SIZE:
+        return Response(content=body, media_type="application/json"), None
+    compressed = compress(body, encoding, precompress=True)
+    return encoded_json_response(compressed, encoding), compressed
+
+
+def cached_json_response(
+    request: Request,
+    cache_key: str,
+    wrap: Optional[Callable[[bytes], bytes]] = None,
+) -> Optional[Response]:
+    """
+    캐시된 JSON 으로 응답을 만듭니다. 캐시 미스이거나 Redis 를 사용할 수 없으면 None.
+    wrap: 캐시 값을 응답 본문으로 바꾸는 함수 (예: 검색 결과를 {"query", "items"} 로 감싸기)
+
+    클라이언트가 압축을 지원하면 원본과 압축 변형을 MGET 한 번으로 조회합니다.
+    압축 변형이 없으면 압축해서 원본의 남은 TTL 만큼 저장해 둡니다. (원본보다 오래 남지 않도록)
+    """
+    encoding = request_encoding(request)
+    if encoding is None:
+        cached, = cache_mget_bytes(cache_key)
+        compressed = None
+    else:
+        cached, compressed = cache_mget_bytes(cache_key, compressed_cache_key(cache_key, encoding))
+    if cached is None:
+        return None
+
+    response, new_variant = _response_from_cache(cached, compressed, encoding, wrap)
+    if new_variant is not None:
+        ttl = cache_ttl(cache_key)
+        if ttl > 0:
+            cache_setex_bytes(compressed_cache_key(cache_key, encoding), ttl, new_variant)
+    return response
+
+
+async def cached_json_response_async(
+    request: Request,
+    cache_key: str,
+    client,
+    wrap: Optional[Callable[[bytes], bytes]] = None,
+) -> Optional[Response]:
+    """cached_json_response 의 asyncio 버전 (client: app.state.redis, setting/redis_async.py)"""
+    encoding = request_encoding(request)
+    if encoding is None:
+        cached, = await cache_mget_bytes_async(client, cache_key)
+        compressed = None
+    else:
+        cached, compressed = await cache_mget_bytes_async(client, cache_key, compressed_cache_key(cache_key, encoding))
+    if cached is None:
+        return None
+
+    response, new_variant = _response_from_cache(cached, compressed, encoding, wrap)
+    if new_variant is not None:
+        ttl = await cache_ttl_async(client, cache_key)
+        if ttl > 0:
+            await cache_setex_many_async(client, [(compressed_cache_key(cache_key, encoding), ttl, new_variant)])
+    return response
+
+
+class CompressionMiddleware:
+    """
+    Accept-Encoding 에 따라 응답을 br/gzip 으로 압축하는 순수 ASGI 미들웨어.
+    본문이 COMPRESSION_MIN_SIZE 에 도달할 때까지 모았다가, 한 번에 끝나면 통째로,
+    청크가 이어지면(함수 미들웨어를 거친 응답 등) 스트리밍으로 압축합니다.
+    이미 인코딩된 응답은 압축하지 않습니다.
+    """
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = negotiate_encoding(accept_encoding)
+
+        start_message = None
+        passthrough = False
+        buffer = bytearray()
+        compressor = None
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough, compressor
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                if not is_compressible(headers.get("content-type", "")):
+                    passthrough = True
+                    await send(message)
+                    return
+                if "accept-encoding" not in headers.get("vary", "").lower():
+                    headers.add_vary_header("Accept-Encoding")
+                if encoding is None or "content-encoding" in headers:
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message     # 본문 크기를 보고 압축 여부 결정
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            more_body = message.get("more_body", False)
+            if compressor is not None:
+                await send({"type": "http.response.body",
+                            "body": compressor.compress(message.get("body", b""), final=not more_body),
+                            "more_body": more_body})
+                return
+
+            buffer.extend(message.get("body", b""))
+            headers = MutableHeaders(raw=start_message["headers"])
+            if not more_body:
+                body = bytes(buffer)
+                if len(body) >= self.minimum_size:
+                    body = compress(body, encoding)
+                    headers["Content-Encoding"] = encoding
+                    headers["Content-Length"] = str(len(body))
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+            elif len(buffer) >= self.minimum_size:
+                compressor = StreamCompressor(encoding)
+                headers["Content-Encoding"] = encoding
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+                await send(start_message)
+                await send({"type": "http.response.body",
+                            "body": compressor.compress(bytes(buffer), final=False),
+                            "more_body": True})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,319 @@
+# ETag / 조건부 GET
+#
+# 읽기 엔드포인트의 ETag 는 응답 본문이 아니라 Redis 에 저장한 데이터 버전으로 만든다.
+# 쓰기 작업이 관련 scope 의 버전을 올리면(bump_data_version) ETag 가 바뀌고,
+# If-None-Match 가 현재 ETag 와 같으면 쿼리/직렬화 없이 304 를 반환한다.
+# 버전 키가 없으면(최초 조회, eviction, flush) 현재 시각(ns)으로 초기화하므로 이전 ETag 와 겹치지 않는다.
+# Redis 를 사용할 수 없으면 ETag 없이 평소처럼 응답한다.
+# Redis 장애로 버전을 올리지 못한 scope 는 보류 목록(워커 메모리 + 모든 워커가 보는 DB 테이블)에 두고
+# Redis 가 다시 응답하면 올린다. 보류 중인 scope 는 버전을 믿을 수 없으므로 get_data_versions 가 None 을 반환한다.
+# (ETag/버전 키 캐시 없이 응답) 다른 워커가 남긴 보류 scope 는 이 워커가 DB 를 확인하기 전까지 알 수 없으므로,
+# Redis 실패를 겪은 워커(또는 막 시작한 워커)는 DB 의 보류 목록을 반영할 때까지 모든 scope 의 ETag 를 내지 않고,
+# 그 밖의 워커도 PENDING_BUMP_SYNC_INTERVAL 마다 DB 를 확인한다.
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Optional
+
+from dotenv import load_dotenv
+from fastapi import Request, Response
+
+import setting.redis_client as cache
+import setting.redis_async as redis_async
+from models import SessionLocal, PendingVersionBump
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+DATA_VERSION_TTL = 30 * 24 * 60 * 60     # 쓰기가 없는 scope 의 버전 키 유지 기간
+ETAG_CACHE_CONTROL = "private, no-cache"  # 사용자별 응답, 매번 ETag 로 재검증
+# 다른 워커가 DB 에 남긴 보류 scope 를 확인하는 주기 (초, Redis 호출이 성공할 때 확인)
+PENDING_BUMP_SYNC_INTERVAL = float(os.getenv("PENDING_BUMP_SYNC_INTERVAL", 5))
+
+# 이 워커에서 올리지 못한 scope -> 실패 순번 (재시도 중 같은 scope 가 다시 실패하면 순번이 바뀌어 목록에 남음)
+_pending_bumps = {}
+_pending_sequence = 0
+_pending_lock = threading.Lock()
+_replay_lock = threading.Lock()
+
+# DB 의 보류 목록을 반영했는지 (시작 직후와 Redis 실패 후에는 False, 그동안 모든 scope 의 ETag 를 내지 않음)
+_versions_synced = False
+_failure_generation = 0     # Redis 실패 횟수 (동기화 중 실패가 있었는지 확인)
+_last_sync = 0.0
+
+
+def data_version_key(scope: str) -> str:
+    return f"data_version:{scope}"
+
+
+# --- scope 이름 (읽기/쓰기 양쪽에서 같은 이름을 쓰도록 함수로 정의) ---
+def objects_scope(university: str) -> str:
+    return f"objects:{university}"
+
+
+def places_scope(university: str) -> str:
+    return f"places:{university}"
+
+
+def place_scope(place_master_id: int) -> str:
+    return f"place:{place_master_id}"
+
+
+def timetable_scope(user_uuid: str) -> str:
+    return f"timetable:{user_uuid}"
+
+
+def _queue_initial_versions(pipe, missing: list):
+    """없는 버전 키를 현재 시각(ns)으로 초기화(SET NX)하고 다시 읽는 명령을 파이프라인에 추가합니다."""
+    initial = str(time.time_ns())
+    for key in missing:
+        pipe.set(key, initial, ex=DATA_VERSION_TTL, nx=True)
+    for key in missing:
+        pipe.get(key)
+
+
+def _with_initial_versions(keys: list, versions: list, missing: list, replies: list) -> list:
+    initialized = {
+        key: value.decode() if isinstance(value, bytes) else value
+        for key, value in zip(missing, replies[len(missing):])
+    }
+    return [initialized.get(key) if version is None else version for key, version in zip(keys, versions)]
+
+
+def _has_pending_bump(scopes) -> bool:
+    if not _versions_synced:
+        # 다른 Redis 호출이 없어도 동기화가 시작되도록 함 (Redis 장애 중에는 브레이커 복구 후 성공 시 시작)
+        if cache.redis_breaker.state == cache.redis_breaker.CLOSED:
+            _start_sync()
+        return True
+    return bool(_pending_bumps) and any(scope in _pending_bumps for scope in scopes)
+
+
+def get_data_versions(*scopes: str) -> Optional[list]:
+    """
+    scope 별 현재 버전. Redis 를 사용할 수 없거나 버전 올리기가 보류 중인 scope 가 있으면
+    (DB 의 보류 목록을 아직 반영하지 못했으면) None
+    """
+    if _has_pending_bump(scopes):
+        return None
+    keys = [data_version_key(scope) for scope in scopes]
+    versions = cache.cache_mget(*keys)     # L1(setting/local_cache.py) -> Redis
+    if versions is None:
+        return None
+
+    missing = [key for key, version in zip(keys, versions) if version is None]
+    if missing:
+        pipe = cache.redis_client.pipeline(transaction=False)
+        _queue_initial_versions(pipe, missing)
+        replies = cache._guarded(pipe.execute, default=None)
+        if replies is None:
+            return None
+        versions = _with_initial_versions(keys, versions, missing, replies)
+    return versions
+
+
+async def get_data_versions_async(client, *scopes: str) -> Optional[list]:
+    """get_data_versions 의 asyncio 버전 (client: app.state.redis)"""
+    if _has_pending_bump(scopes):
+        return None
+    keys = [data_version_key(scope) for scope in scopes]
+    versions = await redis_async.cache_mget_async(client, *keys)
+    if versions is None:
+        return None
+
+    missing = [key for key, version in zip(keys, versions) if version is None]
+    if missing:
+        pipe = client.pipeline(transaction=False)
+        _queue_initial_versions(pipe, missing)
+        replies = await redis_async._guarded(pipe.execute, default=None)
+        if replies is None:
+            return None
+        versions = _with_initial_versions(keys, versions, missing, replies)
+    return versions
+
+
+def _execute_bump(scopes) -> bool:
+    initial = str(time.time_ns())
+    keys = [data_version_key(scope) for scope in scopes]
+    pipe = cache.redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipe.set(key, initial, nx=True)
+        pipe.incr(key)
+        pipe.expire(key, DATA_VERSION_TTL)
+    # 모든 워커의 L1 에 있는 이전 버전 삭제 (같은 파이프라인)
+    cache.publish_invalidation(*keys, pipe=pipe)
+    return cache._guarded(pipe.execute) is not None
+
+
+def bump_data_version(*scopes: str) -> bool:
+    """
+    쓰기 작업 후 scope 들의 버전을 올립니다.
+    Redis 를 사용할 수 없으면 보류해 두었다가 Redis 가 다시 응답하면 올립니다.
+    반환값: 바로 반영됐으면 True, 보류됐으면 False
+    """
+    global _pending_sequence
+    if not scopes:
+        return True
+    if _execute_bump(scopes):
+        return True
+    with _pending_lock:
+        _pending_sequence += 1
+        for scope in scopes:
+            _pending_bumps[scope] = _pending_sequence
+    _persist_pending_bumps(scopes)
+    logger.warning("Data version bump deferred until Redis recovers: %s", ", ".join(scopes))
+    return False
+
+
+def _persist_pending_bumps(scopes):
+    """다른 워커도 보류 중인 scope 를 알 수 있도록 DB 에 기록 (이 워커가 종료돼도 다른 워커가 올림)"""
+    db = SessionLocal()
+    try:
+        failed_at = datetime.utcnow()
+        for scope in scopes:
+            db.merge(PendingVersionBump(scope=scope, failed_at=failed_at))
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Failed to record deferred data version bumps: %s", ", ".join(scopes))
+    finally:
+        db.close()
+
+
+def _load_shared_pending() -> dict:
+    """DB 의 보류 목록 (scope -> 실패 시각)"""
+    db = SessionLocal()
+    try:
+        return dict(db.query(PendingVersionBump.scope, PendingVersionBump.failed_at).all())
+    finally:
+        db.close()
+
+
+def _delete_shared_pending(shared: dict):
+    """올린 scope 를 DB 에서 삭제 (그 사이 다시 실패해 실패 시각이 바뀐 scope 는 남김)"""
+    db = SessionLocal()
+    try:
+        for scope, failed_at in shared.items():
+            db.query(PendingVersionBump)\
+                .filter(PendingVersionBump.scope == scope, PendingVersionBump.failed_at == failed_at)\
+                .delete(synchronize_session=False)
+        db.commit()
+    except Exception:
+        db.rollback()
+        # 남은 scope 는 다음 동기화에서 한 번 더 올라갈 뿐이므로 기록만 함
+        logger.exception("Failed to clear replayed data version bumps")
+    finally:
+        db.close()
+
+
+def pending_bump_scopes() -> list:
+    """Redis 복구를 기다리는 scope 목록 (이 워커 + DB, 관리자 상태 조회용)"""
+    with _pending_lock:
+        scopes = set(_pending_bumps)
+    try:
+        scopes.update(_load_shared_pending())
+    except Exception:
+        logger.exception("Failed to load deferred data version bumps")
+    return sorted(scopes)
+
+
+def _sync_pending_bumps():
+    """이 워커와 DB 의 보류 scope 를 올리고, 성공하면 다시 ETag 를 냅니다."""
+    global _versions_synced, _last_sync
+    try:
+        generation = _failure_generation
+        with _pending_lock:
+            pending = dict(_pending_bumps)
+        try:
+            shared = _load_shared_pending()
+        except Exception:
+            logger.exception("Failed to load deferred data version bumps")
+            return
+        scopes = set(pending).union(shared)
+        if scopes and not _execute_bump(list(scopes)):
+            return
+        with _pending_lock:
+            for scope, sequence in pending.items():
+                if _pending_bumps.get(scope) == sequence:
+                    del _pending_bumps[scope]
+        if shared:
+            _delete_shared_pending(shared)
+        if scopes:
+            logger.info("Replayed %d deferred data version bumps", len(scopes))
+        _last_sync = time.monotonic()
+        # 동기화 중 Redis 실패가 있었으면 다음 성공 때 다시 동기화
+        _versions_synced = generation == _failure_generation
+    finally:
+        _replay_lock.release()
+
+
+def _start_sync():
+    # 호출한 스레드(이벤트 루프일 수 있음)를 막지 않도록 별도 스레드에서 동기화 (동시에 하나만)
+    if _replay_lock.acquire(blocking=False):
+        threading.Thread(target=_sync_pending_bumps, name="data-version-replay", daemon=True).start()
+
+
+def _on_redis_success():
+    if _pending_bumps or not _versions_synced or time.monotonic() - _last_sync >= PENDING_BUMP_SYNC_INTERVAL:
+        _start_sync()
+
+
+def _on_redis_failure():
+    # 다른 워커도 버전을 올리지 못했을 수 있으므로 DB 의 보류 목록을 확인할 때까지 ETag 를 내지 않음
+    global _versions_synced, _failure_generation
+    _failure_generation += 1
+    _versions_synced = False
+
+
+cache.redis_breaker.add_success_listener(_on_redis_success)
+cache.redis_breaker.add_failure_listener(_on_redis_failure)
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def resource_etag(name: str, scopes: list, *extra) -> Optional[str]:
+    """
+    엔드포인트 이름, scope 버전, 추가 값(사용자 id, 셔플 기준 시각 등)으로 ETag 를 만듭니다.
+    Redis 를 사용할 수 없으면 None
+    """
+    etag, _ = resource_etag_versions(name, scopes, *extra)
+    return etag
+
+
+def resource_etag_versions(name: str, scopes: list, *extra) -> tuple:
+    """resource_etag 와 같되 조회한 scope 버전 목록도 함께 반환합니다. (캐시 키 버전을 같은 MGET 으로 얻을 때)"""
+    versions = get_data_versions(*scopes)
+    if versions is None:
+        return None, None
+    return make_etag(name, *scopes, *versions, *extra), versions
+
+
+def etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """If-None-Match 가 etag 와 일치하는지 (약한 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header or etag is None:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def set_etag_headers(response: Response, etag: Optional[str]):
+    if etag is not None:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = ETAG_CACHE_CONTROL
+
+
+def not_modified_response(etag: str) -> Response:
+    response = Response(status_code=304)
+    set_etag_headers(response, etag)
+    return response
@@ -0,0 +1,274 @@
+# 공용 외부 HTTP 클라이언트
+#
+# 워커당 하나의 httpx.AsyncClient 를 공유해 커넥션을 재사용한다.
+# 전송 계층에서 호스트별 동시 연결 제한, 호스트별 서킷 브레이커, 지연 시간 통계를 처리하고,
+# request() 헬퍼는 멱등 메서드에 한해 jitter 를 둔 재시도를 수행한다.
+# /proxy 는 임의의 target_url 을 받으므로 호스트별 상태가 무한히 늘지 않도록,
+# 메트릭 라벨/통계는 HTTP_TRACKED_HOSTS 만 호스트별로 두고 나머지는 "other" 로 합산하며,
+# 그 외 호스트의 서킷 브레이커/동시 연결 제한은 최근 사용한 HTTP_MAX_UNTRACKED_HOSTS 개만 유지한다.
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import defaultdict
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+from cachetools import LRUCache
+from dotenv import load_dotenv
+
+from setting.circuit_breaker import CircuitBreaker
+from setting.metrics import OUTBOUND_HTTP_DURATION, OUTBOUND_HTTP_REQUESTS
+from setting.tracing import start_span, SPAN_KIND_CLIENT, STATUS_ERROR
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 3))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", 10))
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", 20))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", 2))
+HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", 0.2))   # 재시도 기본 대기 시간(초)
+HTTP_BREAKER_FAILURE_THRESHOLD = int(os.getenv("HTTP_BREAKER_FAILURE_THRESHOLD", 5))
+HTTP_BREAKER_RECOVERY_TIMEOUT = float(os.getenv("HTTP_BREAKER_RECOVERY_TIMEOUT", 15))
+HTTP_TRACKED_HOSTS = frozenset(filter(None, os.getenv(
+    "HTTP_TRACKED_HOSTS",
+    "kapi.kakao.com,appleid.apple.com,accounts.google.com,api.openai.com,everytime.kr,api.everytime.kr",
+).split(",")))
+HTTP_MAX_UNTRACKED_HOSTS = int(os.getenv("HTTP_MAX_UNTRACKED_HOSTS", 256))
+OTHER_HOST = "other"    # HTTP_TRACKED_HOSTS 외 호스트의 메트릭 라벨
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRYABLE_STATUS_CODES = {502, 503, 504}
+
+
+class CircuitOpenError(httpx.TransportError):
+    """호스트의 서킷 브레이커가 열려 있어 요청을 보내지 않았을 때 발생합니다."""
+
+
+class _RejectAllCookies(DefaultCookiePolicy):
+    # 공용 클라이언트에 외부 서비스 쿠키가 쌓여 다른 요청(특히 /proxy)으로 새지 않도록 함
+    def set_ok(self, cookie, request):
+        return False
+
+
+# 호스트별 상태 (HTTP_TRACKED_HOSTS 는 계속 유지, 그 외 호스트는 LRU)
+_host_breakers = {}
+_host_semaphores = {}
+_untracked_breakers = LRUCache(maxsize=HTTP_MAX_UNTRACKED_HOSTS)
+_untracked_semaphores = LRUCache(maxsize=HTTP_MAX_UNTRACKED_HOSTS)
+outbound_stats = defaultdict(lambda: {  # host_label -> 통계
+    "requests": 0,
+    "errors": 0,
+    "rejected": 0,
+    "total_seconds": 0.0,
+    "max_seconds": 0.0,
+})
+
+
+def host_label(host: str) -> str:
+    """메트릭 라벨/통계 키로 쓸 호스트 이름"""
+    return host if host in HTTP_TRACKED_HOSTS else OTHER_HOST
+
+
+def get_host_breaker(host: str) -> CircuitBreaker:
+    breakers = _host_breakers if host in HTTP_TRACKED_HOSTS else _untracked_breakers
+    breaker = breakers.get(host)
+    if breaker is None:
+        breaker = breakers[host] = CircuitBreaker(
+            f"http:{host}",
+            failure_threshold=HTTP_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=HTTP_BREAKER_RECOVERY_TIMEOUT,
+        )
+    return breaker
+
+
+def _get_host_semaphore(host: str) -> asyncio.Semaphore:
+    semaphores = _host_semaphores if host in HTTP_TRACKED_HOSTS else _untracked_semaphores
+    semaphore = semaphores.get(host)
+    if semaphore is None:
+        semaphore = semaphores[host] = asyncio.Semaphore(HTTP_MAX_CONNECTIONS_PER_HOST)
+    return semaphore
+
+
+def get_host_breakers() -> list:
+    """메트릭으로 내보낼 서킷 브레이커 (HTTP_TRACKED_HOSTS 만)"""
+    return list(_host_breakers.values())
+
+
+def _record(label: str, elapsed: float, error: bool):
+    OUTBOUND_HTTP_DURATION.observe(elapsed, label)
+    OUTBOUND_HTTP_REQUESTS.inc(label, "error" if error else "ok")
+    stats = outbound_stats[label]
+    stats["requests"] += 1
+    stats["total_seconds"] += elapsed
+    stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+    if error:
+        stats["errors"] += 1
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """응답 본문을 다 읽고 닫을 때 호스트 슬롯을 반환합니다."""
+
+    def __init__(self, stream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """호스트별 동시 연결 제한, 서킷 브레이커, 지연 시간 기록을 추가한 전송 계층"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        label = host_label(host)
+        breaker = get_host_breaker(host)
+        if not breaker.allow_request():
+            outbound_stats[label]["rejected"] += 1
+            OUTBOUND_HTTP_REQUESTS.inc(label, "rejected")
+            raise CircuitOpenError(f"Circuit breaker open for {host}", request=request)
+
+        semaphore = _get_host_semaphore(host)
+        await semaphore.acquire()
+        released = False
+
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                semaphore.release()
+
+        span = start_span(f"HTTP {request.method}", SPAN_KIND_CLIENT, {
+            "http.request.method": request.method,
+            "server.address": host,
+            "url.path": request.url.path,
+        })
+        if span is not None:
+            request.headers["traceparent"] = span.traceparent
+
+        start = time.perf_counter()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError as e:
+            release()
+            breaker.record_failure()
+            _record(label, time.perf_counter() - start, error=True)
+            if span is not None:
+                span.end(e)
+            raise
+        except BaseException as e:
+            release()
+            if span is not None:
+                span.end(e)
+            raise
+
+        # 지연 시간은 응답 헤더 수신까지 (TTFB)
+        server_error = response.status_code >= 500
+        if server_error:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        _record(label, time.perf_counter() - start, error=server_error)
+        if span is not None:
+            span.set_attribute("http.response.status_code", response.status_code)
+            if server_error:
+                span.status_code = STATUS_ERROR
+            span.end()
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """워커 공용 AsyncClient 를 반환합니다. (처음 호출 시 생성)"""
+    global _client
+    if _client is None:
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS // 2,
+            ),
+        )
+        _client = httpx.AsyncClient(
+            transport=InstrumentedTransport(transport),
+            timeout=httpx.Timeout(HTTP_READ_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+            cookies=CookieJar(policy=_RejectAllCookies()),
+        )
+    return _client
+
+
+async def close_http_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def request(method: str, url: str, *, max_retries: int = None, **kwargs) -> httpx.Response:
+    """
+    공용 클라이언트로 요청을 보냅니다.
+    멱등 메서드(GET/HEAD/OPTIONS/PUT/DELETE)는 연결 오류나 502/503/504 응답 시
+    full jitter 백오프로 재시도합니다. 그 외 메서드는 재시도하지 않습니다.
+    """
+    method = method.upper()
+    if max_retries is None:
+        max_retries = HTTP_MAX_RETRIES if method in IDEMPOTENT_METHODS else 0
+
+    client = get_http_client()
+    for attempt in range(max_retries + 1):
+        last_attempt = attempt == max_retries
+        try:
+            response = await client.request(method, url, **kwargs)
+        except CircuitOpenError:
+            raise
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            logger.info("Retrying %s %s after transport error: %s", method, url, e)
+        else:
+            if last_attempt or response.status_code not in RETRYABLE_STATUS_CODES:
+                return response
+            logger.info("Retrying %s %s after status %d", method, url, response.status_code)
+
+        await asyncio.sleep(random.uniform(0, HTTP_RETRY_BACKOFF * (2 ** attempt)))
+
+
+def outbound_snapshot() -> dict:
+    """호스트별 호출 통계와 서킷 브레이커 상태 (HTTP_TRACKED_HOSTS 외 호스트는 other 로 합산)"""
+    hosts = {}
+    for label, stats in list(outbound_stats.items()):
+        count = stats["requests"]
+        breaker = _host_breakers.get(label)
+        hosts[label] = {
+            **stats,
+            "avg_ms": round(stats["total_seconds"] / count * 1000, 2) if count else 0.0,
+            "max_ms": round(stats["max_seconds"] * 1000, 2),
+            "breaker": breaker.snapshot() if breaker is not None else None,
+        }
+    return hosts
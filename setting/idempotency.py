@@ -0,0 +1,175 @@
+# Idempotency-Key 처리 (업로드 + 등록 엔드포인트)
+#
+#   @router.post("/api/v1/register", tags=["Object"])
+#   @idempotent("object_register")
+#   async def register_object(request: Request, ...): ...
+#
+# 클라이언트가 Idempotency-Key 헤더를 보내면 (사용자, 키) 별로 Redis 에 처리 상태를 기록한다.
+# - 처음 온 요청: processing 상태를 SET NX 로 잡고 실행, 성공 응답을 IDEMPOTENCY_TTL 동안 저장
+# - 재시도(완료 후): S3 업로드/DB 저장/GPT 호출 없이 저장된 응답을 그대로 반환 (Idempotent-Replayed: true)
+# - 재시도(처리 중): 원래 요청이 끝날 때까지 최대 IDEMPOTENCY_WAIT_TIMEOUT 초 기다렸다가 그 응답을 반환,
+#   그래도 끝나지 않으면 409 + Retry-After
+# - 같은 키로 다른 내용(폼 값/파일)을 보내면 422
+# 원래 요청이 실패하면 키를 지워 재시도가 다시 실행되도록 한다.
+# 처리 중 상태는 원래 요청이 실행되는 동안 주기적으로 TTL 을 연장한다. (GPT 호출이 잠금 TTL 보다 오래 걸려도 중복 실행 방지)
+# 헤더가 없거나 Redis 를 사용할 수 없으면 평소처럼 실행한다.
+# Redis 는 app.state.redis(asyncio 클라이언트, setting/redis_async.py)로 접근해 기다리는 동안에도 이벤트 루프를 막지 않는다.
+
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import time
+from typing import Optional
+
+import orjson
+from dotenv import load_dotenv
+from fastapi import HTTPException, Request, Response, UploadFile
+from fastapi.encoders import jsonable_encoder
+
+import setting.redis_async as redis_async
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_REPLAYED_HEADER = "Idempotent-Replayed"
+IDEMPOTENCY_TTL = int(os.getenv("IDEMPOTENCY_TTL", 24 * 60 * 60))                   # 완료 응답 보관 시간(초)
+IDEMPOTENCY_LOCK_TTL_MS = int(os.getenv("IDEMPOTENCY_LOCK_TTL_MS", 120 * 1000))     # 처리 중 상태 유지 시간 (워커가 죽은 경우 대비, 실행 중에는 연장)
+IDEMPOTENCY_WAIT_TIMEOUT = float(os.getenv("IDEMPOTENCY_WAIT_TIMEOUT", 30.0))       # 처리 중인 원래 요청을 기다리는 시간(초)
+IDEMPOTENCY_POLL_INTERVAL = 0.2
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+STATE_PROCESSING = "processing"
+STATE_DONE = "done"
+
+
+def idempotency_cache_key(namespace: str, user_uuid: str, key: str) -> str:
+    return f"idempotency:{namespace}:{user_uuid}:{key}"
+
+
+def _describe(value):
+    if isinstance(value, UploadFile):
+        return [value.filename, value.size, value.content_type]
+    if isinstance(value, (list, tuple)):
+        return [_describe(item) for item in value]
+    return value
+
+
+def request_fingerprint(kwargs: dict) -> str:
+    """폼 값과 업로드 파일(이름/크기/형식)로 만든 요청 지문 (같은 키로 다른 요청을 보냈는지 확인)"""
+    params = {
+        name: _describe(value) for name, value in kwargs.items()
+        if not isinstance(value, (Request, Response))
+    }
+    encoded = orjson.dumps(params, default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+async def _load(client, cache_key: str) -> Optional[dict]:
+    raw = await redis_async.cache_peek_async(client, cache_key)
+    return orjson.loads(raw) if raw else None
+
+
+def _stored_response(record: dict) -> Response:
+    return Response(
+        content=record["body"],
+        status_code=record["status_code"],
+        media_type="application/json",
+        headers={IDEMPOTENCY_REPLAYED_HEADER: "true"},
+    )
+
+
+def _completed_record(result, fingerprint: str) -> Optional[dict]:
+    """저장할 완료 응답. 2xx JSON 이 아니면 None"""
+    if isinstance(result, Response):
+        if 200 <= result.status_code < 300 and (result.media_type or "").startswith("application/json"):
+            body, status_code = result.body, result.status_code
+        else:
+            return None
+    else:
+        body, status_code = orjson.dumps(result, default=jsonable_encoder), 200
+    return {"state": STATE_DONE, "fingerprint": fingerprint, "status_code": status_code, "body": body.decode()}
+
+
+async def _keep_lock_alive(client, cache_key: str):
+    """원래 요청이 실행되는 동안 처리 중 상태가 만료되지 않도록 TTL 의 1/3 마다 연장"""
+    while True:
+        await asyncio.sleep(IDEMPOTENCY_LOCK_TTL_MS / 3000)
+        await redis_async.cache_extend_lock_async(client, cache_key, IDEMPOTENCY_LOCK_TTL_MS)
+
+
+async def _wait_for_original(client, cache_key: str) -> Optional[dict]:
+    """처리 중인 원래 요청의 완료 기록. 기다리는 중 키가 사라지면(원래 요청 실패) None"""
+    deadline = time.monotonic() + IDEMPOTENCY_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(IDEMPOTENCY_POLL_INTERVAL)
+        record = await _load(client, cache_key)
+        if record is None or record["state"] == STATE_DONE:
+            return record
+    raise HTTPException(
+        status_code=409,
+        detail="같은 Idempotency-Key 의 요청이 아직 처리 중입니다.",
+        headers={"Retry-After": "1"},
+    )
+
+
+def idempotent(namespace: str):
+    """
+    Idempotency-Key 헤더를 지원하는 엔드포인트 데코레이터. 엔드포인트는 request: Request 파라미터를 가져야 합니다.
+    namespace: 키 접두사 (엔드포인트별로 구분)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = kwargs.get("request")
+            key = request.headers.get(IDEMPOTENCY_HEADER) if request is not None else None
+            user_uuid = getattr(request.state, "user_uuid", None) if request is not None else None
+            client = redis_async.get_async_redis(request) if request is not None else None
+            if not key or not user_uuid or client is None:
+                return await func(*args, **kwargs)
+            if len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+                raise HTTPException(status_code=400, detail="Idempotency-Key 가 너무 깁니다.")
+
+            cache_key = idempotency_cache_key(namespace, user_uuid, key)
+            fingerprint = request_fingerprint(kwargs)
+            processing = orjson.dumps({"state": STATE_PROCESSING, "fingerprint": fingerprint}).decode()
+
+            while True:
+                acquired = await redis_async.cache_acquire_lock_async(
+                    client, cache_key, IDEMPOTENCY_LOCK_TTL_MS, processing)
+                if acquired is None:
+                    return await func(*args, **kwargs)     # Redis 를 사용할 수 없음
+                if acquired:
+                    break
+
+                # 같은 키의 요청이 이미 있음: 완료됐으면 저장된 응답, 처리 중이면 기다림
+                record = await _load(client, cache_key)
+                if record is not None and record["fingerprint"] != fingerprint:
+                    raise HTTPException(status_code=422, detail="같은 Idempotency-Key 로 다른 요청을 보냈습니다.")
+                if record is not None and record["state"] == STATE_PROCESSING:
+                    record = await _wait_for_original(client, cache_key)
+                if record is not None:
+                    return _stored_response(record)
+                # 원래 요청이 실패해 키가 지워짐: 다시 실행 시도
+
+            keepalive = asyncio.create_task(_keep_lock_alive(client, cache_key))
+            try:
+                result = await func(*args, **kwargs)
+            except BaseException:
+                await redis_async.cache_release_lock_async(client, cache_key)
+                raise
+            finally:
+                keepalive.cancel()
+
+            record = _completed_record(result, fingerprint)
+            if record is None:
+                await redis_async.cache_release_lock_async(client, cache_key)
+            else:
+                await redis_async._guarded(client.set, cache_key, orjson.dumps(record), ex=IDEMPOTENCY_TTL)
+            return result
+
+        return wrapper
+    return decorator
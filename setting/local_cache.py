@@ -0,0 +1,175 @@
+# 프로세스 내 L1 캐시 (Redis 앞단)
+#
+# LOCAL_CACHE_NAMESPACES 에 속한 키는 Redis 에서 읽은 값을 워커 메모리의 LRU 에 최대 LOCAL_CACHE_TTL 초 보관해
+# 다음 조회를 네트워크 왕복/압축 없이 처리한다. 크기는 항목 수가 아니라 값의 bytes 합계(LOCAL_CACHE_MAX_BYTES)로 제한한다.
+#
+# 피드/검색 캐시 키에는 네임스페이스 버전이 들어 있어(setting/cache_namespace.py) 같은 키의 값은 바뀌지 않는다.
+# 바뀌는 것은 data_version 카운터뿐이므로 bump_data_version/cache_delete 가 LOCAL_CACHE_CHANNEL 로 키를 발행하고,
+# 모든 워커의 구독 스레드가 그 키를 L1 에서 지운다.
+# - 무효화 메시지와 Redis 조회가 엇갈려 이전 값이 다시 들어가지 않도록, 조회 전에 읽은 generation 이
+#   그 사이 바뀌었으면 L1 에 저장하지 않는다.
+# - 구독이 끊기면 그동안의 무효화를 놓쳤을 수 있으므로 L1 을 비우고, 다시 구독할 때까지 L1 을 사용하지 않는다.
+# - 메시지를 놓치더라도 LOCAL_CACHE_TTL 이 지나면 Redis 값을 다시 읽는다.
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import orjson
+from dotenv import load_dotenv
+
+from setting.metrics import LOCAL_CACHE_EVICTIONS
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+LOCAL_CACHE_ENABLED = os.getenv("LOCAL_CACHE_ENABLED", "true").lower() == "true"
+LOCAL_CACHE_MAX_BYTES = int(os.getenv("LOCAL_CACHE_MAX_BYTES", 32 * 1024 * 1024))   # 워커별 L1 최대 크기
+LOCAL_CACHE_TTL = float(os.getenv("LOCAL_CACHE_TTL", 10))                          # 항목 최대 보관 시간(초)
+LOCAL_CACHE_NAMESPACES = frozenset(filter(None, os.getenv(
+    "LOCAL_CACHE_NAMESPACES",
+    "data_version,object_feed,place_feed,place_index,place_search,place_search_coords,compressed",
+).split(",")))
+LOCAL_CACHE_CHANNEL = os.getenv("LOCAL_CACHE_CHANNEL", "cache_invalidation")
+RESUBSCRIBE_INTERVAL = 1.0      # 구독이 끊겼을 때 재시도 간격(초)
+POLL_TIMEOUT = 1.0              # 메시지 대기 시간(초), stop() 확인 주기
+
+ENTRY_OVERHEAD = 100            # 키/튜플 등 항목당 대략적인 추가 메모리(bytes)
+
+
+class LocalCache:
+    """bytes 값을 저장하는 스레드 안전 LRU. 크기는 키 + 값 길이의 합계로 제한합니다."""
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.active = False         # 무효화 채널을 구독 중일 때만 사용
+        self.generation = 0         # 무효화/비우기마다 증가
+        self._entries = OrderedDict()   # key -> (만료 시각, 값, 크기)
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def accepts(self, namespace: str) -> bool:
+        return self.active and namespace in LOCAL_CACHE_NAMESPACES
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, size = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._bytes -= size
+                LOCAL_CACHE_EVICTIONS.inc("expired")
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, generation: int):
+        """generation: Redis 조회 전에 읽은 self.generation (그 사이 무효화가 있었으면 저장하지 않음)"""
+        size = len(key) + len(value) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation != self.generation or not self.active:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (time.monotonic() + self.ttl, value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                LOCAL_CACHE_EVICTIONS.inc("size")
+
+    def delete(self, *keys: str):
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                entry = self._entries.pop(key, None)
+                if entry is not None:
+                    self._bytes -= entry[2]
+                    LOCAL_CACHE_EVICTIONS.inc("invalidated")
+
+    def clear(self):
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "active": self.active,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "namespaces": sorted(LOCAL_CACHE_NAMESPACES),
+            }
+
+
+local_cache = LocalCache(LOCAL_CACHE_MAX_BYTES, LOCAL_CACHE_TTL)
+
+
+def invalidation_message(keys) -> bytes:
+    return orjson.dumps(list(keys))
+
+
+class InvalidationListener:
+    """LOCAL_CACHE_CHANNEL 을 구독해 다른 워커가 발행한 키를 L1 에서 지우는 백그라운드 스레드"""
+
+    def __init__(self, cache: LocalCache):
+        self.cache = cache
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if not LOCAL_CACHE_ENABLED or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="local-cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=POLL_TIMEOUT * 2)
+            self._thread = None
+
+    def _run(self):
+        import setting.redis_client as redis_cache
+
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                pubsub = redis_cache.redis_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(LOCAL_CACHE_CHANNEL)
+                self.cache.clear()
+                self.cache.active = True
+                logger.info("Local cache enabled (subscribed to %s)", LOCAL_CACHE_CHANNEL)
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=POLL_TIMEOUT)
+                    if message is not None and message["type"] == "message":
+                        self.cache.delete(*orjson.loads(message["data"]))
+            except Exception as e:
+                logger.warning("Local cache invalidation subscription failed: %s", e)
+            finally:
+                # 구독이 끊긴 동안의 무효화는 알 수 없으므로 L1 을 비우고 사용하지 않음
+                self.cache.active = False
+                self.cache.clear()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            self._stop.wait(RESUBSCRIBE_INTERVAL)
+
+
+invalidation_listener = InvalidationListener(local_cache)
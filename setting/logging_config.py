@@ -0,0 +1,147 @@
+# 구조화(JSON) 로깅 설정
+#
+# 모든 로그는 QueueHandler 로 큐에 넣기만 하고, 실제 stdout/파일 쓰기는
+# QueueListener 의 백그라운드 스레드가 담당한다. 요청 핸들러는 I/O 로 블로킹되지 않는다.
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+
+load_dotenv()
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.getenv("LOG_FILE")  # 지정 시 stdout 과 함께 파일에도 기록
+
+# 접근 로그 샘플링: 호출량이 많은 라우트는 일부만 기록 (4xx/5xx, 느린 요청은 항상 기록)
+ACCESS_LOG_SLOW_MS = float(os.getenv("ACCESS_LOG_SLOW_MS", 1000))
+DEFAULT_ACCESS_LOG_SAMPLE_RATES = {
+    "/api/v1/get_place_list": 0.1,
+    "/api/v1/get_object_list": 0.1,
+    "/api/v1/search/place": 0.1,
+    "/api/v1/search/place/coordinates": 0.1,
+    "/api/v1/message_check": 0.1,
+}
+
+
+def _parse_sample_rates(raw: str) -> dict:
+    """"/path=0.1,/other=0.5" 형식의 환경 변수를 dict 로 변환"""
+    rates = {}
+    for item in raw.split(","):
+        path, _, rate = item.strip().partition("=")
+        if path and rate:
+            rates[path] = float(rate)
+    return rates
+
+
+ACCESS_LOG_SAMPLE_RATES = {
+    **DEFAULT_ACCESS_LOG_SAMPLE_RATES,
+    **_parse_sample_rates(os.getenv("ACCESS_LOG_SAMPLE_RATES", "")),
+}
+
+# 요청 단위 컨텍스트 (미들웨어에서 설정)
+request_id_var: ContextVar = ContextVar("request_id", default=None)
+db_time_var: ContextVar = ContextVar("db_time", default=None)  # [누적 초] 형태의 리스트
+
+access_logger = logging.getLogger("mapda.access")
+
+_RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """LogRecord 를 한 줄짜리 JSON 으로 변환합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = request_id_var.get()
+        if request_id:
+            payload["request_id"] = request_id
+
+        # logger.info(..., extra={...}) 로 전달된 필드
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+_listener = None
+
+
+def setup_logging():
+    """루트 로거를 QueueHandler -> 백그라운드 writer 스레드 구조로 구성합니다."""
+    global _listener
+    if _listener is not None:
+        return
+
+    # 실제 I/O 를 담당하는 핸들러 (listener 스레드에서만 호출됨)
+    plain = logging.Formatter("%(message)s")
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if LOG_FILE:
+        handlers.append(logging.FileHandler(LOG_FILE, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(plain)
+
+    # JSON 포맷팅은 호출 스레드에서 수행 (request_id 컨텍스트를 읽기 위해)
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(JsonFormatter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(LOG_LEVEL)
+
+    # uvicorn 로그도 같은 파이프라인으로 보내고, uvicorn 접근 로그는 자체 접근 로그로 대체
+    for name in ("uvicorn", "uvicorn.error"):
+        logging.getLogger(name).handlers = []
+        logging.getLogger(name).propagate = True
+    logging.getLogger("uvicorn.access").disabled = True
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def instrument_db_timing(engine):
+    """SQLAlchemy 엔진에 쿼리 시간 측정 이벤트를 등록합니다. (요청별 DB 시간 누적)"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start_time"].pop()
+        db_time = db_time_var.get()
+        if db_time is not None:
+            db_time[0] += time.perf_counter() - started
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start_time"):
+            conn.info["query_start_time"].pop()
+
+
+def should_log_access(route: str, status_code: int, latency_ms: float) -> bool:
+    if status_code >= 400 or latency_ms >= ACCESS_LOG_SLOW_MS:
+        return True
+    rate = ACCESS_LOG_SAMPLE_RATES.get(route, 1.0)
+    return rate >= 1.0 or random.random() < rate
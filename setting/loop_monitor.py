@@ -0,0 +1,167 @@
+# 이벤트 루프 지연(lag) 모니터
+#
+# async 핸들러 안에서 동기 I/O(S3 업로드, requests, OpenAI, 동기 Redis 등)를 호출하면
+# 해당 워커의 이벤트 루프 전체가 멈춘다. 이 모니터는 주기적으로 sleep 하는 틱 태스크로
+# 루프 지연을 측정하고, 지연이 임계값을 넘으면 별도 워치독 스레드가 루프 스레드의
+# 스택을 캡처해 어떤 라우트가 루프를 막았는지 기록한다.
+
+import asyncio
+import inspect
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+from typing import Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 기본값은 비활성화 (LOOP_MONITOR_ENABLED=true 로 켬)
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "false").lower() == "true"
+LOOP_MONITOR_INTERVAL = float(os.getenv("LOOP_MONITOR_INTERVAL_MS", 50)) / 1000     # 틱 주기
+LOOP_LAG_THRESHOLD = float(os.getenv("LOOP_LAG_THRESHOLD_MS", 200)) / 1000          # 블로킹으로 간주할 지연
+LOOP_MONITOR_REPORT_INTERVAL = int(os.getenv("LOOP_MONITOR_REPORT_INTERVAL", 60))   # 백분위 로그 주기(초)
+
+LAG_SAMPLE_SIZE = 4096       # 백분위 계산에 사용할 최근 샘플 수
+MAX_BLOCKING_EVENTS = 50     # 보관할 최근 블로킹 이벤트 수
+
+
+def _percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float = LOOP_MONITOR_INTERVAL, threshold: float = LOOP_LAG_THRESHOLD):
+        self.interval = interval
+        self.threshold = threshold
+        self.samples = deque(maxlen=LAG_SAMPLE_SIZE)
+        self.blocking_events = deque(maxlen=MAX_BLOCKING_EVENTS)
+        self.running = False
+
+        self._route_by_code = {}
+        self._loop_thread_id = None
+        self._last_tick = time.monotonic()
+        self._tick_count = 0
+        self._pending_event: Optional[dict] = None
+        self._task = None
+        self._stop = threading.Event()
+
+    def start(self, app):
+        """현재 실행 중인 이벤트 루프에서 모니터를 시작합니다. (startup 이벤트에서 호출)"""
+        if self.running:
+            return
+
+        # 엔드포인트 함수의 code 객체 -> 라우트 경로 매핑 (스택에서 라우트를 찾기 위함)
+        # 데코레이터 wrapper 의 code 는 여러 라우트가 공유하므로 원래 함수의 code 만 등록
+        for route in app.routes:
+            endpoint = getattr(route, "endpoint", None)
+            if endpoint is None:
+                continue
+            code = getattr(inspect.unwrap(endpoint), "__code__", None)
+            if code is not None:
+                self._route_by_code[code] = route.path
+
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._tick())
+        threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True).start()
+        self.running = True
+        logger.info("Event loop monitor started (interval=%.0fms, threshold=%.0fms)",
+                    self.interval * 1000, self.threshold * 1000)
+
+    def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self.running = False
+
+    async def _tick(self):
+        last_report = time.monotonic()
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+
+            self.samples.append(lag)
+            self._last_tick = now
+            self._tick_count += 1
+
+            # 워치독이 캡처한 블로킹 이벤트가 있으면 최종 지연 시간을 채워 기록
+            event = self._pending_event
+            if event is not None:
+                self._pending_event = None
+                event["lag_ms"] = round(lag * 1000, 1)
+                logger.warning(
+                    "Event loop blocked for %.0fms by route %s\n%s",
+                    lag * 1000, event["route"] or "<unknown>", "".join(event["stack"])
+                )
+            elif lag >= self.threshold:
+                logger.warning("Event loop lag %.0fms (stack not captured)", lag * 1000)
+
+            if now - last_report >= LOOP_MONITOR_REPORT_INTERVAL:
+                last_report = now
+                stats = self.snapshot(include_events=False)
+                logger.info("Event loop lag p50=%.1fms p95=%.1fms p99=%.1fms max=%.1fms",
+                            stats["p50_ms"], stats["p95_ms"], stats["p99_ms"], stats["max_ms"])
+
+    def _watch(self):
+        captured_tick = -1
+        while not self._stop.wait(self.interval):
+            stalled = time.monotonic() - self._last_tick - self.interval
+            if stalled < self.threshold or captured_tick == self._tick_count:
+                continue
+
+            # 같은 정지 구간에서는 한 번만 캡처
+            captured_tick = self._tick_count
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            event = {
+                "timestamp": datetime.utcnow().isoformat(),
+                "route": self._find_route(frame),
+                "stalled_ms": round(stalled * 1000, 1),
+                "lag_ms": None,
+                "stack": traceback.format_stack(frame),
+            }
+            self.blocking_events.append(event)
+            self._pending_event = event
+
+    def _find_route(self, frame) -> Optional[str]:
+        while frame is not None:
+            route = self._route_by_code.get(frame.f_code)
+            if route:
+                return route
+            frame = frame.f_back
+        return None
+
+    def snapshot(self, include_events: bool = True) -> dict:
+        values = sorted(self.samples)
+        stats = {
+            "enabled": self.running,
+            "threshold_ms": self.threshold * 1000,
+            "samples": len(values),
+            "p50_ms": round(_percentile(values, 50) * 1000, 2),
+            "p95_ms": round(_percentile(values, 95) * 1000, 2),
+            "p99_ms": round(_percentile(values, 99) * 1000, 2),
+            "max_ms": round((values[-1] if values else 0.0) * 1000, 2),
+        }
+        if include_events:
+            stats["blocking_events"] = list(self.blocking_events)
+        return stats
+
+
+loop_monitor = LoopLagMonitor()
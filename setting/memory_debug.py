@@ -0,0 +1,174 @@
+# 메모리 사용량 / 누수 추적
+#
+# 관리자 엔드포인트에서 tracemalloc 을 켜고 끄며, 상위 할당 위치와 스냅샷 간 차이를 조회한다.
+# tracemalloc 이 켜져 있는 동안에는 RouteMemoryMiddleware 가 요청 전후의 추적 메모리 차이를
+# 라우트별로 누적해, 메모리가 계속 늘어나는 라우트를 찾을 수 있게 한다.
+# (동시 요청의 할당도 함께 잡히므로 절대값보다는 라우트 간 상대 비교용)
+
+import gc
+import os
+import threading
+import tracemalloc
+from collections import Counter, OrderedDict, defaultdict
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MEMORY_TRACE_FRAMES = int(os.getenv("MEMORY_TRACE_FRAMES", 10))   # 할당마다 저장할 스택 깊이
+MAX_SNAPSHOTS = 5
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+_snapshots = OrderedDict()
+_route_stats = defaultdict(lambda: {"requests": 0, "net_bytes": 0, "max_bytes": 0})
+_lock = threading.Lock()
+
+
+def start_tracing(frames: int = MEMORY_TRACE_FRAMES):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    with _lock:
+        _route_stats.clear()
+
+
+def stop_tracing():
+    """추적을 중지하고 저장된 스냅샷과 라우트 통계를 버립니다."""
+    tracemalloc.stop()
+    with _lock:
+        _snapshots.clear()
+        _route_stats.clear()
+
+
+def take_snapshot(name: str = None) -> tracemalloc.Snapshot:
+    """현재 스냅샷을 찍습니다. name 을 주면 diff 용으로 저장합니다. (최근 MAX_SNAPSHOTS 개만 유지)"""
+    snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+    if name:
+        with _lock:
+            _snapshots.pop(name, None)
+            _snapshots[name] = snapshot
+            while len(_snapshots) > MAX_SNAPSHOTS:
+                _snapshots.popitem(last=False)
+    return snapshot
+
+
+def get_snapshot(name: str):
+    return _snapshots.get(name)
+
+
+def snapshot_names() -> list:
+    return list(_snapshots)
+
+
+def _format_traceback(traceback) -> list:
+    return [f"{frame.filename}:{frame.lineno}" for frame in traceback]
+
+
+def top_allocations(snapshot: tracemalloc.Snapshot, group_by: str = "lineno", limit: int = 20) -> list:
+    return [
+        {
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count,
+            "traceback": _format_traceback(stat.traceback),
+        }
+        for stat in snapshot.statistics(group_by)[:limit]
+    ]
+
+
+def diff_snapshots(base: tracemalloc.Snapshot, target: tracemalloc.Snapshot,
+                   group_by: str = "lineno", limit: int = 20) -> list:
+    return [
+        {
+            "size_diff_kb": round(stat.size_diff / 1024, 1),
+            "size_kb": round(stat.size / 1024, 1),
+            "count_diff": stat.count_diff,
+            "traceback": _format_traceback(stat.traceback),
+        }
+        for stat in target.compare_to(base, group_by)[:limit]
+    ]
+
+
+def tracemalloc_status() -> dict:
+    if not tracemalloc.is_tracing():
+        return {"tracing": False}
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "tracing": True,
+        "frames": tracemalloc.get_traceback_limit(),
+        "traced_kb": round(current / 1024, 1),
+        "peak_kb": round(peak / 1024, 1),
+        "overhead_kb": round(tracemalloc.get_tracemalloc_memory() / 1024, 1),
+        "snapshots": snapshot_names(),
+    }
+
+
+def gc_stats() -> dict:
+    return {
+        "counts": gc.get_count(),
+        "thresholds": gc.get_threshold(),
+        "generations": gc.get_stats(),
+        "garbage": len(gc.garbage),
+    }
+
+
+def object_counts(classes) -> dict:
+    """gc 가 추적 중인 객체 중 주어진 클래스(하위 클래스 포함)의 인스턴스 수"""
+    classes = tuple(classes)
+    counts = Counter()
+    for obj in gc.get_objects():
+        if isinstance(obj, classes):
+            counts[type(obj).__name__] += 1
+    return {cls.__name__: counts.get(cls.__name__, 0) for cls in classes}
+
+
+def rss_kb():
+    """현재 프로세스 RSS (KB). /proc 를 읽을 수 없으면 최대 RSS 를 반환합니다."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def route_memory_stats() -> dict:
+    with _lock:
+        items = {route: dict(stats) for route, stats in _route_stats.items()}
+    for stats in items.values():
+        stats["avg_kb"] = round(stats["net_bytes"] / stats["requests"] / 1024, 2)
+        stats["net_kb"] = round(stats.pop("net_bytes") / 1024, 1)
+        stats["max_kb"] = round(stats.pop("max_bytes") / 1024, 1)
+    return dict(sorted(items.items(), key=lambda item: item[1]["net_kb"], reverse=True))
+
+
+class RouteMemoryMiddleware:
+    """tracemalloc 추적 중일 때만 요청 전후 추적 메모리 차이를 라우트별로 누적하는 순수 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracemalloc.is_tracing():
+            await self.app(scope, receive, send)
+            return
+
+        before = tracemalloc.get_traced_memory()[0]
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if tracemalloc.is_tracing():
+                delta = tracemalloc.get_traced_memory()[0] - before
+                route_path = getattr(scope.get("route"), "path", "<unmatched>")
+                with _lock:
+                    stats = _route_stats[route_path]
+                    stats["requests"] += 1
+                    stats["net_bytes"] += delta
+                    stats["max_bytes"] = max(stats["max_bytes"], delta)
@@ -0,0 +1,254 @@
+# Prometheus 텍스트 포맷 메트릭
+#
+# 외부 의존성 없이 프로세스 내부 카운터/히스토그램/게이지를 유지하고 /metrics 에서 렌더링한다.
+# 기록 비용을 줄이기 위해 히스토그램은 버킷별 개수만 저장하고 누적 값은 렌더링 시 계산한다.
+
+import threading
+import time
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_registry = []
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def inc(self, *labelvalues, amount: float = 1):
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def values(self) -> dict:
+        """labelvalues -> 값 (관리자 엔드포인트에서 요약할 때 사용)"""
+        with self._lock:
+            return dict(self._values)
+
+    def collect(self):
+        with self._lock:
+            items = list(self._values.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labelvalues, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}   # labelvalues -> [버킷별 개수..., +Inf 개수, 합계]
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def observe(self, value: float, *labelvalues):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labelvalues)
+            if state is None:
+                state = self._values[labelvalues] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    def time(self, *labelvalues):
+        """with 블록 실행 시간을 기록하는 컨텍스트 매니저"""
+        return _Timer(self, labelvalues)
+
+    def collect(self):
+        with self._lock:
+            items = [(labelvalues, list(state)) for labelvalues, state in self._values.items()]
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labelvalues, state in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                labels = _format_labels(self.labelnames, labelvalues, f'le="{le}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labelvalues", "start")
+
+    def __init__(self, histogram, labelvalues):
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labelvalues)
+
+
+class Gauge:
+    """렌더링 시점에 callback() 이 반환하는 [(labelvalues, value), ...] 를 내보내는 게이지"""
+
+    def __init__(self, name: str, documentation: str, labelnames=(), callback=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+        _registry.append(self)
+
+    def collect(self):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        for labelvalues, value in (self.callback() if self.callback else []):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+def render_metrics() -> str:
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.collect())
+    return "\n".join(lines) + "\n"
+
+
+# --- 공용 메트릭 정의 ---
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route and status code", ("method", "route", "status"))
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", ("method", "route"))
+HTTP_REQUEST_SIZE = Histogram(
+    "http_request_size_bytes", "HTTP request body size by route", ("route",), SIZE_BUCKETS)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "HTTP response body size by route", ("route",), SIZE_BUCKETS)
+
+REDIS_COMMAND_DURATION = Histogram(
+    "redis_command_duration_seconds", "Redis command latency", ("command",), FAST_LATENCY_BUCKETS)
+REDIS_COMMAND_ERRORS = Counter(
+    "redis_command_errors_total", "Failed Redis commands", ("command",))
+REDIS_POOL_EXHAUSTED = Counter(
+    "redis_pool_exhausted_total", "Async Redis commands skipped because every pooled connection was busy", ("command",))
+
+CACHE_REQUESTS = Counter(
+    "cache_requests_total", "Cache lookups by key namespace, tier (local, redis) and result (hit, miss, unavailable)",
+    ("namespace", "tier", "result"))
+CACHE_SETS = Counter(
+    "cache_sets_total", "Cache writes by key namespace", ("namespace",))
+LOCAL_CACHE_EVICTIONS = Counter(
+    "local_cache_evictions_total", "In-process cache evictions by reason (size, expired, invalidated)", ("reason",))
+
+S3_UPLOAD_DURATION = Histogram(
+    "s3_upload_duration_seconds", "S3 upload duration by bucket", ("bucket",))
+
+BOOTSTRAP_SECTION_DURATION = Histogram(
+    "bootstrap_section_duration_seconds", "Bootstrap section latency (completed sections only)", ("section",))
+BOOTSTRAP_SECTION_RESULTS = Counter(
+    "bootstrap_section_results_total", "Bootstrap sections by outcome (ok, timeout, error)", ("section", "result"))
+
+OUTBOUND_HTTP_DURATION = Histogram(
+    "outbound_http_request_duration_seconds", "Outbound HTTP latency (time to response headers) by host", ("host",))
+OUTBOUND_HTTP_REQUESTS = Counter(
+    "outbound_http_requests_total", "Outbound HTTP requests by host and outcome", ("host", "outcome"))
+
+
+def register_db_pool_metrics(engine):
+    """SQLAlchemy 커넥션 풀 상태 게이지를 등록합니다."""
+    pool = engine.pool
+
+    def collect():
+        return [
+            (("size",), pool.size()),
+            (("checked_in",), pool.checkedin()),
+            (("checked_out",), pool.checkedout()),
+            (("overflow",), pool.overflow()),
+        ]
+
+    Gauge("db_pool_connections", "SQLAlchemy connection pool state", ("state",), collect)
+
+
+def register_breaker_metrics(get_breakers):
+    """get_breakers() 가 반환하는 서킷 브레이커들의 상태 게이지를 등록합니다. (0=closed, 1=half_open, 2=open)"""
+
+    def collect():
+        return [((breaker.name,), breaker.STATE_VALUES[breaker.state]) for breaker in get_breakers()]
+
+    Gauge("circuit_breaker_state", "Circuit breaker state (0=closed, 1=half_open, 2=open)", ("name",), collect)
+
+
+def register_local_cache_metrics(local_cache):
+    """프로세스 내 L1 캐시 크기/항목 수 게이지를 등록합니다."""
+
+    def collect():
+        stats = local_cache.stats()
+        return [
+            (("bytes",), stats["bytes"]),
+            (("max_bytes",), stats["max_bytes"]),
+            (("entries",), stats["entries"]),
+            (("active",), int(stats["active"])),
+        ]
+
+    Gauge("local_cache", "In-process cache state", ("state",), collect)
+
+
+class MetricsMiddleware:
+    """라우트별 지연 시간, 요청/응답 크기, 상태 코드를 기록하는 순수 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        response_size = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, response_size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = scope.get("route")
+            # 매칭되지 않은 요청(401, 404 등)은 라벨 폭증을 막기 위해 하나로 묶음
+            route_path = getattr(route, "path", "<unmatched>")
+            method = scope["method"]
+
+            HTTP_REQUESTS.inc(method, route_path, str(status_code))
+            HTTP_REQUEST_DURATION.observe(elapsed, method, route_path)
+            HTTP_RESPONSE_SIZE.observe(response_size, route_path)
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    HTTP_REQUEST_SIZE.observe(int(value), route_path)
+                    break
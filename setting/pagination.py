@@ -0,0 +1,84 @@
+# 키셋(커서) 페이지네이션
+#
+#   GET /api/v1/user_object_list?limit=50
+#   -> 200, X-Next-Cursor: MjAyNC0wMy0wMVQwMDowMDowMHwxMjM   (마지막 페이지면 헤더 없음)
+#   GET /api/v1/user_object_list?limit=50&cursor=MjAyNC0wMy0wMVQwMDowMDowMHwxMjM
+#
+# 목록은 (created_at, id) 내림차순으로 정렬하고, 페이지 마지막 항목의 (created_at, id) 를 커서로 넘긴다.
+# 다음 페이지는 WHERE (created_at, id) < 커서 로 인덱스에서 바로 시작하므로
+# OFFSET 과 달리 깊은 페이지도 첫 페이지와 비용이 같다.
+# 커서는 불투명한 문자열이며 클라이언트는 해석하지 않고 그대로 돌려보낸다.
+
+import base64
+import binascii
+import os
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import and_, desc, or_
+
+load_dotenv()
+
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", 50))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 100))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class Cursor(NamedTuple):
+    created_at: datetime
+    id: int
+
+
+def encode_cursor(created_at, item_id: int) -> str:
+    """created_at 은 datetime 또는 캐시에 저장된 ISO 문자열"""
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    raw = f"{created_at}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, item_id = raw.rsplit("|", 1)
+        return Cursor(datetime.fromisoformat(created_at), int(item_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="잘못된 cursor 입니다.")
+
+
+def page_cursor(
+    cursor: Optional[str] = Query(None, description=f"이전 응답의 {NEXT_CURSOR_HEADER} 헤더 값")
+) -> Optional[Cursor]:
+    """cursor 쿼리 파라미터 의존성. 없으면 첫 페이지"""
+    return decode_cursor(cursor) if cursor else None
+
+
+def page_limit(limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)) -> int:
+    return limit
+
+
+def keyset_page(query, created_at_column, id_column, cursor: Optional[Cursor], limit: int):
+    """
+    query 를 (created_at, id) 내림차순으로 cursor 다음부터 limit 개 조회합니다.
+    반환: (행 목록, 다음 커서 또는 None). 다음 페이지 여부는 limit + 1 개를 읽어 판단합니다.
+    행에는 created_at_column, id_column 과 같은 이름의 속성이 있어야 합니다.
+    """
+    if cursor is not None:
+        # (created_at, id) < cursor 를 인덱스 범위 조건으로 풀어 씀
+        query = query.filter(or_(
+            created_at_column < cursor.created_at,
+            and_(created_at_column == cursor.created_at, id_column < cursor.id),
+        ))
+    rows = query.order_by(desc(created_at_column), desc(id_column)).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, created_at_column.key), getattr(last, id_column.key))
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]):
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
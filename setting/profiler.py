@@ -0,0 +1,134 @@
+# 요청 단위 CPU 프로파일러
+#
+# 관리자가 X-Profile: 1 헤더를 붙인 요청 하나만 샘플링 프로파일러로 실행한다.
+# 별도 스레드가 일정 간격으로 sys._current_frames() 를 읽어, 해당 요청의 엔드포인트 함수가
+# 스택에 있는 스레드(async 엔드포인트는 이벤트 루프, sync 엔드포인트는 threadpool 워커)의
+# 스택만 모은다. 결과는 flamegraph.pl / speedscope 에서 바로 열 수 있는 folded stack 파일로 저장한다.
+# 헤더가 없는 요청에는 아무 작업도 하지 않는다.
+
+import inspect
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+PROFILE_OUTPUT_DIR = os.getenv("PROFILE_OUTPUT_DIR", "profiles")
+PROFILE_INTERVAL = float(os.getenv("PROFILE_INTERVAL_MS", 2)) / 1000   # 샘플링 간격
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", 100))            # 오래된 파일부터 삭제
+PROFILE_HEADER = "X-Profile"
+
+PROFILE_FILENAME_RE = re.compile(r"^[0-9]{8}T[0-9]{6}_[A-Za-z0-9_-]+\.folded$")
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class RequestProfiler:
+    """
+    한 요청의 엔드포인트 실행을 샘플링합니다.
+    같은 엔드포인트로 동시에 들어온 다른 요청의 스택도 함께 잡힐 수 있으므로,
+    트래픽이 적은 시점에 사용하는 것이 좋습니다.
+    """
+
+    def __init__(self, scope: dict, interval: float = PROFILE_INTERVAL):
+        self.scope = scope
+        self.interval = interval
+        self.samples = Counter()
+        self.sample_count = 0
+        self._endpoint_codes = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._started_at = None
+        self.duration = 0.0
+
+    def start(self):
+        self._started_at = time.perf_counter()
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._started_at
+
+    def _resolve_endpoint_codes(self) -> Optional[set]:
+        # 라우팅이 끝나야 scope["route"] 가 설정됨
+        # 데코레이터 wrapper 의 code 는 여러 라우트가 공유하므로 원래 함수의 code 만 사용
+        if self._endpoint_codes is None:
+            route = self.scope.get("route")
+            endpoint = getattr(route, "endpoint", None)
+            code = getattr(inspect.unwrap(endpoint), "__code__", None) if endpoint is not None else None
+            if code is not None:
+                self._endpoint_codes = {code}
+        return self._endpoint_codes
+
+    def _run(self):
+        own_thread_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            endpoint_codes = self._resolve_endpoint_codes()
+            if not endpoint_codes:
+                continue
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread_id:
+                    continue
+                stack = []
+                in_endpoint = False
+                while frame is not None:
+                    stack.append(frame.f_code)
+                    if frame.f_code in endpoint_codes:
+                        in_endpoint = True
+                    frame = frame.f_back
+                if not in_endpoint:
+                    continue
+                # 엔드포인트 함수부터 시작하도록 바깥쪽(서버/미들웨어) 프레임은 잘라냄
+                stack.reverse()
+                start = next(i for i, code in enumerate(stack) if code in endpoint_codes)
+                self.samples[";".join(_frame_label(code) for code in stack[start:])] += 1
+                self.sample_count += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+    def save(self, request_id: str) -> str:
+        """folded stack 파일을 저장하고 파일 이름을 반환합니다."""
+        os.makedirs(PROFILE_OUTPUT_DIR, exist_ok=True)
+        safe_id = re.sub(r"[^A-Za-z0-9_-]", "", request_id)[:64] or "request"
+        filename = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{safe_id}.folded"
+        with open(os.path.join(PROFILE_OUTPUT_DIR, filename), "w", encoding="utf-8") as f:
+            f.write(self.folded())
+        _prune_old_profiles()
+        return filename
+
+
+def _prune_old_profiles():
+    files = list_profiles()
+    for filename in files[PROFILE_MAX_FILES:]:
+        try:
+            os.remove(os.path.join(PROFILE_OUTPUT_DIR, filename))
+        except OSError:
+            pass
+
+
+def list_profiles() -> list:
+    """저장된 프로파일 파일 이름 목록 (최신순)"""
+    if not os.path.isdir(PROFILE_OUTPUT_DIR):
+        return []
+    return sorted((name for name in os.listdir(PROFILE_OUTPUT_DIR) if PROFILE_FILENAME_RE.match(name)), reverse=True)
+
+
+def read_profile(filename: str) -> Optional[str]:
+    if not PROFILE_FILENAME_RE.match(filename):
+        return None
+    path = os.path.join(PROFILE_OUTPUT_DIR, filename)
+    if not os.path.isfile(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return f.read()
@@ -0,0 +1,172 @@
+# asyncio Redis 클라이언트
+#
+# async 엔드포인트에서 동기 redis_client 를 호출하면 명령이 끝날 때까지 이벤트 루프가 멈춘다.
+# 앱 시작 시 크기를 정한 커넥션 풀로 redis.asyncio 클라이언트를 만들어 app.state.redis 에 두고,
+# async 경로는 get_async_redis(request) 로 꺼내 await 한다.
+# - 풀은 REDIS_POOL_SIZE 개까지만 연결을 열고, 모두 사용 중이면 REDIS_POOL_TIMEOUT 초 기다린 뒤 캐시 없이 진행한다.
+#   이는 Redis 장애가 아니라 이 워커의 과부하이므로 서킷 브레이커에 실패로 기록하지 않는다. (동기 경로에 영향 없음)
+# - 여러 키 조회는 MGET, 여러 키 저장은 파이프라인(SETEX 여러 개)으로 왕복 한 번에 처리한다.
+# - 서킷 브레이커, 메트릭, L1 캐시(setting/local_cache.py)는 동기 클라이언트와 공유한다.
+# 값은 bytes 로 주고받는다. (decode_responses=False)
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+import orjson
+import redis
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+from fastapi import Request
+
+import setting.redis_client as cache
+from setting.local_cache import local_cache
+from setting.metrics import REDIS_COMMAND_DURATION, REDIS_COMMAND_ERRORS, REDIS_POOL_EXHAUSTED, CACHE_SETS
+from setting.tracing import start_span, SPAN_KIND_CLIENT
+
+load_dotenv()
+
+REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", 32))            # 워커별 최대 연결 수
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", 0.1))   # 빈 연결을 기다리는 최대 시간(초)
+
+
+class PoolExhaustedError(redis.ConnectionError):
+    """REDIS_POOL_TIMEOUT 동안 빈 연결을 얻지 못함"""
+
+
+class SizedConnectionPool(aioredis.BlockingConnectionPool):
+    """빈 연결 대기 시간 초과를 Redis 연결 실패와 구분해 PoolExhaustedError 로 올립니다."""
+
+    async def get_connection(self, command_name, *keys, **options):
+        try:
+            return await super().get_connection(command_name, *keys, **options)
+        except redis.ConnectionError as e:
+            # BlockingConnectionPool 은 대기 시간 초과를 asyncio.TimeoutError 에서 ConnectionError 로 바꿔 올림
+            if isinstance(e.__cause__, asyncio.TimeoutError):
+                raise PoolExhaustedError(str(e)) from e
+            raise
+
+
+def create_async_redis() -> aioredis.Redis:
+    """앱 시작 시 한 번 만들어 app.state.redis 에 둡니다."""
+    pool = SizedConnectionPool(
+        max_connections=REDIS_POOL_SIZE,
+        timeout=REDIS_POOL_TIMEOUT,
+        **cache.redis_connection_kwargs(),
+    )
+    return aioredis.Redis(connection_pool=pool)
+
+
+async def close_async_redis(client: aioredis.Redis):
+    await client.aclose(close_connection_pool=True)
+
+
+def get_async_redis(request: Request) -> Optional[aioredis.Redis]:
+    """app.state.redis. 앱 시작 전이거나 앱 없이 만든 Request 면 None"""
+    app = request.scope.get("app")
+    return getattr(app.state, "redis", None) if app is not None else None
+
+
+async def _guarded(command, *args, default=None, **kwargs):
+    """
+    서킷 브레이커를 거쳐 비동기 Redis 명령을 실행합니다. open 상태이거나 오류 시 default 를 반환합니다.
+    풀에 빈 연결이 없으면 브레이커에 기록하지 않고 default 를 반환합니다.
+    """
+    if not cache.redis_breaker.allow_request():
+        return default
+    name = command.__name__
+    span = start_span(f"redis {name}", SPAN_KIND_CLIENT, {"db.system": "redis"})
+    start = time.perf_counter()
+    error = None
+    try:
+        result = await command(*args, **kwargs)
+    except PoolExhaustedError as e:
+        error = e
+        REDIS_POOL_EXHAUSTED.inc(name)
+        return default
+    except redis.RedisError as e:
+        error = e
+        cache.redis_breaker.record_failure()
+        REDIS_COMMAND_ERRORS.inc(name)
+        cache.logger.warning("Redis command failed: %s", e)
+        return default
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        REDIS_COMMAND_DURATION.observe(time.perf_counter() - start, name)
+        if span is not None:
+            span.end(error)
+    cache.redis_breaker.record_success()
+    return result
+
+
+async def _mget(client: aioredis.Redis, cache_keys):
+    values, pending = cache._local_lookup(cache_keys, decode=False)
+    if not pending:
+        return values
+    generation = local_cache.generation
+    fetched = await _guarded(client.mget, [cache_keys[index] for index in pending], default=cache._UNAVAILABLE)
+    return cache._merge_fetched(cache_keys, values, pending, fetched, False, generation)
+
+
+async def cache_mget_bytes_async(client: aioredis.Redis, *cache_keys: str) -> list:
+    """여러 키의 값을 bytes 로 한 번에 조회합니다. (L1 -> MGET, 없거나 Redis 를 사용할 수 없으면 None)"""
+    values = await _mget(client, cache_keys)
+    return [None] * len(cache_keys) if values is cache._UNAVAILABLE else values
+
+
+async def cache_mget_async(client: aioredis.Redis, *cache_keys: str) -> Optional[list]:
+    """여러 키의 문자열 값을 한 번에 조회합니다. (없는 키는 None, Redis 를 사용할 수 없으면 None)"""
+    values = await _mget(client, cache_keys)
+    if values is cache._UNAVAILABLE:
+        return None
+    return [value.decode() if value is not None else None for value in values]
+
+
+async def cache_setex_many_async(client: aioredis.Redis, items):
+    """(키, TTL, 값) 목록을 파이프라인 한 번으로 저장합니다. Redis 를 사용할 수 없으면 건너뜁니다."""
+    pipe = client.pipeline(transaction=False)
+    for cache_key, expiration, value in items:
+        CACHE_SETS.inc(cache.cache_namespace(cache_key))
+        pipe.setex(cache_key, expiration, value)
+    await _guarded(pipe.execute)
+
+
+async def cache_get_json_async(client: aioredis.Redis, cache_key: str):
+    """cache_get_json 의 비동기 버전 (L1 -> Redis, 없거나 Redis 를 사용할 수 없으면 None)"""
+    cached = (await cache_mget_bytes_async(client, cache_key))[0]
+    return orjson.loads(cached) if cached else None
+
+
+async def cache_set_json_async(client: aioredis.Redis, cache_key: str, expiration: int, value):
+    """cache_set_json 의 비동기 버전. Redis 를 사용할 수 없으면 건너뜁니다."""
+    await cache_setex_many_async(client, [(cache_key, expiration, orjson.dumps(value))])
+
+
+async def cache_peek_async(client: aioredis.Redis, cache_key: str) -> Optional[bytes]:
+    """L1/메트릭을 거치지 않는 단순 조회 (다른 워커가 채우는 값을 기다릴 때)"""
+    return await _guarded(client.get, cache_key)
+
+
+async def cache_ttl_async(client: aioredis.Redis, cache_key: str) -> int:
+    """남은 TTL(초). 키가 없거나 Redis 를 사용할 수 없으면 -2"""
+    return await _guarded(client.ttl, cache_key, default=-2)
+
+
+async def cache_acquire_lock_async(client: aioredis.Redis, lock_key: str, timeout_ms: int, value: str = "1"):
+    """cache_acquire_lock 의 비동기 버전. 반환값: True(획득), False(다른 곳에서 보유 중), None(Redis 를 사용할 수 없음)"""
+    acquired = await _guarded(client.set, lock_key, value, default=cache._UNAVAILABLE, px=timeout_ms, nx=True)
+    if acquired is cache._UNAVAILABLE:
+        return None
+    return bool(acquired)
+
+
+async def cache_extend_lock_async(client: aioredis.Redis, lock_key: str, timeout_ms: int):
+    """보유 중인 잠금의 만료 시간을 timeout_ms 뒤로 다시 설정합니다. (잠금 TTL 보다 오래 걸리는 작업 중)"""
+    await _guarded(client.pexpire, lock_key, timeout_ms)
+
+
+async def cache_release_lock_async(client: aioredis.Redis, lock_key: str):
+    await _guarded(client.delete, lock_key)
@@ -1,18 +1,49 @@
+import orjson
+import logging
+import time
+from collections import Counter, defaultdict
+from typing import Optional
 import redis
 import os
 from dotenv import load_dotenv
+from setting.circuit_breaker import CircuitBreaker
+from setting.metrics import REDIS_COMMAND_DURATION, REDIS_COMMAND_ERRORS, CACHE_REQUESTS, CACHE_SETS
+from setting.tracing import start_span, SPAN_KIND_CLIENT
+from setting.local_cache import local_cache, invalidation_message, LOCAL_CACHE_CHANNEL
 
 # 환경 변수 로드
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Redis 클라이언트 생성
-redis_client = redis.Redis(
-    host=os.getenv('REDIS_HOST', 'localhost'),
-    port=int(os.getenv('REDIS_PORT', 6379)),
-    db=0,
-    decode_responses=True,
-    socket_connect_timeout=5,  # 연결 타임아웃
-    retry_on_timeout=True      # 타임아웃 시 재시도
+# 캐시는 실패해도 MySQL 로 fallback 하면 되므로 짧은 타임아웃으로 빠르게 실패시킨다.
+def redis_connection_kwargs() -> dict:
+    """동기/asyncio 클라이언트 공용 연결 설정 (setting/redis_async.py)"""
+    return dict(
+        host=os.getenv('REDIS_HOST', 'localhost'),
+        port=int(os.getenv('REDIS_PORT', 6379)),
+        db=0,
+        socket_connect_timeout=float(os.getenv('REDIS_CONNECT_TIMEOUT', 0.25)),  # 연결 타임아웃 (초)
+        socket_timeout=float(os.getenv('REDIS_SOCKET_TIMEOUT', 0.25)),           # 명령 타임아웃 (초)
+        retry_on_timeout=False      # 타임아웃 시 재시도하지 않고 서킷 브레이커에 맡김
+    )
+
+
+def _create_client(decode_responses: bool) -> redis.Redis:
+    return redis.Redis(decode_responses=decode_responses, **redis_connection_kwargs())
+
+
+redis_client = _create_client(decode_responses=True)
+
+# 미리 압축한 응답 본문 등 바이너리 값용 클라이언트
+redis_bytes_client = _create_client(decode_responses=False)
+
+# Redis 장애 시 캐시 접근을 건너뛰기 위한 서킷 브레이커
+redis_breaker = CircuitBreaker(
+    "redis",
+    failure_threshold=int(os.getenv('REDIS_BREAKER_FAILURE_THRESHOLD', 3)),
+    recovery_timeout=float(os.getenv('REDIS_BREAKER_RECOVERY_TIMEOUT', 5)),
 )
 
 # Redis 캐시 최대 크기 제한
@@ -20,7 +51,312 @@ MAX_CACHE_SIZE = int(os.getenv('REDIS_MAX_CACHE_SIZE', 1000))  # 기본값: 1000
 REDIS_EVICTION_POLICY = os.getenv('REDIS_EVICTION_POLICY', 'allkeys-lru')  # 기본값: LRU
 
 # Redis 설정 적용
-redis_client.config_set('maxmemory', f'{MAX_CACHE_SIZE}mb')  # 메모리 제한
-redis_client.config_set('maxmemory-policy', REDIS_EVICTION_POLICY)  # 캐시 삭제 정책
+try:
+    redis_client.config_set('maxmemory', f'{MAX_CACHE_SIZE}mb')  # 메모리 제한
+    redis_client.config_set('maxmemory-policy', REDIS_EVICTION_POLICY)  # 캐시 삭제 정책
+except redis.RedisError as e:
+    redis_breaker.record_failure()
+    logger.warning("Failed to apply Redis config: %s", e)
+
+
+def _guarded(command, *args, default=None, **kwargs):
+    """서킷 브레이커를 거쳐 Redis 명령을 실행합니다. open 상태이거나 오류 시 default 를 반환합니다."""
+    if not redis_breaker.allow_request():
+        return default
+    name = command.__name__
+    span = start_span(f"redis {name}", SPAN_KIND_CLIENT, {"db.system": "redis"})
+    start = time.perf_counter()
+    error = None
+    try:
+        result = command(*args, **kwargs)
+    except redis.RedisError as e:
+        error = e
+        redis_breaker.record_failure()
+        REDIS_COMMAND_ERRORS.inc(name)
+        logger.warning("Redis command failed: %s", e)
+        return default
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        REDIS_COMMAND_DURATION.observe(time.perf_counter() - start, name)
+        if span is not None:
+            span.end(error)
+    redis_breaker.record_success()
+    return result
+
+
+_UNAVAILABLE = object()
+
+
+def cache_namespace(cache_key: str) -> str:
+    """키의 첫 번째 ':' 앞부분 (예: place_search:KONKUK_SEOUL:공학 -> place_search)"""
+    return cache_key.split(":", 1)[0]
+
+
+TIER_LOCAL = "local"
+TIER_REDIS = "redis"
+
+
+def _local_get(cache_key: str, namespace: str) -> Optional[bytes]:
+    """L1 에 있는 값. L1 대상이 아니거나 없으면 None"""
+    if not local_cache.accepts(namespace):
+        return None
+    value = local_cache.get(cache_key)
+    CACHE_REQUESTS.inc(namespace, TIER_LOCAL, "miss" if value is None else "hit")
+    return value
+
+
+def cache_get(cache_key: str):
+    """캐시 값을 반환합니다. (L1 -> Redis, 없거나 Redis 를 사용할 수 없으면 None)"""
+    namespace = cache_namespace(cache_key)
+    local = _local_get(cache_key, namespace)
+    if local is not None:
+        return local.decode()
+    generation = local_cache.generation
+    cached = _guarded(redis_client.get, cache_key, default=_UNAVAILABLE)
+    if cached is _UNAVAILABLE:
+        CACHE_REQUESTS.inc(namespace, TIER_REDIS, "unavailable")
+        return None
+    CACHE_REQUESTS.inc(namespace, TIER_REDIS, "miss" if cached is None else "hit")
+    if cached is not None and local_cache.accepts(namespace):
+        local_cache.set(cache_key, cached.encode(), generation)
+    return cached
+
+
+def _local_lookup(cache_keys, decode: bool):
+    """L1 조회. 반환: (값 목록, Redis 에서 읽어야 할 위치 목록)"""
+    values = [None] * len(cache_keys)
+    pending = []
+    for index, cache_key in enumerate(cache_keys):
+        local = _local_get(cache_key, cache_namespace(cache_key))
+        if local is None:
+            pending.append(index)
+        else:
+            values[index] = local.decode() if decode else local
+    return values, pending
+
+
+def _merge_fetched(cache_keys, values: list, pending: list, fetched, decode: bool, generation: int):
+    """Redis 에서 읽은 값을 values 에 채우고 L1 에 저장합니다. Redis 를 사용할 수 없었으면 _UNAVAILABLE"""
+    if fetched is _UNAVAILABLE:
+        for index in pending:
+            CACHE_REQUESTS.inc(cache_namespace(cache_keys[index]), TIER_REDIS, "unavailable")
+        return _UNAVAILABLE
+    for index, value in zip(pending, fetched):
+        namespace = cache_namespace(cache_keys[index])
+        CACHE_REQUESTS.inc(namespace, TIER_REDIS, "miss" if value is None else "hit")
+        if value is not None:
+            values[index] = value
+            if local_cache.accepts(namespace):
+                local_cache.set(cache_keys[index], value.encode() if decode else value, generation)
+    return values
+
+
+def _mget(client, cache_keys, decode: bool):
+    """L1 -> Redis(MGET 한 번) 순으로 조회합니다. Redis 를 사용할 수 없으면 _UNAVAILABLE"""
+    values, pending = _local_lookup(cache_keys, decode)
+    if not pending:
+        return values
+    generation = local_cache.generation
+    fetched = _guarded(client.mget, [cache_keys[index] for index in pending], default=_UNAVAILABLE)
+    return _merge_fetched(cache_keys, values, pending, fetched, decode, generation)
+
+
+def cache_mget(*cache_keys: str) -> Optional[list]:
+    """여러 키의 문자열 값을 한 번에 조회합니다. (L1 -> Redis, 없는 키는 None, Redis 를 사용할 수 없으면 None)"""
+    values = _mget(redis_client, cache_keys, decode=True)
+    return None if values is _UNAVAILABLE else values
+
+
+def publish_invalidation(*cache_keys: str, pipe=None):
+    """
+    L1 에서 키를 지우고 다른 워커에도 무효화를 알립니다.
+    pipe 를 주면 쓰기 파이프라인에 PUBLISH 를 덧붙이고(호출 측이 execute), 없으면 바로 발행합니다.
+    """
+    local_cache.delete(*cache_keys)
+    if pipe is not None:
+        pipe.publish(LOCAL_CACHE_CHANNEL, invalidation_message(cache_keys))
+    else:
+        _guarded(redis_client.publish, LOCAL_CACHE_CHANNEL, invalidation_message(cache_keys))
+
+
+def cache_setex(cache_key: str, expiration: int, value: str):
+    """캐시에 값을 저장합니다. Redis 를 사용할 수 없으면 건너뜁니다."""
+    CACHE_SETS.inc(cache_namespace(cache_key))
+    _guarded(redis_client.setex, cache_key, expiration, value)
+
+
+def cache_get_json(cache_key: str):
+    """캐시된 JSON 값을 반환합니다. (없거나 Redis 를 사용할 수 없으면 None)"""
+    cached = cache_get(cache_key)
+    return orjson.loads(cached) if cached else None
+
+
+def cache_set_json(cache_key: str, expiration: int, value):
+    """값을 JSON 으로 직렬화해 캐싱합니다. Redis 를 사용할 수 없으면 건너뜁니다."""
+    cache_setex(cache_key, expiration, orjson.dumps(value).decode())
+
+
+# 미리 압축해 둔 응답 본문 변형 (setting/compression.py)
+COMPRESSED_CACHE_ENCODINGS = ("br", "gzip")
+
+
+def compressed_cache_key(cache_key: str, encoding: str) -> str:
+    """압축 변형 키 (예: compressed:gzip:object_feed:KONKUK_SEOUL)"""
+    return f"compressed:{encoding}:{cache_key}"
+
+
+def cache_mget_bytes(*cache_keys: str) -> list:
+    """여러 키의 값을 bytes 로 한 번에 조회합니다. (L1 -> Redis, 없거나 Redis 를 사용할 수 없으면 None)"""
+    values = _mget(redis_bytes_client, cache_keys, decode=False)
+    return [None] * len(cache_keys) if values is _UNAVAILABLE else values
+
+
+def cache_setex_bytes(cache_key: str, expiration: int, value: bytes):
+    """바이너리 값을 캐싱합니다. Redis 를 사용할 수 없으면 건너뜁니다."""
+    CACHE_SETS.inc(cache_namespace(cache_key))
+    _guarded(redis_bytes_client.setex, cache_key, expiration, value)
+
+
+def cache_ttl(cache_key: str) -> int:
+    """남은 TTL(초). 키가 없거나 Redis 를 사용할 수 없으면 -2"""
+    return _guarded(redis_client.ttl, cache_key, default=-2)
+
+
+def cache_acquire_lock(lock_key: str, timeout_ms: int, value: str = "1"):
+    """
+    짧은 분산 락을 잡습니다. (SET NX PX, value 는 락 키에 저장할 값)
+    반환값: True(획득), False(다른 곳에서 보유 중), None(Redis 를 사용할 수 없음)
+    """
+    acquired = _guarded(redis_client.set, lock_key, value, default=_UNAVAILABLE, px=timeout_ms, nx=True)
+    if acquired is _UNAVAILABLE:
+        return None
+    return bool(acquired)
+
+
+def cache_release_lock(lock_key: str):
+    _guarded(redis_client.delete, lock_key)
+
+
+def cache_delete(*cache_keys: str):
+    """쓰기 작업 후 관련 캐시(압축 변형 포함)를 무효화합니다. Redis 를 사용할 수 없으면 건너뜁니다."""
+    variant_keys = [
+        compressed_cache_key(cache_key, encoding)
+        for cache_key in cache_keys
+        for encoding in COMPRESSED_CACHE_ENCODINGS
+    ]
+    _guarded(redis_client.delete, *cache_keys, *variant_keys)
+    publish_invalidation(*cache_keys, *variant_keys)
+
+
+def cache_hit_stats() -> dict:
+    """
+    이 워커의 네임스페이스별 hit/miss/unavailable/set 횟수와 hit ratio.
+    hit 은 L1 과 Redis hit 의 합이고, tiers 에 계층별 hit/miss 를 나눠 보여줍니다.
+    """
+    stats = defaultdict(lambda: {
+        "hit": 0, "miss": 0, "unavailable": 0, "set": 0,
+        "tiers": {TIER_LOCAL: {"hit": 0, "miss": 0}, TIER_REDIS: {"hit": 0, "miss": 0, "unavailable": 0}},
+    })
+    for (namespace, tier, result), value in CACHE_REQUESTS.values().items():
+        namespace_stats = stats[namespace]
+        namespace_stats["tiers"][tier][result] += int(value)
+        if result == "hit" or tier == TIER_REDIS:     # L1 miss 는 Redis 조회로 이어지므로 합계에서 제외
+            namespace_stats[result] += int(value)
+    for (namespace,), value in CACHE_SETS.values().items():
+        stats[namespace]["set"] += int(value)
+    for namespace_stats in stats.values():
+        lookups = namespace_stats["hit"] + namespace_stats["miss"]
+        namespace_stats["hit_ratio"] = round(namespace_stats["hit"] / lookups, 4) if lookups else None
+        for tier_stats in namespace_stats["tiers"].values():
+            tier_lookups = tier_stats["hit"] + tier_stats["miss"]
+            tier_stats["hit_ratio"] = round(tier_stats["hit"] / tier_lookups, 4) if tier_lookups else None
+    return dict(stats)
+
+
+# TTL 분포 구간 (상한 초, 라벨)
+TTL_BUCKETS = ((60, "<1m"), (600, "1m-10m"), (3600, "10m-1h"), (86400, "1h-1d"))
+
+
+def _ttl_bucket(ttl: int) -> str:
+    if ttl is None or ttl < 0:
+        return "no_ttl"
+    for upper, label in TTL_BUCKETS:
+        if ttl < upper:
+            return label
+    return ">=1d"
+
+
+def scan_cache_stats(max_keys: int = 10000, samples_per_namespace: int = 50, match: str = "*") -> dict:
+    """
+    SCAN 으로 키를 최대 max_keys 개까지 훑어 네임스페이스별 키 수를 세고,
+    네임스페이스마다 samples_per_namespace 개 키의 TTL 과 MEMORY USAGE 를 조회합니다.
+    SCAN 이 끝까지 돌지 않았으면 match="*" 일 때만 DBSIZE 비율로 전체 키 수를 추정합니다.
+    (패턴을 지정하면 DBSIZE 중 패턴에 맞는 비율을 알 수 없으므로 센 값 그대로, 즉 하한값을 반환)
+    Redis 오류는 호출 측에서 처리합니다. (redis.RedisError)
+    """
+    counts = Counter()
+    samples = defaultdict(list)
+    scanned = 0
+    cursor = 0
+    while True:
+        cursor, keys = redis_client.scan(cursor, match=match, count=500)
+        for key in keys:
+            namespace = cache_namespace(key)
+            counts[namespace] += 1
+            if len(samples[namespace]) < samples_per_namespace:
+                samples[namespace].append(key)
+        scanned += len(keys)
+        if cursor == 0 or scanned >= max_keys:
+            break
+    complete = cursor == 0
+    dbsize = redis_client.dbsize()
+
+    pipe = redis_client.pipeline(transaction=False)
+    sampled = [(namespace, key) for namespace, keys in samples.items() for key in keys]
+    for _, key in sampled:
+        pipe.ttl(key)
+        pipe.memory_usage(key)
+    replies = pipe.execute(raise_on_error=False)    # MEMORY 를 지원하지 않는 서버에서도 TTL 은 집계
+
+    ttl_distribution = defaultdict(Counter)
+    memory = defaultdict(list)
+    for index, (namespace, _) in enumerate(sampled):
+        ttl, usage = replies[2 * index], replies[2 * index + 1]
+        if isinstance(ttl, Exception) or ttl == -2:   # 조회 사이에 만료됨
+            continue
+        ttl_distribution[namespace][_ttl_bucket(ttl)] += 1
+        if isinstance(usage, int):
+            memory[namespace].append(usage)
 
+    hit_stats = cache_hit_stats()
+    estimated = not complete and match == "*" and scanned > 0
+    scale = dbsize / scanned if estimated else 1
+    namespaces = {}
+    for namespace, count in counts.most_common():
+        estimated_keys = int(count * scale)
+        avg_bytes = sum(memory[namespace]) / len(memory[namespace]) if memory[namespace] else 0
+        namespaces[namespace] = {
+            "keys": estimated_keys,
+            "sampled": len(samples[namespace]),
+            "ttl": dict(ttl_distribution[namespace]),
+            "avg_bytes": round(avg_bytes),
+            "estimated_bytes": round(avg_bytes * estimated_keys),
+            "requests": hit_stats.get(namespace),
+        }
 
+    try:
+        memory_info = redis_client.info("memory")
+    except redis.ResponseError:     # INFO 가 비활성화된 관리형 Redis
+        memory_info = {}
+    return {
+        "scanned_keys": scanned,
+        "complete": complete,
+        "keys_estimated": estimated,    # False 이고 complete 도 False 면 keys 는 하한값
+        "dbsize": dbsize,
+        "used_memory": memory_info.get("used_memory"),
+        "maxmemory": memory_info.get("maxmemory"),
+        "maxmemory_policy": memory_info.get("maxmemory_policy"),
+        "namespaces": namespaces,
+    }
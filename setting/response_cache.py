@@ -0,0 +1,262 @@
+# 라우트 단위 응답 캐시
+#
+#   @router.get("/api/v1/search/place", response_model=...)
+#   @response_cache("place_search", ttl=3600, scopes=lambda university: [places_scope(university)])
+#   async def search_places(request: Request, keyword: str, limit: int = 10): ...
+#
+# - 캐시 키: namespace + 경로 + 정렬된 쿼리 + 호출자의 대학(vary="university") 또는 uuid(vary="user")
+#            + scopes 의 데이터 버전 (setting/etag.py)
+# - 히트 시 저장된 JSON bytes(또는 미리 압축한 변형)를 그대로 응답한다.
+# - 미스 시 같은 키는 한 번만 계산한다. (워커 내 asyncio single-flight + 워커 간 Redis 락)
+#   계산한 본문과 요청 인코딩의 압축 변형은 파이프라인(SETEX 여러 개) 한 번으로 저장한다.
+# - Redis 는 app.state.redis(asyncio 클라이언트, setting/redis_async.py)로 접근해 이벤트 루프를 막지 않는다.
+#   캐시 키에 쓰는 사용자 대학은 60초 TTL 캐시에 없을 때만 스레드풀에서 DB 로 조회한다.
+# - 무효화: 쓰기 엔드포인트가 bump_data_version(scope) 로 버전을 올리면 키가 바뀌어 이전 응답은 TTL 후 사라진다.
+#           vary="university" 이면 네임스페이스 버전(setting/cache_namespace.py)도 키에 들어가
+#           invalidate_cache 나 /admin/cache/invalidate 로 대학 단위 무효화가 된다.
+#           scopes 가 있으면 같은 값으로 ETag 도 붙여 If-None-Match 에 304 를 반환한다.
+# Redis 를 사용할 수 없거나 asyncio 클라이언트가 없으면 캐시 없이 엔드포인트를 그대로 실행한다.
+
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import time
+from typing import Callable, NamedTuple, Optional
+from urllib.parse import urlencode
+
+import orjson
+from cachetools import TTLCache
+from dotenv import load_dotenv
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from starlette.concurrency import run_in_threadpool
+
+import setting.redis_async as redis_async
+from setting.compression import (
+    COMPRESSION_MIN_SIZE, cached_json_response_async, compress, encoded_json_response, request_encoding,
+)
+from setting.etag import get_data_versions_async, etag_matches, not_modified_response, set_etag_headers
+from setting.redis_client import compressed_cache_key
+from setting.cache_namespace import CACHE_SCHEMA_VERSION, cache_scope
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+FILL_LOCK_TIMEOUT_MS = 5000     # 다른 워커가 계산 중일 때 락 유지 시간
+FILL_WAIT_TIMEOUT = 2.0         # 다른 워커의 계산 결과를 기다리는 최대 시간(초), 넘으면 직접 계산
+FILL_POLL_INTERVAL = 0.05
+
+VARY_UNIVERSITY = "university"
+VARY_USER = "user"
+
+# uuid -> 대학 (대학 변경은 이 워커에서는 forget_user_university 로 즉시, 다른 워커는 TTL 후 반영)
+_universities = TTLCache(maxsize=10000, ttl=60)
+
+# 워커 내 single-flight: 캐시 키 -> 계산 중인 Future
+_inflight = {}
+
+
+def _load_user_university(user_uuid: str) -> Optional[str]:
+    from models import SessionLocal, User
+    db = SessionLocal()
+    try:
+        row = db.query(User.university).filter(User.uuid == user_uuid).first()
+    finally:
+        db.close()
+    return row.university if row else None
+
+
+async def user_university(user_uuid: str) -> Optional[str]:
+    """사용자의 대학. 캐시에 없으면 DB 에서 조회합니다. (스레드풀에서 실행해 이벤트 루프를 막지 않음)"""
+    university = _universities.get(user_uuid)
+    if university is None:
+        university = await run_in_threadpool(_load_user_university, user_uuid)
+        if university is not None:
+            _universities[user_uuid] = university
+    return university
+
+
+def forget_user_university(user_uuid: str):
+    _universities.pop(user_uuid, None)
+
+
+async def _vary_value(request: Request, vary: str) -> Optional[str]:
+    user_uuid = getattr(request.state, "user_uuid", None)
+    if not user_uuid:
+        return None
+    if vary == VARY_USER:
+        return user_uuid
+    return await user_university(user_uuid)
+
+
+def _response_body(result) -> Optional[bytes]:
+    """캐싱할 JSON 본문. 200 JSON 응답이 아니면 None (캐싱하지 않음)"""
+    if isinstance(result, Response):
+        if result.status_code == 200 and (result.media_type or "").startswith("application/json"):
+            return result.body
+        return None
+    return orjson.dumps(result, default=jsonable_encoder)
+
+
+class CachedBody(NamedTuple):
+    """캐싱한 응답 본문과 (있으면) 요청 인코딩으로 미리 압축한 변형"""
+    body: bytes
+    encoding: Optional[str] = None
+    compressed: Optional[bytes] = None
+
+
+class ResponseSnapshot(NamedTuple):
+    """
+    캐싱하지 않는 응답(200 JSON 이 아님)의 내용. 같은 키를 기다린 요청마다 새 Response 를 만들어
+    헤더 변경/백그라운드 작업이 요청끼리 공유되지 않도록 함
+    """
+    body: bytes
+    status_code: int
+    raw_headers: list
+
+    def to_response(self) -> Response:
+        response = Response(content=self.body, status_code=self.status_code)
+        response.raw_headers = list(self.raw_headers)
+        return response
+
+
+def _shared_result(result):
+    """기다리는 요청에 넘길 결과. 본문이 없는 응답(스트리밍 등)은 None (기다린 요청이 직접 실행)"""
+    if isinstance(result, CachedBody):
+        return result
+    if isinstance(result, Response) and hasattr(result, "body"):
+        return ResponseSnapshot(result.body, result.status_code, result.raw_headers)
+    return None
+
+
+async def _wait_for_fill(client, cache_key: str) -> Optional[bytes]:
+    deadline = time.monotonic() + FILL_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        await asyncio.sleep(FILL_POLL_INTERVAL)
+        body = await redis_async.cache_peek_async(client, cache_key)
+        if body is not None:
+            return body
+    return None
+
+
+async def _fill(client, cache_key: str, ttl: int, encoding: Optional[str], compute):
+    """엔드포인트를 실행해 결과를 캐싱합니다. 다른 워커가 계산 중이면 그 결과를 잠시 기다립니다."""
+    lock_key = f"{cache_key}:lock"
+    acquired = await redis_async.cache_acquire_lock_async(client, lock_key, FILL_LOCK_TIMEOUT_MS)
+    if acquired is False:
+        body = await _wait_for_fill(client, cache_key)
+        if body is not None:
+            return CachedBody(body)
+    try:
+        result = await compute()
+        body = _response_body(result)
+        if body is None:
+            return result
+        # 원본과 압축 변형을 한 번에 저장 (다음 히트에서 다시 압축하지 않도록)
+        items = [(cache_key, ttl, body)]
+        compressed = None
+        if encoding is not None and len(body) >= COMPRESSION_MIN_SIZE:
+            compressed = compress(body, encoding, precompress=True)
+            items.append((compressed_cache_key(cache_key, encoding), ttl, compressed))
+        await redis_async.cache_setex_many_async(client, items)
+        return CachedBody(body, encoding, compressed)
+    finally:
+        if acquired:
+            await redis_async.cache_release_lock_async(client, lock_key)
+
+
+async def _single_flight(cache_key: str, fill):
+    future = _inflight.get(cache_key)
+    if future is not None:
+        try:
+            shared = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            shared = None   # 먼저 계산하던 요청이 취소됨: 직접 계산
+        if isinstance(shared, ResponseSnapshot):
+            return shared.to_response()
+        if shared is not None:
+            return shared
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[cache_key] = future
+    try:
+        result = await fill()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        future.exception()  # 기다리는 요청이 없어도 경고가 나지 않도록 조회 처리
+        raise
+    else:
+        future.set_result(_shared_result(result))
+        return result
+    finally:
+        _inflight.pop(cache_key, None)
+
+
+def response_cache(
+    namespace: str,
+    ttl: int,
+    vary: str = VARY_UNIVERSITY,
+    scopes: Optional[Callable[[str], list]] = None,
+):
+    """
+    GET 엔드포인트 응답 캐시 데코레이터. 엔드포인트는 request: Request 파라미터를 가져야 합니다.
+    namespace: 캐시 키 접두사 (cache-stats 의 네임스페이스)
+    ttl: 캐시 유효 시간(초)
+    vary: "university" 또는 "user"
+    scopes: vary 값을 받아 응답이 의존하는 데이터 버전 scope 목록을 반환 (무효화/ETag 용)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = kwargs.get("request")
+            if not RESPONSE_CACHE_ENABLED or request is None or request.method != "GET":
+                return await func(*args, **kwargs)
+
+            client = redis_async.get_async_redis(request)
+            vary_value = await _vary_value(request, vary)
+            if client is None or vary_value is None:
+                return await func(*args, **kwargs)      # 사용자 없음 등은 엔드포인트가 처리
+
+            scope_names = scopes(vary_value) if scopes else []
+            if vary == VARY_UNIVERSITY:
+                scope_names = [*scope_names, cache_scope(namespace, vary_value)]
+            versions = await get_data_versions_async(client, *scope_names) if scope_names else []
+            if versions is None:
+                return await func(*args, **kwargs)      # Redis 를 사용할 수 없음
+
+            query = urlencode(sorted(request.query_params.multi_items()))
+            digest = hashlib.blake2b(
+                "|".join([vary, vary_value, *scope_names, *versions, request.scope["path"], query]).encode(),
+                digest_size=12,
+            ).hexdigest()
+            cache_key = f"{namespace}:{CACHE_SCHEMA_VERSION}:{digest}"
+            etag = f'W/"{digest}"' if scopes else None
+
+            if etag_matches(request, etag):
+                return not_modified_response(etag)
+
+            response = await cached_json_response_async(request, cache_key, client)
+            if response is None:
+                encoding = request_encoding(request)
+                result = await _single_flight(
+                    cache_key, lambda: _fill(client, cache_key, ttl, encoding, lambda: func(*args, **kwargs)))
+                if not isinstance(result, CachedBody):
+                    return result
+                if result.compressed is not None and result.encoding == encoding:
+                    response = encoded_json_response(result.compressed, encoding)
+                else:
+                    response = Response(content=result.body, media_type="application/json")
+            set_etag_headers(response, etag)
+            return response
+
+        return wrapper
+    return decorator
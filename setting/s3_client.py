@@ -0,0 +1,48 @@
+import os
+import time
+import uuid
+import boto3
+from dotenv import load_dotenv
+from setting.metrics import S3_UPLOAD_DURATION
+from setting.tracing import start_span, SPAN_KIND_CLIENT
+
+load_dotenv()
+
+AWS_REGION = os.getenv('AWS_REGION')
+
+# S3 클라이언트 설정 (모든 업로드 엔드포인트가 공유)
+s3_client = boto3.client(
+    's3',
+    aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+    aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+    region_name=AWS_REGION
+)
+
+
+def upload_image(upload_file, bucket: str) -> str:
+    """UploadFile 을 S3 버킷에 업로드하고 공개 URL 을 반환합니다."""
+    file_extension = upload_file.filename.split('.')[-1]
+    s3_filename = f"{uuid.uuid4()}.{file_extension}"
+    upload_file.file.seek(0)  # 파일 포인터를 시작 위치로 재설정
+
+    span = start_span("s3 PutObject", SPAN_KIND_CLIENT, {"aws.s3.bucket": bucket, "aws.s3.key": s3_filename})
+    start = time.perf_counter()
+    try:
+        s3_client.upload_fileobj(
+            upload_file.file,
+            bucket,
+            s3_filename,
+            ExtraArgs={
+                'ContentType': f'image/{file_extension}',  # 적절한 MIME 타입 설정
+            }
+        )
+    except Exception as e:
+        if span is not None:
+            span.end(e)
+        raise
+    finally:
+        S3_UPLOAD_DURATION.observe(time.perf_counter() - start, bucket)
+    if span is not None:
+        span.end()
+
+    return f"https://{bucket}.s3.{AWS_REGION}.amazonaws.com/{s3_filename}"
@@ -0,0 +1,42 @@
+# 응답 필드 선택 (sparse fieldsets)
+#
+#   GET /api/v1/get_object_list?fields=id,latitude,longitude,object_name
+#
+# fields 를 지정하면 요청한 필드만 응답한다. (id 등 식별 필드는 항상 포함)
+# DB 에서 직접 읽는 엔드포인트는 요청한 컬럼만 SELECT 하고, 캐시된 피드는 캐시 값에서 필드만 골라낸다.
+# 필드를 고른 응답은 응답 모델 검증 없이 ORJSONResponse 로 바로 직렬화한다.
+
+from typing import Optional, Sequence
+
+from fastapi import HTTPException, Query
+
+
+def sparse_fields(allowed: Sequence[str], always: Sequence[str] = ("id",)):
+    """
+    fields 쿼리 파라미터 의존성을 만듭니다.
+    반환값: 지정하지 않으면 None, 지정하면 allowed 순서대로 정렬된 필드 목록 (always 포함)
+    알 수 없는 필드가 있으면 400
+    """
+    def dependency(
+        fields: Optional[str] = Query(
+            None,
+            description=f"쉼표로 구분한 응답 필드. 사용 가능: {', '.join(allowed)}",
+        )
+    ) -> Optional[list]:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested.difference(allowed)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"알 수 없는 필드입니다: {', '.join(sorted(unknown))}")
+        return [name for name in allowed if name in requested or name in always]
+    return dependency
+
+
+def project(item: dict, fields: Sequence[str]) -> dict:
+    return {name: item[name] for name in fields}
+
+
+def row_to_dict(row, fields: Sequence[str]) -> dict:
+    """SQLAlchemy Row/ORM 객체에서 fields 만 dict 로"""
+    return {name: getattr(row, name) for name in fields}
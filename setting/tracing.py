@@ -0,0 +1,238 @@
+# 요청 트레이싱
+#
+# 요청마다 루트 span 을 만들고 SQLAlchemy 쿼리, Redis 명령, S3 업로드, 외부 HTTP 호출을
+# 자식 span 으로 기록한다. 요청 시작 시점에 샘플링 여부를 결정(head-based)하며,
+# 샘플링되지 않은 요청은 span 객체를 만들지 않는다.
+# traceparent 헤더의 trace id 는 이어 쓰지만, 헤더의 sampled 플래그는 클라이언트가 임의로 보낼 수 있으므로
+# TRACE_TRUST_PARENT=true (헤더를 다시 쓰는 게이트웨이 뒤에 있을 때)일 때만 따르고, 기본값은 TRACE_SAMPLE_RATE 로 결정한다.
+# 완료된 span 은 큐에 넣기만 하고, 백그라운드 스레드가 OTLP JSON 형식으로 파일에 기록한다.
+# (collector 없이 로컬 파일로 확인하고, 필요하면 그대로 OTLP 수집기에 넣을 수 있음)
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar
+
+from dotenv import load_dotenv
+from sqlalchemy import event
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", 0))   # 0 이면 트레이싱 비활성화
+TRACE_TRUST_PARENT = os.getenv("TRACE_TRUST_PARENT", "false").lower() == "true"   # traceparent 의 샘플링 결정을 따름
+TRACE_EXPORT_FILE = os.getenv("TRACE_EXPORT_FILE", "traces.jsonl")
+TRACE_SERVICE_NAME = os.getenv("TRACE_SERVICE_NAME", "mapda-server")
+TRACE_QUEUE_SIZE = int(os.getenv("TRACE_QUEUE_SIZE", 10000))
+TRACE_EXPORT_BATCH_SIZE = 512
+TRACE_EXPORT_INTERVAL = 1.0     # 배치를 파일에 쓰는 최대 간격(초)
+MAX_STATEMENT_LENGTH = 1000
+
+# OTLP span kind / status code
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+# 현재 요청의 루트 span (샘플링되지 않았으면 None)
+current_span_var: ContextVar = ContextVar("current_span", default=None)
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class Span:
+    __slots__ = ("name", "kind", "trace_id", "span_id", "parent_span_id",
+                 "start_ns", "end_ns", "attributes", "status_code", "status_message")
+
+    def __init__(self, name: str, trace_id: str, parent_span_id: str = None,
+                 kind: int = SPAN_KIND_INTERNAL, attributes: dict = None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes or {}
+        self.status_code = STATUS_OK
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def end(self, error: BaseException = None):
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.status_code = STATUS_ERROR
+            self.status_message = f"{type(error).__name__}: {error}"
+        _exporter.export(self)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+def start_root_span(name: str, traceparent: str = None, attributes: dict = None):
+    """
+    요청의 루트 span 을 시작합니다. 샘플링되지 않으면 None 을 반환합니다.
+    유효한 traceparent 헤더가 있으면 호출 측의 trace id 를 이어 쓰고,
+    TRACE_TRUST_PARENT 이면 호출 측의 샘플링 결정도 따릅니다.
+    """
+    if TRACE_SAMPLE_RATE <= 0:
+        return None
+
+    parent = _TRACEPARENT_RE.match(traceparent.strip().lower()) if traceparent else None
+    if parent and TRACE_TRUST_PARENT:
+        sampled = bool(int(parent.group(3), 16) & 0x01)
+    else:
+        sampled = random.random() < TRACE_SAMPLE_RATE
+    if not sampled:
+        return None
+
+    if parent:
+        trace_id, parent_span_id = parent.group(1), parent.group(2)
+    else:
+        trace_id, parent_span_id = f"{random.getrandbits(128):032x}", None
+
+    return Span(name, trace_id, parent_span_id, SPAN_KIND_SERVER, attributes)
+
+
+def start_span(name: str, kind: int = SPAN_KIND_INTERNAL, attributes: dict = None):
+    """현재 요청의 자식 span 을 시작합니다. 요청이 샘플링되지 않았으면 None 을 반환합니다."""
+    parent = current_span_var.get()
+    if parent is None:
+        return None
+    return Span(name, parent.trace_id, parent.span_id, kind, attributes)
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_span(span: Span) -> dict:
+    data = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+        "status": {"code": span.status_code},
+    }
+    if span.parent_span_id:
+        data["parentSpanId"] = span.parent_span_id
+    if span.status_message:
+        data["status"]["message"] = span.status_message
+    return data
+
+
+class _FileExporter:
+    """완료된 span 을 모아 OTLP JSON(ExportTraceServiceRequest) 한 줄씩 파일에 기록합니다."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=TRACE_QUEUE_SIZE)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span):
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=TRACE_EXPORT_INTERVAL))
+                while len(batch) < TRACE_EXPORT_BATCH_SIZE:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            if batch:
+                self._write(batch)
+
+    def flush(self):
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch):
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": TRACE_SERVICE_NAME}},
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "mapda.tracing"},
+                    "spans": [_otlp_span(span) for span in batch],
+                }],
+            }]
+        }
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        except OSError as e:
+            logger.warning("Failed to write %d spans to %s: %s", len(batch), self.path, e)
+
+
+_exporter = _FileExporter(TRACE_EXPORT_FILE)
+
+
+def instrument_db_tracing(engine):
+    """SQLAlchemy 엔진에 쿼리별 span 을 기록하는 이벤트를 등록합니다."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        span = start_span(statement.split(None, 1)[0].upper() if statement else "SQL", SPAN_KIND_CLIENT, {
+            "db.system": "mysql",
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+        })
+        conn.info.setdefault("trace_spans", []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        span = conn.info["trace_spans"].pop()
+        if span is not None:
+            span.end()
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("trace_spans"):
+            span = conn.info["trace_spans"].pop()
+            if span is not None:
+                span.end(exception_context.original_exception)